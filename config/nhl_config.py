@@ -31,6 +31,7 @@ def __init__(self, config_dict: Dict[str, Any] = None):
         self.produce_csv = config_dict.get('produce_csv', True)
         self.current_date = datetime.now().date()
         self.max_workers = config_dict.get('max_workers', 5)  # Optimized concurrency for better throughput
+        self.curate_workers = config_dict.get('curate_workers', 1)  # HTML curation processes; 1 runs in-process
         
         # NHL API endpoints
         self.base_url = "https://api-web.nhle.com"
@@ -359,6 +360,7 @@ def create_default_config() -> Dict[str, Any]:
         'season_count': 10,
         'default_season': '20242025',
         'max_workers': 5,  # API-friendly concurrency
+        'curate_workers': 1,  # HTML curation runs in-process unless raised
         'full_update': False,
         'update_game_statuses': True,
         'storage_root': os.path.join(os.getcwd(), "storage"),
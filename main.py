@@ -667,122 +667,7 @@ def _process_single_game_html(self, game_id: str, season: str, html_dir: Path, p
         Returns:
             Dictionary with processing results for this game
         """
-        game_result = {
-            'game_id': game_id,
-            'reports_processed': 0,
-            'penalties_parsed': 0,
-            'complex_scenarios': 0,
-            'errors': []
-        }
-        
-        try:
-            # IMPORTANT: Create a fresh parser per task to avoid cross-thread shared state
-            from src.parse.html_report_parser import HTMLReportParser
-            local_parser = HTMLReportParser(self.config)
-            # Parse the GS report (Game Summary) with advanced penalty analysis
-            gs_file = html_dir / 'GS' / f'GS{game_id}.HTM'
-            if gs_file.exists():
-                gs_data = local_parser.parse_report_data(gs_file, 'GS')
-                
-                # Add advanced penalty analysis
-                penalty_analysis = local_parser.parse_game_penalties(season, game_id, html_dir)
-                if penalty_analysis:
-                    gs_data['penalty_analysis'] = penalty_analysis
-                    game_result['penalties_parsed'] += len(penalty_analysis.get('consolidated_penalties', []))
-                    game_result['complex_scenarios'] += len(penalty_analysis.get('complex_scenarios', []))
-                
-                # Save curated GS JSON under json/curate/gs
-                gs_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'gs'
-                gs_out_dir.mkdir(parents=True, exist_ok=True)
-                gs_out_file = gs_out_dir / f'gs_{game_id}.json'
-                with open(gs_out_file, 'w') as f:
-                    json.dump(gs_data, f, indent=2)
-                game_result['reports_processed'] += 1
-
-            # Parse the ES report (Event Summary)
-            es_file = html_dir / 'ES' / f'ES{game_id}.HTM'
-            if es_file.exists():
-                es_data = local_parser.parse_report_data(es_file, 'ES')
-                
-                # Save curated ES JSON under json/curate/es
-                es_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'es'
-                es_out_dir.mkdir(parents=True, exist_ok=True)
-                es_out_file = es_out_dir / f'es_{game_id}.json'
-                with open(es_out_file, 'w') as f:
-                    json.dump(es_data, f, indent=2)
-                game_result['reports_processed'] += 1
-
-            # Parse the PL report (Play-by-Play)
-            pl_file = html_dir / 'PL' / f'PL{game_id}.HTM'
-            if pl_file.exists():
-                pl_data = local_parser.parse_report_data(pl_file, 'PL')
-                
-                # Save curated PL JSON under json/curate/pl
-                pl_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'pl'
-                pl_out_dir.mkdir(parents=True, exist_ok=True)
-                pl_out_file = pl_out_dir / f'pl_{game_id}.json'
-                with open(pl_out_file, 'w') as f:
-                    json.dump(pl_data, f, indent=2)
-                game_result['reports_processed'] += 1
-
-            # Parse the RO report (Roster)
-            ro_file = html_dir / 'RO' / f'RO{game_id}.HTM'
-            if ro_file.exists():
-                ro_data = local_parser.parse_report_data(ro_file, 'RO')
-                
-                # Save curated RO JSON under json/curate/ro
-                ro_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'ro'
-                ro_out_dir.mkdir(parents=True, exist_ok=True)
-                ro_out_file = ro_out_dir / f'ro_{game_id}.json'
-                with open(ro_out_file, 'w') as f:
-                    json.dump(ro_data, f, indent=2)
-                game_result['reports_processed'] += 1
-
-            # Parse the FS report (Faceoff Summary)
-            fs_file = html_dir / 'FS' / f'FS{game_id}.HTM'
-            if fs_file.exists():
-                fs_data = local_parser.parse_report_data(fs_file, 'FS')
-                
-                # Save curated FS JSON under json/curate/fs
-                fs_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'fs'
-                fs_out_dir.mkdir(parents=True, exist_ok=True)
-                fs_out_file = fs_out_dir / f'fs_{game_id}.json'
-                with open(fs_out_file, 'w') as f:
-                    json.dump(fs_data, f, indent=2)
-                game_result['reports_processed'] += 1
-
-            # Parse the TH report (Time on Ice - Home)
-            th_file = html_dir / 'TH' / f'TH{game_id}.HTM'
-            if th_file.exists():
-                th_data = local_parser.parse_report_data(th_file, 'TH')
-                
-                # Save curated TH JSON under json/curate/th
-                th_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'th'
-                th_out_dir.mkdir(parents=True, exist_ok=True)
-                th_out_file = th_out_dir / f'th_{game_id}.json'
-                with open(th_out_file, 'w') as f:
-                    json.dump(th_data, f, indent=2)
-                game_result['reports_processed'] += 1
-
-            # Parse the TV report (Time on Ice - Away)
-            tv_file = html_dir / 'TV' / f'TV{game_id}.HTM'
-            if tv_file.exists():
-                tv_data = local_parser.parse_report_data(tv_file, 'TV')
-                
-                # Save curated TV JSON under json/curate/tv
-                tv_out_dir = Path(self.config.storage_root) / season / 'json' / 'curate' / 'tv'
-                tv_out_dir.mkdir(parents=True, exist_ok=True)
-                tv_out_file = tv_out_dir / f'tv_{game_id}.json'
-                with open(tv_out_file, 'w') as f:
-                    json.dump(tv_data, f, indent=2)
-                game_result['reports_processed'] += 1
-                
-        except Exception as e:
-            error_msg = f"Error parsing reports for game {game_id}: {e}"
-            game_result['errors'].append(error_msg)
-            
-        return game_result
-
+        return curate_game_reports(parser, game_id, season, html_dir, self.config.storage_root)
 
     def step_03_curate(self, seasons: List[str], full_update: bool = False) -> Dict[str, Any]:
         """
@@ -859,13 +744,12 @@ def step_03_curate(self, seasons: List[str], full_update: bool = False) -> Dict[
                 games_processed_count = 0
                 last_progress_report = 0
                 
-                self.logger.info(f"🎯 Starting sequential curation for {total_games} games")
+                self.logger.info(f"🎯 Starting curation for {total_games} games "
+                                 f"with {self.config.curate_workers} worker process(es)")
                 
-                # Process games sequentially (much faster than multiprocessing for this workload)
-                for game_id in game_ids:
+                # Process games sequentially by default; --curate-workers opts into a process pool
+                for game_id, game_result in self._curate_games(sorted(game_ids), season, html_dir, parser):
                     try:
-                        game_result = self._process_single_game_html(game_id, season, html_dir, parser)
-                        
                         # Update season results
                         if game_result['reports_processed'] > 0:
                             season_results['games_processed'] += 1
@@ -907,6 +791,40 @@ def step_03_curate(self, seasons: List[str], full_update: bool = False) -> Dict[
             
         return results
     
+    def _curate_games(self, game_ids: List[str], season: str, html_dir: Path, parser):
+        """
+        Curate games with parser, yielding results as games finish.
+        
+        Games run in-process unless config.curate_workers asks for a process pool
+        (see HTMLReportParser.iter_games).
+        
+        Args:
+            game_ids: Game identifiers (6-digit format)
+            season: Season identifier
+            html_dir: Path to HTML reports directory
+            parser: HTMLReportParser to curate with (its reference data seeds any workers)
+            
+        Yields:
+            (game_id, game_result) tuples in completion order
+        """
+        for game_id, game_result, error in parser.iter_games(curate_game_reports, game_ids,
+                                                             (season, html_dir, self.config.storage_root),
+                                                             self.config.curate_workers):
+            if error is not None:
+                game_result = self._failed_game_result(game_id, error)
+            yield game_id, game_result
+    
+    @staticmethod
+    def _failed_game_result(game_id: str, error: Exception) -> Dict[str, Any]:
+        """Build the game result for a game whose curation raised."""
+        return {
+            'game_id': game_id,
+            'reports_processed': 0,
+            'penalties_parsed': 0,
+            'complex_scenarios': 0,
+            'errors': [f"Error processing game {game_id}: {error}"]
+        }
+    
     def detect_complex_penalty_scenarios(self, penalties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Detect complex penalty scenarios from penalty data.
@@ -1337,6 +1255,135 @@ def cleanup_old_data(self, keep_seasons: int = 10) -> None:
                 self.logger.error(f"Error removing data for season {season}: {e}")
 
 
+def curate_game_reports(parser, game_id: str, season: str, html_dir: Path,
+                        storage_root: str) -> Dict[str, Any]:
+    """
+    Parse a game's HTML reports and save each as curated JSON.
+    
+    Args:
+        parser: HTMLReportParser to parse the reports with
+        game_id: Game identifier (6-digit format)
+        season: Season identifier
+        html_dir: Path to HTML reports directory
+        storage_root: Storage root the curated JSON is written under
+        
+    Returns:
+        Dictionary with processing results for this game
+    """
+    game_result = {
+        'game_id': game_id,
+        'reports_processed': 0,
+        'penalties_parsed': 0,
+        'complex_scenarios': 0,
+        'errors': []
+    }
+    
+    try:
+        # Parse the GS report (Game Summary) with advanced penalty analysis
+        gs_file = html_dir / 'GS' / f'GS{game_id}.HTM'
+        if gs_file.exists():
+            gs_data = parser.parse_report_data(gs_file, 'GS')
+            
+            # Add advanced penalty analysis
+            penalty_analysis = parser.parse_game_penalties(season, game_id, html_dir)
+            if penalty_analysis:
+                gs_data['penalty_analysis'] = penalty_analysis
+                game_result['penalties_parsed'] += len(penalty_analysis.get('consolidated_penalties', []))
+                game_result['complex_scenarios'] += len(penalty_analysis.get('complex_scenarios', []))
+            
+            # Save curated GS JSON under json/curate/gs
+            gs_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'gs'
+            gs_out_dir.mkdir(parents=True, exist_ok=True)
+            gs_out_file = gs_out_dir / f'gs_{game_id}.json'
+            with open(gs_out_file, 'w') as f:
+                json.dump(gs_data, f, indent=2)
+            game_result['reports_processed'] += 1
+
+        # Parse the ES report (Event Summary)
+        es_file = html_dir / 'ES' / f'ES{game_id}.HTM'
+        if es_file.exists():
+            es_data = parser.parse_report_data(es_file, 'ES')
+            
+            # Save curated ES JSON under json/curate/es
+            es_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'es'
+            es_out_dir.mkdir(parents=True, exist_ok=True)
+            es_out_file = es_out_dir / f'es_{game_id}.json'
+            with open(es_out_file, 'w') as f:
+                json.dump(es_data, f, indent=2)
+            game_result['reports_processed'] += 1
+
+        # Parse the PL report (Play-by-Play)
+        pl_file = html_dir / 'PL' / f'PL{game_id}.HTM'
+        if pl_file.exists():
+            pl_data = parser.parse_report_data(pl_file, 'PL')
+            
+            # Save curated PL JSON under json/curate/pl
+            pl_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'pl'
+            pl_out_dir.mkdir(parents=True, exist_ok=True)
+            pl_out_file = pl_out_dir / f'pl_{game_id}.json'
+            with open(pl_out_file, 'w') as f:
+                json.dump(pl_data, f, indent=2)
+            game_result['reports_processed'] += 1
+
+        # Parse the RO report (Roster)
+        ro_file = html_dir / 'RO' / f'RO{game_id}.HTM'
+        if ro_file.exists():
+            ro_data = parser.parse_report_data(ro_file, 'RO')
+            
+            # Save curated RO JSON under json/curate/ro
+            ro_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'ro'
+            ro_out_dir.mkdir(parents=True, exist_ok=True)
+            ro_out_file = ro_out_dir / f'ro_{game_id}.json'
+            with open(ro_out_file, 'w') as f:
+                json.dump(ro_data, f, indent=2)
+            game_result['reports_processed'] += 1
+
+        # Parse the FS report (Faceoff Summary)
+        fs_file = html_dir / 'FS' / f'FS{game_id}.HTM'
+        if fs_file.exists():
+            fs_data = parser.parse_report_data(fs_file, 'FS')
+            
+            # Save curated FS JSON under json/curate/fs
+            fs_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'fs'
+            fs_out_dir.mkdir(parents=True, exist_ok=True)
+            fs_out_file = fs_out_dir / f'fs_{game_id}.json'
+            with open(fs_out_file, 'w') as f:
+                json.dump(fs_data, f, indent=2)
+            game_result['reports_processed'] += 1
+
+        # Parse the TH report (Time on Ice - Home)
+        th_file = html_dir / 'TH' / f'TH{game_id}.HTM'
+        if th_file.exists():
+            th_data = parser.parse_report_data(th_file, 'TH')
+            
+            # Save curated TH JSON under json/curate/th
+            th_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'th'
+            th_out_dir.mkdir(parents=True, exist_ok=True)
+            th_out_file = th_out_dir / f'th_{game_id}.json'
+            with open(th_out_file, 'w') as f:
+                json.dump(th_data, f, indent=2)
+            game_result['reports_processed'] += 1
+
+        # Parse the TV report (Time on Ice - Away)
+        tv_file = html_dir / 'TV' / f'TV{game_id}.HTM'
+        if tv_file.exists():
+            tv_data = parser.parse_report_data(tv_file, 'TV')
+            
+            # Save curated TV JSON under json/curate/tv
+            tv_out_dir = Path(storage_root) / season / 'json' / 'curate' / 'tv'
+            tv_out_dir.mkdir(parents=True, exist_ok=True)
+            tv_out_file = tv_out_dir / f'tv_{game_id}.json'
+            with open(tv_out_file, 'w') as f:
+                json.dump(tv_data, f, indent=2)
+            game_result['reports_processed'] += 1
+            
+    except Exception as e:
+        error_msg = f"Error parsing reports for game {game_id}: {e}"
+        game_result['errors'].append(error_msg)
+        
+    return game_result
+
+
 def main():
     """Main entry point for the NHL Data Retrieval System."""
     parser = argparse.ArgumentParser(
@@ -1411,6 +1458,13 @@ def main():
         help='Maximum number of parallel workers (default: 28)'
     )
     
+    parser.add_argument(
+        '--curate-workers',
+        type=int,
+        default=1,
+        help='Worker processes for HTML report curation (default: 1, in-process)'
+    )
+    
     args = parser.parse_args()
     
     # Build configuration
@@ -1420,6 +1474,7 @@ def main():
         'season_count': args.season_count,
         'default_season': args.default_season,
         'max_workers': args.max_workers,
+        'curate_workers': args.curate_workers,
         'update_game_statuses': True,
         
         # Current working collectors
@@ -9,13 +9,24 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import re
 
+try:
+    import lxml  # noqa: F401  (only needed as BeautifulSoup's tree builder)
+    _SOUP_PARSER = 'lxml'
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    _SOUP_PARSER = 'html.parser'
+
+# The extractors only read tables (plus the <h3> team headings preceding them),
+# so the rest of each report is never built into the soup
+_TABLE_STRAINER = SoupStrainer('table')
+_TEAM_TABLE_STRAINER = SoupStrainer(['h3', 'table'])
+
 
 class HTMLReportCollector:
     """
@@ -136,7 +147,7 @@ def extract_game_summary_data(self, html_content: str) -> Dict[str, Any]:
             Dictionary containing extracted game summary data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TEAM_TABLE_STRAINER)
             data = {}
             
             # Find game info table
@@ -186,7 +197,7 @@ def extract_event_summary_data(self, html_content: str) -> List[Dict[str, Any]]:
             List of dictionaries containing event data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TABLE_STRAINER)
             events = []
             
             # Find event table
@@ -223,7 +234,7 @@ def extract_faceoff_data(self, html_content: str) -> Dict[str, List[Dict[str, An
             Dictionary containing faceoff data by team
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TEAM_TABLE_STRAINER)
             faceoff_data = {}
             
             # Find faceoff tables for each team
@@ -264,7 +275,7 @@ def extract_time_on_ice_data(self, html_content: str) -> Dict[str, List[Dict[str
             Dictionary containing TOI data by team
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TEAM_TABLE_STRAINER)
             toi_data = {}
             
             # Find TOI tables for each team
@@ -307,7 +318,7 @@ def extract_shot_data(self, html_content: str) -> Dict[str, Any]:
             Dictionary containing shot data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TEAM_TABLE_STRAINER)
             shot_data = {}
             
             # Find shot summary tables
@@ -348,7 +359,7 @@ def extract_roster_data(self, html_content: str) -> Dict[str, List[Dict[str, Any
             Dictionary containing roster data by team
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TEAM_TABLE_STRAINER)
             roster_data = {}
             
             # Find roster tables for each team
@@ -391,7 +402,7 @@ def extract_play_by_play_data(self, html_content: str) -> List[Dict[str, Any]]:
             List of dictionaries containing play-by-play data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _SOUP_PARSER, parse_only=_TABLE_STRAINER)
             plays = []
             
             # Find play-by-play table
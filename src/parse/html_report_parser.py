@@ -18,17 +18,242 @@
 
 import re
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from bs4 import BeautifulSoup
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 from pathlib import Path
+import io
 import json
+import mmap
+import os
+import pickle
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain, groupby
+from operator import itemgetter
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # lxml is optional; BeautifulSoup paths remain the fallback
+    etree = lxml_html = None
+
+# BeautifulSoup tree builder: libxml2-backed lxml when installed, else the stdlib parser
+_SOUP_PARSER = 'lxml' if lxml_html is not None else 'html.parser'
+
+# PL event rows are the <tr id="PL-n"> elements
+_PL_ROW_ID_RE = re.compile(r'^PL-\d+')
+
+# Reports whose parsers only query part of the document build just that part of the soup
+_REPORT_STRAINERS = {
+    'ES': SoupStrainer('table'),
+    'PL': SoupStrainer('tr', id=_PL_ROW_ID_RE),
+    'SS': SoupStrainer('table'),
+    # FS keeps <title>/<script> for the game-ID fallback in _extract_game_id_from_html
+    'FS': SoupStrainer(['table', 'title', 'script']),
+}
+
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:  # optional; non-UTF-8 reports then decode as UTF-8 dropping bad bytes
+    detect_charset = None
 
 # Import reference data loader
 sys.path.append(str(Path(__file__).parent.parent))
 from src.validate.reference_data import ReferenceDataLoader
 
+# NHL team nicknames as printed in HTML report headers
+TEAM_NAMES = frozenset({
+    'DEVILS', 'SABRES', 'RANGERS', 'ISLANDERS', 'FLYERS', 'PENGUINS', 'CAPITALS', 'HURRICANES',
+    'PANTHERS', 'LIGHTNING', 'BRUINS', 'MAPLE LEAFS', 'SENATORS', 'CANADIENS', 'RED WINGS',
+    'BLACKHAWKS', 'BLUE JACKETS', 'STARS', 'WILD', 'PREDATORS', 'BLUES', 'JETS', 'AVALANCHE',
+    'COYOTES', 'DUCKS', 'KINGS', 'SHARKS', 'GOLDEN KNIGHTS', 'FLAMES', 'OILERS', 'CANUCKS', 'KRAKEN'
+})
+
+# Single case-insensitive alternation over all team names (longest first)
+_TEAM_RE = re.compile('|'.join(map(re.escape, sorted(TEAM_NAMES, key=len, reverse=True))), re.IGNORECASE)
+
+
+# GameInfo row classifier. Each alternative is anchored at the start and tried in
+# priority order; the empty named group that matches names the game_info key.
+_GAME_INFO_RE = re.compile(
+    r'(?=.*NHL)(?P<event>)'
+    r'|(?=.*(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday))(?P<date>)'
+    r'|(?=.*Attendance)(?P<attendance>)'
+    r'|(?=.*Start)(?=.*End)(?P<time_info>)'
+    r'|(?=.*Game)(?=.*\d)(?P<game_number>)'
+    r'|(?P<status>)(?:Final|Live|Scheduled)\Z',
+    re.DOTALL
+)
+
+# Landmark lookups for the lxml fast paths, compiled once rather than per document
+_XPATHS = {
+    'Visitor': '//table[@id="Visitor"]',
+    'Home': '//table[@id="Home"]',
+    'PlayerTable': '//table[@id="PlayerTable"]',
+    'GameInfo_rows': '//table[@id="GameInfo"]//tr',
+    'logo_alt': '(.//img)[1]/@alt',
+    'score_cell': '(.//td[contains(@style, "font-size: 40px")])[1]',
+    'text_cells': './/td[not(*) and text()]',
+    'power_play_rows': '//table[@border="0"]//tr[.//td[contains(., "Power Plays")]]',
+    'cells': './/td',
+    'text_nodes': '//text()',
+    'border0_tables': '//table[@border="0"]',
+    'penalty_rows': '//tr[contains(concat(" ", normalize-space(@class), " "), " penalty ")]',
+    'border_tables': '//table[contains(concat(" ", normalize-space(@class), " "), " border ")]',
+    'rows': './/tr',
+    'visitor_section_heading': '//td[contains(concat(" ", normalize-space(@class), " "), " visitorsectionheading ")]',
+    'home_section_heading': '//td[contains(concat(" ", normalize-space(@class), " "), " homesectionheading ")]',
+    'section_heading': '(//td[contains(@class, "visitorsectionheading") or contains(@class, "homesectionheading")])[1]',
+}
+_XPATH = {name: etree.XPath(expr) for name, expr in _XPATHS.items()} if etree is not None else {}
+
+# GS penalty types that never produce a power play
+_NON_PP_TYPES = frozenset({'Fighting', 'Misconduct', 'Game Misconduct'})
+
+# Game ID fallbacks used when the report filename does not carry the ID
+_TITLE_GAME_ID_RE = re.compile(r'Game\s+(\d+)')
+_SCRIPT_GAME_ID_RE = re.compile(r'gameId["\']?\s*[:=]\s*["\']?(\d+)')
+
+# Penalty parsing patterns shared by the GS/PL row extractors and text fallback
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2})')
+_SERVED_BY_RE = re.compile(r'served\s+by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE)
+_PREFIX_RE = re.compile(r'^penalty\s*[:\-]?\s*', re.IGNORECASE)
+_SUFFIX_RE = re.compile(r'\s*penalty\s*$', re.IGNORECASE)
+# Text fallback branches, tried in this order at each position of a single scan
+_PENALTY_TEXT_BRANCHES = (
+    # Bench penalty patterns
+    ('bench', r'(\d{1,2}:\d{2})\s*([A-Z]{3})\s*bench\s*penalty\s*[:\-]?\s*([^,\n]+)'),
+    # Time + Team + Player + Penalty
+    ('team_player', r'(\d{1,2}:\d{2})\s*([A-Z]{3})\s*([A-Z\s\.]+)\s*penalty\s*[:\-]?\s*([^,\n]+)'),
+    # Time + Penalty + Team
+    ('pen_team', r'(\d{1,2}:\d{2})\s*penalty\s*([^,\n]+)\s*([A-Z]{3})'),
+    # Time + Team + Penalty
+    ('team_pen', r'(\d{1,2}:\d{2})\s*([A-Z]{3})\s*penalty\s*[:\-]?\s*([^,\n]+)'),
+)
+_ALL_PENALTIES_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _PENALTY_TEXT_BRANCHES),
+    re.IGNORECASE
+)
+# Branch name -> (source pattern, indices of its capture groups in _ALL_PENALTIES_RE)
+_PENALTY_TEXT_GROUPS = {
+    name: (pattern, tuple(range(_ALL_PENALTIES_RE.groupindex[name] + 1,
+                                _ALL_PENALTIES_RE.groupindex[name] + 1 + re.compile(pattern).groups)))
+    for name, pattern in _PENALTY_TEXT_BRANCHES
+}
+# Penalty description variants mapped to their standard name
+_PENALTY_VARIATIONS = {
+    'roughing-removing-opponents-helmet': 'roughing-removing-helmet',
+    'ps-slash-on-breakaway': 'penalty-shot-slash',
+    'too-many-men-on-the-ice': 'too-many-men',
+    'delaying-game-puck-over-glass': 'delay-of-game-puck-over-glass',
+    'interference-goalkeeper': 'goalie-interference'
+}
+# Longest variants first so a variant that contains another still wins
+_VARIATIONS_RE = re.compile('|'.join(
+    re.escape(variant) for variant in sorted(_PENALTY_VARIATIONS, key=len, reverse=True)
+))
+# Penalty type keywords. Single words are tested against the description's word set
+# (so "teammate" is not "team"); multi-word phrases fall back to a lowercase regex.
+_WORD_RE = re.compile(r'[a-z]+')
+_MAJOR_WORDS = frozenset({'major'})
+_BEN_WORDS = frozenset({'bench', 'team'})
+_MIS_WORDS = frozenset({'misconduct'})
+_MAT_WORDS = frozenset({'ejection'})
+_MULTIWORD_MAJOR_RE = re.compile(r'\b5 min')
+_MULTIWORD_BEN_RE = re.compile(r'too many men')
+_MULTIWORD_MIS_RE = re.compile(r'\b10 min')
+_MULTIWORD_MAT_RE = re.compile(r'match penalty')
+# "min" also covers "minute"/"minutes", so one pattern replaces the per-unit variants
+_DURATION_RE = re.compile(r'(\d+)\s*min', re.IGNORECASE)
+# Patterns used by the extract_* helpers and the ES header parser
+_PERIOD_HEADER_RE = re.compile(r'period|1st|2nd|3rd|ot|shootout', re.IGNORECASE)
+_NAME_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)')
+_POWER_PLAY_RE = re.compile(r'power\s*play|pp', re.IGNORECASE)
+_FACEOFF_RE = re.compile(r'faceoff|face\s*off', re.IGNORECASE)
+_SHOT_RE = re.compile(r'shot|sog|shoot', re.IGNORECASE)
+_FRACTION_RE = re.compile(r'\d+/\d+')
+_ES_FILE_RE = re.compile(r'ES(\d{6})\.HTM')
+_AWAY_GAME_RE = re.compile(r'GAME \d+ AWAY GAME \d+')
+_HOME_GAME_RE = re.compile(r'GAME \d+ HOME GAME \d+')
+_FIRST_LINE_RE = re.compile(r'^([^\n]+)')
+_SCORE_STYLE_RE = re.compile(r'font-size: 40px')
+_LOGO_RE = re.compile(r'logoc')
+_LOGO_SRC_RE = re.compile(r'logoc([a-z]+)')
+_OT_PERIOD_RE = re.compile(r'^OT\d*$', re.IGNORECASE)
+# Period keywords checked in order against lowercased text; first hit wins
+_PERIOD_KEYWORDS = (
+    ('1st', 'period_1'), ('first', 'period_1'),
+    ('2nd', 'period_2'), ('second', 'period_2'),
+    ('3rd', 'period_3'), ('third', 'period_3'),
+    ('ot', 'overtime'), ('overtime', 'overtime'),
+    ('shootout', 'shootout'),
+)
+# One line of the penalty report, filled from the penalty dict
+_PENALTY_LINE_FMT = "- **{time}** - {team} - {description} ({duration} min)"
+# Game metadata scans over the report text (date formats tried as one alternation)
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}|\w+ \d{1,2},? \d{4})')
+_VENUE_RE = re.compile(r'venue|arena|stadium', re.IGNORECASE)
+_TEAM_TEXT_RE = re.compile(r'[A-Z]{3}|[A-Z][a-z]+ [A-Z][a-z]+')
+_DIGITS_RE = re.compile(r'\d+')
+# ES cell value parsing (signed ints/floats, MM:SS clock values, "won-total/pct%" faceoffs)
+_SIGNED_INT_RE = re.compile(r'-?\d+')
+_SIGNED_FLOAT_RE = re.compile(r'-?\d+\.?\d*')
+_CLOCK_RE = re.compile(r'^\d{1,2}:\d{2}$')
+_FACEOFF_STRING_RE = re.compile(r'(\d+)-(\d+)/(\d+)%')
+# FS player header cell, e.g. "13 C HISCHIER, NICO" (sweater number, position, name)
+_FACEOFF_PLAYER_RE = re.compile(r'(\d+)\s+([A-Z])\s+([A-Z\s,]+)')
+# ES section lookups
+_SECTION_HEADING_CLASS_RE = re.compile(r'visitorsectionheading|homesectionheading')
+_ROW_COLOR_RE = re.compile(r'oddColor|evenColor', re.IGNORECASE)
+_FACEOFF_SUMMARY_RE = re.compile(r'face-?off\s+summary', re.IGNORECASE)
+
+# ES player row statistics in output order: (group, key, cell index, kind). Grouped columns
+# are nested under their group key, so the time-on-ice columns become 'time_on_ice'
+_ES_PLAYER_COLUMNS = (
+    (None, 'goals', 3, 'int'),
+    (None, 'assists', 4, 'int'),
+    (None, 'points', 5, 'int'),
+    (None, 'plus_minus', 6, 'int'),
+    (None, 'penalty_number', 7, 'int'),
+    (None, 'penalty_minutes', 8, 'int'),
+    ('time_on_ice', 'total', 9, 'time'),
+    ('time_on_ice', 'shifts', 10, 'int'),
+    ('time_on_ice', 'avg_shift', 11, 'time'),
+    ('time_on_ice', 'power_play', 12, 'time'),
+    ('time_on_ice', 'short_handed', 13, 'time'),
+    ('time_on_ice', 'even_strength', 14, 'time'),
+    (None, 'shots', 15, 'int'),
+    (None, 'attempts_blocked', 16, 'int'),
+    (None, 'missed_shots', 17, 'int'),
+    (None, 'hits', 18, 'int'),
+    (None, 'giveaways', 19, 'int'),
+    (None, 'takeaways', 20, 'int'),
+    (None, 'blocked_shots', 21, 'int'),
+    (None, 'faceoffs_won', 22, 'int'),
+    (None, 'faceoffs_lost', 23, 'int'),
+    (None, 'faceoff_percentage', 24, 'float'),
+)
+
+# Positional stat column names for goalie rows ('stat_0', 'stat_1', ...); wider rows extend on the fly
+_STAT_KEYS = tuple(f'stat_{i}' for i in range(32))
+
+
+class _DocumentText:
+    """Text nodes of one parsed document, shared by the context extractors scanning it.
+    
+    Built by HTMLReportParser._document_text and owned by the caller, so it is released
+    with the document instead of being kept on the parser.
+    """
+    __slots__ = ('nodes', 'is_lxml', 'contexts')
+    
+    def __init__(self, nodes: List[Tuple[str, Any, Any]], is_lxml: bool):
+        # (text, parent element, parent cache key) tuples in document order
+        self.nodes = nodes
+        self.is_lxml = is_lxml
+        # Parent cache key -> (text, lowercased text, home/away side), filled in as first needed
+        self.contexts: Dict[Any, Tuple[str, str, Optional[str]]] = {}
+
 
 class HTMLReportParser:
     """
@@ -41,26 +266,52 @@ class HTMLReportParser:
     Supported Report Types:
     - GS: Game Summary (scoring, penalties, team stats, officials, three stars)
     - RO: Roster (active players, goalies, scratches)
-    - PL: Play-by-Play (placeholder)
-    - ES: Event Summary (placeholder)
+    - PL: Play-by-Play (events with players on ice)
+    - ES: Event Summary (player and team statistics)
     - SS: Shot Summary (placeholder)
-    - FS: Faceoff Summary (placeholder)
+    - FS: Faceoff Summary (team and player faceoffs by strength)
     - FC: Faceoff Comparison (placeholder)
-    - TH: Time on Ice (placeholder)
-    - TV: Time on Ice Comparison (placeholder)
+    - TH: Time on Ice - Home (per-player TOI)
+    - TV: Time on Ice - Visitor (per-player TOI)
     """
     
-    def __init__(self, config=None, storage_path: str = "storage/20242025/json"):
+    # Report types with real parsers; placeholders are skipped by parse_game_data
+    _IMPLEMENTED_REPORTS = frozenset({'GS', 'PL', 'ES', 'RO', 'FS', 'TH', 'TV'})
+    
+    # Parser owned by a process-pool worker (see worker_init)
+    _worker: Optional['HTMLReportParser'] = None
+    
+    def __init__(self, config=None, storage_path: str = "storage/20242025/json",
+                 reference_data: Optional[ReferenceDataLoader] = None):
         """
         Initialize the HTML penalty parser.
         
         Args:
             config: Configuration object
             storage_path: Path to the JSON storage directory for reference data
+            reference_data: Already-loaded reference data to reuse instead of reading storage_path
         """
         self.config = config
         self.logger = logging.getLogger('HTMLPenaltyParser')
-        self.reference_data = ReferenceDataLoader(storage_path)
+        self.reference_data = reference_data if reference_data is not None else ReferenceDataLoader(storage_path)
+        
+        # Game header and ID of the report being parsed, set by the report parsers
+        self._current_game_data: Optional[Dict[str, Any]] = None
+        self._current_game_id: Any = None
+        
+        # Reference-data game headers, built once per game and reused across report types
+        self._game_header_cache: Dict[int, Dict[str, Any]] = {}
+        
+        # Boxscore sweater index for the current game: (team key, sweater) -> player_id
+        self._sweater_index: Dict[Tuple[str, int], int] = {}
+        self._sweater_index_game_id: Any = None
+        
+        # Stripped tag texts read during the current ES parse, keyed by id(tag); the tag is
+        # kept alongside its text so the id cannot be reused while the entry exists
+        self._text_cache: Dict[int, Tuple[Any, str]] = {}
+        
+        # Timestamp of the ES parse in progress, stamped on each player row it extracts
+        self._parse_started_at: Optional[str] = None
         
         # Penalty type mappings
         self.penalty_types = {
@@ -77,20 +328,11 @@ def __init__(self, config=None, storage_path: str = "storage/20242025/json"):
             'too-many-men-on-the-ice', 'delay-of-game', 'unsportsmanlike-conduct',
             'instigator', 'instigator-misconduct'
         }
-        
-        # Penalty duration patterns
-        self.duration_patterns = [
-            r'(\d+)\s*min',  # "2 min", "5 min"
-            r'(\d+)\s*minutes',  # "2 minutes"
-            r'(\d+)\s*minute',  # "1 minute"
-        ]
-        
-        # Penalty description patterns
-        self.description_patterns = [
-            r'penalty\s*[:\-]?\s*([^,]+)',  # "penalty: tripping"
-            r'([a-z\-]+)\s*penalty',  # "tripping penalty"
-            r'penalty\s*for\s*([^,]+)',  # "penalty for tripping"
-        ]
+        # Entries are hyphenated phrases matched as substrings; one alternation scans for all of them
+        self._non_pp_re = re.compile(
+            '|'.join(re.escape(name) for name in sorted(self.non_power_play_penalties, key=len, reverse=True)),
+            re.IGNORECASE
+        )
     
     def parse_game_data(self, season: str, game_id: str, html_dir: Path) -> Dict[str, Any]:
         """
@@ -117,11 +359,14 @@ def parse_game_data(self, season: str, game_id: str, html_dir: Path) -> Dict[str
             }
         }
         
-        # Parse each report type
+        # Parse each report type that has a real parser (SS/FC are placeholders)
         report_types = ['GS', 'PL', 'ES', 'RO', 'SS', 'FS', 'FC', 'TH', 'TV']  # All available report types
         
-        for report_type in report_types:
-            html_file = html_dir / f"{report_type}{game_id}.HTM"
+        for report_type in [rt for rt in report_types if rt in self._IMPLEMENTED_REPORTS]:
+            # Reports live in per-type subdirectories (html/reports/GS/GS020001.HTM); also accept a flat directory
+            html_file = html_dir / report_type / f"{report_type}{game_id}.HTM"
+            if not html_file.exists():
+                html_file = html_dir / f"{report_type}{game_id}.HTM"
             if html_file.exists():
                 try:
                     report_data = self.parse_report_data(html_file, report_type)
@@ -140,6 +385,111 @@ def parse_game_data(self, season: str, game_id: str, html_dir: Path) -> Dict[str
         
         return game_data
     
+    def parse_games(self, season: str, game_ids: List[str], html_dir: Path,
+                    max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse complete game data for many games across a pool of worker processes.
+        
+        HTML parsing is CPU-bound pure Python, so games are spread over processes rather
+        than threads. Each worker builds one parser in its initializer from a pickled
+        snapshot of this parser's reference data and reuses it for every game it is handed.
+        
+        Args:
+            season: Season identifier
+            game_ids: Game IDs to parse
+            html_dir: Directory containing HTML reports
+            max_workers: Number of worker processes (defaults to the CPU count; 1 parses in-process)
+            
+        Returns:
+            Dictionary mapping game ID to the parse_game_data result
+        """
+        results = {}
+        for game_id, game_data, error in self.iter_games(_parse_game_data_task, game_ids,
+                                                         (season, html_dir), max_workers):
+            if error is not None:
+                self.logger.error(f"Error parsing game {game_id}: {error}")
+                game_data = {'game_id': game_id, 'season': season, 'error': str(error)}
+            results[game_id] = game_data
+        
+        return {game_id: results[game_id] for game_id in game_ids}
+    
+    def iter_games(self, task, game_ids: List[str], args: Tuple = (),
+                   max_workers: Optional[int] = None) -> Iterator[Tuple[str, Any, Optional[Exception]]]:
+        """
+        Run task(parser, game_id, *args) for each game across a pool of worker processes.
+        
+        HTML parsing is CPU-bound pure Python, so games are spread over processes rather
+        than threads. Each worker builds one parser in its initializer from a pickled
+        snapshot of this parser's reference data and reuses it for every game it is handed.
+        With one worker, or a single game, the games run in-process on this parser.
+        
+        Args:
+            task: Module-level (picklable) function taking (parser, game_id, *args)
+            game_ids: Game IDs to process
+            args: Extra positional arguments passed to task after the game ID
+            max_workers: Number of worker processes (defaults to the CPU count; 1 runs in-process)
+            
+        Yields:
+            (game_id, result, error) tuples in completion order; error is the exception the
+            game raised, in which case result is None
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1 or len(game_ids) <= 1:
+            for game_id in game_ids:
+                try:
+                    yield game_id, task(self, game_id, *args), None
+                except Exception as e:
+                    yield game_id, None, e
+            return
+        
+        # Ship the already-loaded reference data to each worker once instead of re-reading the JSON
+        reference_bytes = pickle.dumps(self.reference_data, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=HTMLReportParser.worker_init,
+                                 initargs=(self.config, reference_bytes)) as executor:
+            futures = {executor.submit(_run_game_task, task, game_id, args): game_id
+                       for game_id in game_ids}
+            for future in as_completed(futures):
+                game_id = futures[future]
+                try:
+                    yield game_id, future.result(), None
+                except Exception as e:
+                    yield game_id, None, e
+    
+    def parse_season(self, season: str, root: Path, max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse every game of a season that has a Game Summary report.
+        
+        Args:
+            season: Season identifier (e.g. '20242025')
+            root: Storage root containing {season}/html/reports/<type>/ directories
+            max_workers: Number of worker processes (see parse_games)
+            
+        Returns:
+            Dictionary mapping 6-digit game ID to the parse_game_data result
+        """
+        html_dir = Path(root) / season / 'html' / 'reports'
+        gs_dir = html_dir / 'GS'
+        if not gs_dir.exists():
+            self.logger.warning(f"No Game Summary reports found for season {season} in {gs_dir}")
+            return {}
+        
+        # GS020489.HTM -> 020489
+        game_ids = sorted(html_file.stem[2:] for html_file in gs_dir.glob('GS*.HTM'))
+        return self.parse_games(season, game_ids, html_dir, max_workers)
+    
+    @classmethod
+    def worker_init(cls, config, reference_bytes: bytes) -> None:
+        """
+        Process-pool initializer: build this worker's parser from pickled reference data.
+        
+        Args:
+            config: Configuration object for the parser
+            reference_bytes: Pickled ReferenceDataLoader from the parent process
+        """
+        cls._worker = cls(config, reference_data=pickle.loads(reference_bytes))
+    
     def parse_game_penalties(self, season: str, game_id: str, html_dir: Path) -> Dict[str, Any]:
         """
         Parse penalty data from all available HTML reports for a game.
@@ -174,13 +524,8 @@ def parse_game_penalties(self, season: str, game_id: str, html_dir: Path) -> Dic
                 try:
                     # Use the advanced penalty parsing for GS reports
                     if report_type == 'GS':
-                        # Parse the full report data and extract penalties from it
-                        report_data = self.parse_report_data(html_file, report_type)
-                        penalties_data = report_data.get('penalties', {})
-                        # Extract penalties from by_period structure
-                        penalties = []
-                        for period, period_penalties in penalties_data.get('by_period', {}).items():
-                            penalties.extend(period_penalties)
+                        # Parse only the penalty tables, not the whole Game Summary
+                        penalties = self.parse_gs_penalties_only(html_file)
                     else:
                         # Use the existing method for other report types
                         penalties = self.parse_report_penalties(html_file, report_type)
@@ -201,6 +546,17 @@ def parse_game_penalties(self, season: str, game_id: str, html_dir: Path) -> Dic
         
         return game_penalties
     
+    @staticmethod
+    def _penalty_identity_key(penalty: Dict[str, Any]) -> Tuple:
+        """Identity of a parsed GS penalty row: number, period, time, player name and type."""
+        return (
+            penalty.get('penalty_number'),
+            penalty.get('period'),
+            penalty.get('time'),
+            (penalty.get('player') or {}).get('name'),
+            penalty.get('penalty_type')
+        )
+    
     def consolidate_penalties(self, sources: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """
         Consolidate penalties from multiple sources (GS, PL, ES) to create a unified penalty list.
@@ -212,29 +568,19 @@ def consolidate_penalties(self, sources: Dict[str, List[Dict[str, Any]]]) -> Lis
             List of consolidated penalty dictionaries
         """
         consolidated = []
-        penalty_keys = set()
+        seen = {}
         
         try:
             # Process each source, with GS taking priority for conflicts
             source_priority = ['GS', 'PL', 'ES']
             
             for source_type in source_priority:
-                if source_type in sources:
-                    for penalty in sources[source_type]:
-                        # Create unique key for this penalty
-                        penalty_key = (
-                            penalty.get('penalty_number'),
-                            penalty.get('period'),
-                            penalty.get('time'),
-                            penalty.get('player', {}).get('name'),
-                            penalty.get('penalty_type')
-                        )
-                        
-                        if penalty_key not in penalty_keys:
-                            penalty_keys.add(penalty_key)
-                            # Add source information
-                            penalty['source'] = source_type
-                            consolidated.append(penalty)
+                for penalty in sources.get(source_type, ()):
+                    # First occurrence of a key wins; one hash per penalty
+                    if seen.setdefault(self._penalty_identity_key(penalty), penalty) is penalty:
+                        # Add source information
+                        penalty['source'] = source_type
+                        consolidated.append(penalty)
             
             self.logger.debug(f"Consolidated {len(consolidated)} unique penalties from {len(sources)} sources")
             
@@ -257,17 +603,16 @@ def detect_complex_scenarios(self, penalties: List[Dict[str, Any]]) -> List[Dict
         
         try:
             # 1. Simultaneous penalties (same time, multiple teams)
-            time_groups = {}
+            time_groups: Dict[str, List] = defaultdict(list)
+            teams_per_time = defaultdict(set)
             for penalty in penalties:
                 time = penalty.get('time', '')
-                if time not in time_groups:
-                    time_groups[time] = []
                 time_groups[time].append(penalty)
+                teams_per_time[time].add(penalty.get('team', ''))
             
             for time, time_penalties in time_groups.items():
                 if len(time_penalties) > 1:
-                    teams = set(p.get('team', '') for p in time_penalties)
-                    if len(teams) > 1:
+                    if len(teams_per_time[time]) > 1:
                         scenarios.append({
                             'type': 'simultaneous_penalties',
                             'time': time,
@@ -295,7 +640,7 @@ def detect_complex_scenarios(self, penalties: List[Dict[str, Any]]) -> List[Dict
                 })
             
             # 3. Non-power play penalties (fighting, misconducts)
-            non_pp_penalties = [p for p in penalties if p.get('penalty_type') in ['Fighting', 'Misconduct', 'Game Misconduct']]
+            non_pp_penalties = [p for p in penalties if p.get('penalty_type') in _NON_PP_TYPES]
             if non_pp_penalties:
                 scenarios.append({
                     'type': 'non_power_play_penalties',
@@ -311,6 +656,55 @@ def detect_complex_scenarios(self, penalties: List[Dict[str, Any]]) -> List[Dict
         
         return scenarios
     
+    def _read_html_file(self, html_file: Path) -> str:
+        """
+        Read an HTML report as text, decoding straight from a memory map.
+        
+        Decoding from the mapped buffer avoids the text I/O layer and an intermediate
+        bytes copy; newlines are normalized to match text-mode reads. Files that are
+        not valid UTF-8 are decoded once here with charset detection, so the soup,
+        the lxml tree and the text scans all share the same decoded content.
+        
+        Args:
+            html_file: Path to HTML file
+            
+        Returns:
+            Decoded file content
+        """
+        with open(html_file, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    content = str(mm, 'utf-8')
+                except UnicodeDecodeError:
+                    content = self._decode_non_utf8(mm[:], html_file)
+        
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    def _decode_non_utf8(self, raw: bytes, html_file: Path) -> str:
+        """
+        Decode report bytes that are not valid UTF-8.
+        
+        Uses charset_normalizer's C-accelerated detection when installed; otherwise
+        falls back to UTF-8 with undecodable bytes dropped.
+        
+        Args:
+            raw: Raw file content
+            html_file: Path of the file, for logging
+            
+        Returns:
+            Decoded file content
+        """
+        if detect_charset is not None:
+            best = detect_charset(raw).best()
+            if best is not None:
+                self.logger.debug(f"Decoded {html_file} as {best.encoding}")
+                return str(best)
+        return raw.decode('utf-8', 'ignore')
+    
     def parse_report_data(self, html_file: Path, report_type: str) -> Dict[str, Any]:
         """
         Parse complete data from a specific HTML report type using BeautifulSoup.
@@ -323,37 +717,77 @@ def parse_report_data(self, html_file: Path, report_type: str) -> Dict[str, Any]
             Dictionary containing parsed data from the report
         """
         try:
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Use lxml parser for speed and robustness
-            soup = BeautifulSoup(content, 'lxml')
-            
-            if report_type == 'GS':
-                return self.parse_game_summary_data(soup, str(html_file))
-            elif report_type == 'PL':
-                # Extract game ID from file path (e.g., PL020001.HTM -> 2024020001)
-                game_id = self._extract_game_id_from_pl_file(html_file)
-                return self.parse_playbyplay_data(soup, game_id)
-            elif report_type == 'ES':
-                return self.parse_event_summary_data(soup, str(html_file))
-            elif report_type == 'RO':
-                return self._parse_roster_data(soup, str(html_file))
-            elif report_type == 'SS':
-                return self.parse_shot_summary_data(soup)
-            elif report_type == 'FS':
-                return self.parse_faceoff_summary_data(soup, str(html_file))
-            elif report_type == 'FC':
-                return self.parse_faceoff_comparison_data(soup)
-            elif report_type in ['TH', 'TV']:
-                return self.parse_time_on_ice_data(soup, report_type, str(html_file))
-            else:
-                return {'report_type': report_type, 'data': {}}
+            content = self._read_html_file(html_file)
+            return self.parse_report(content, report_type, html_file)
                 
         except Exception as e:
             self.logger.error(f"Error parsing {report_type} report {html_file}: {e}")
             return {'report_type': report_type, 'error': str(e)}
     
+    def parse_report(self, content: str, report_type: str, file_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+        """
+        Parse complete data from already-loaded HTML report content.
+        
+        The document is parsed into one soup here, shared by every section helper of
+        the report. GS, ES and FS are parsed twice: their helpers also get a full
+        lxml.html tree of the same content for their XPath fast paths.
+        
+        Args:
+            content: Raw HTML content of the report
+            report_type: Type of report (GS, PL, ES, RO, SS, FS, FC, TH, TV)
+            file_path: Optional source path, used for game ID extraction from the filename
+            
+        Returns:
+            Dictionary containing parsed data from the report
+        """
+        # Use lxml parser for speed and robustness; ES, PL, SS and FS skip the markup they never query
+        soup = BeautifulSoup(content, _SOUP_PARSER, parse_only=_REPORT_STRAINERS.get(report_type))
+        
+        if report_type == 'GS':
+            return self.parse_game_summary_data(soup, file_path, tree=self._build_lxml_tree(content))
+        elif report_type == 'PL':
+            # Extract game ID from file path (e.g., PL020001.HTM -> 2024020001)
+            game_id = self._extract_game_id_from_pl_file(Path(file_path)) if file_path else None
+            return self.parse_playbyplay_data(soup, game_id)
+        elif report_type == 'ES':
+            return self.parse_event_summary_data(soup, file_path, tree=self._build_lxml_tree(content))
+        elif report_type == 'RO':
+            return self._parse_roster_data(soup, file_path)
+        elif report_type == 'SS':
+            return self.parse_shot_summary_data(soup)
+        elif report_type == 'FS':
+            return self.parse_faceoff_summary_data(soup, file_path, tree=self._build_lxml_tree(content))
+        elif report_type == 'FC':
+            return self.parse_faceoff_comparison_data(soup)
+        elif report_type in ['TH', 'TV']:
+            return self.parse_time_on_ice_data(soup, report_type, file_path)
+        else:
+            return {'report_type': report_type, 'data': {}}
+    
+    def parse_gs_penalties_only(self, html_file: Path) -> List[Dict[str, Any]]:
+        """
+        Parse just the penalty tables of a Game Summary report.
+        
+        Skips the header, scoring, team stats, officials and three stars sections
+        that parse_game_summary_data would also build.
+        
+        Args:
+            html_file: Path to the GS HTML file
+            
+        Returns:
+            List of penalty dictionaries in period order
+        """
+        content = self._read_html_file(html_file)
+        soup = BeautifulSoup(content, _SOUP_PARSER)
+        
+        # Player ID lookups need the game context normally set by the header parse
+        self._current_game_id = self._extract_game_id_from_html(None, Path(html_file))
+        
+        penalties_data = self._parse_penalties_section(soup)
+        
+        # Flatten the by_period structure
+        return list(chain.from_iterable(penalties_data.get('by_period', {}).values()))
+    
     def parse_report_penalties(self, html_file: Path, report_type: str) -> List[Dict[str, Any]]:
         """
         Parse penalties from a specific HTML report type.
@@ -366,29 +800,33 @@ def parse_report_penalties(self, html_file: Path, report_type: str) -> List[Dict
             List of parsed penalty dictionaries
         """
         try:
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            if report_type not in ('GS', 'PL', 'ES'):
+                return []
             
-            if report_type == 'GS':
-                return self.parse_game_summary_penalties(content)
-            elif report_type == 'PL':
-                return self.parse_playbyplay_penalties(content)
-            elif report_type == 'ES':
+            content = self._read_html_file(html_file)
+            
+            if report_type == 'ES':
+                # Event Summary penalties come from text patterns only; no tree needed
                 return self.parse_event_summary_penalties(content)
-            else:
-                return []
+            
+            # Build the tree once and share it with the structured penalty parser
+            tree = self._build_lxml_tree(content)
+            if report_type == 'GS':
+                return self.parse_game_summary_penalties(content, tree=tree)
+            return self.parse_playbyplay_penalties(content, tree=tree)
                 
         except Exception as e:
             self.logger.error(f"Error parsing {report_type} report {html_file}: {e}")
             return []
     
-    def parse_game_summary_data(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def parse_game_summary_data(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None, tree=None) -> Dict[str, Any]:
         """
         Parse complete Game Summary (GS) data using BeautifulSoup with proper section structure.
         
         Args:
             soup: BeautifulSoup object of the HTML content
             file_path: Optional file path for game ID extraction from filename
+            tree: Optional lxml.html tree of the same content for XPath fast paths
             
         Returns:
             Dictionary containing all parsed game summary data with proper structure
@@ -405,7 +843,7 @@ def parse_game_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
         
         try:
             # Parse game header (teams, score, date, venue)
-            data['game_header'] = self._parse_game_header(soup, file_path)
+            data['game_header'] = self._parse_game_header(soup, file_path, tree)
             
             # Store game data and ID for reference data lookup
             self._current_game_data = data['game_header']
@@ -418,11 +856,14 @@ def parse_game_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
             data['penalties'] = self._parse_penalties_section(soup)
             
             # Parse team statistics
-            data['team_stats'] = self._parse_team_stats(soup)
+            team_stats = self._parse_team_stats_lxml(tree) if tree is not None else None
+            data['team_stats'] = team_stats if team_stats is not None else self._parse_team_stats(soup)
             
             # Parse officials and three stars
-            data['officials'] = self._parse_officials(soup)
-            data['three_stars'] = self._parse_three_stars(soup)
+            officials = self._parse_officials_lxml(tree) if tree is not None else None
+            data['officials'] = officials if officials is not None else self._parse_officials(soup)
+            three_stars = self._parse_three_stars_lxml(tree) if tree is not None else None
+            data['three_stars'] = three_stars if three_stars is not None else self._parse_three_stars(soup)
             
         except Exception as e:
             self.logger.error(f"Error parsing game summary data: {e}")
@@ -430,12 +871,12 @@ def parse_game_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
         
         return data
     
-    def _extract_game_id_from_html(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Optional[int]:
-        """Extract game ID from HTML content or filename."""
+    def _extract_game_id_from_html(self, soup: Optional[BeautifulSoup], file_path: Optional[Union[str, Path]] = None) -> Optional[int]:
+        """Extract game ID from HTML content or filename (a Path is used as-is, avoiding a re-wrap)."""
         try:
             # First try to extract from filename if provided
             if file_path:
-                filename = Path(file_path).stem
+                filename = (file_path if isinstance(file_path, Path) else Path(file_path)).stem
                 # Pattern: GS020001 -> 2024020001
                 if filename.startswith(('GS', 'ES', 'PL', 'RO', 'SS', 'FS', 'FC', 'TH', 'TV')):
                     game_number = filename[2:]  # Remove prefix
@@ -444,21 +885,22 @@ def _extract_game_id_from_html(self, soup: BeautifulSoup, file_path: Optional[st
                         game_id = int(f"2024{game_number}")
                         return game_id
             
-            # Look for game ID in various places in HTML
+            # Filename did not yield an ID; fall back to scanning the HTML
+            if soup is None:
+                return None
+            
             # Check title tag
             title_tag = soup.find('title')
             if title_tag:
-                title_text = title_tag.get_text()
                 # Look for pattern like "Game 2024020031" or similar
-                game_id_match = re.search(r'Game\s+(\d+)', title_text)
+                game_id_match = _TITLE_GAME_ID_RE.search(title_tag.get_text())
                 if game_id_match:
                     return int(game_id_match.group(1))
             
             # Check for game ID in script tags or other elements
-            scripts = soup.find_all('script')
-            for script in scripts:
+            for script in soup.find_all('script'):
                 if script.string:
-                    game_id_match = re.search(r'gameId["\']?\s*[:=]\s*["\']?(\d+)', script.string)
+                    game_id_match = _SCRIPT_GAME_ID_RE.search(script.string)
                     if game_id_match:
                         return int(game_id_match.group(1))
             
@@ -474,49 +916,110 @@ def _extract_game_id_from_html(self, soup: BeautifulSoup, file_path: Optional[st
         
         return None
 
-    def _lookup_player_id_by_sweater(self, sweater_number: int, player_name: str = "", team_id: int = None) -> Optional[int]:
+    def _lookup_player_id_by_sweater(self, sweater_number: int, player_name: str = "", team_key: Optional[str] = None) -> Optional[int]:
         """
         Look up player ID using sweater number from the current game's authoritative boxscore data.
         
         Args:
             sweater_number: Player sweater number
             player_name: Player name for additional matching (optional)
-            team_id: Team ID for team-specific lookup (optional)
+            team_key: 'awayTeam' or 'homeTeam'; sweater numbers are only unique within
+                a team, so without it no player ID is returned
             
         Returns:
             Player ID if found, None otherwise
         """
         try:
-            if not hasattr(self, 'reference_data') or not self.reference_data:
+            if not self.reference_data or team_key is None:
                 return None
             
-            # Get the current game's boxscore data for authoritative player information
-            game_id_int = int(self._current_game_id) if hasattr(self, '_current_game_id') and self._current_game_id else None
+            game_id_int = int(self._current_game_id) if self._current_game_id else None
             if not game_id_int:
                 return None
-                
-            boxscore_data = self.reference_data.get_boxscore_by_id(game_id_int)
-            if not boxscore_data:
-                return None
             
-            # Search through both teams' player stats
-            for team_key in ['awayTeam', 'homeTeam']:
-                team_data = boxscore_data.get('playerByGameStats', {}).get(team_key, {})
-                
-                # Check all player types (forwards, defense, goalies)
-                for player_type in ['forwards', 'defense', 'goalies']:
-                    players = team_data.get(player_type, [])
-                    for player in players:
-                        if player.get('sweaterNumber') == sweater_number:
-                            player_id = player.get('playerId')
-                            if player_id:
-                                return player_id
-            
-            return None
+            return self._get_player_id(game_id_int, team_key, sweater_number)
             
         except Exception as e:
             self.logger.debug(f"Error looking up player ID for sweater {sweater_number}: {e}")
             return None
+    
+    def _cached_text(self, tag) -> str:
+        """
+        Stripped text of a tag, read once per parse.
+        
+        The ES section helpers inspect the same cells more than once (row filters, then
+        row extraction; both team summaries use the same row), and each get_text() call
+        walks the tag's whole subtree.
+        
+        Args:
+            tag: BeautifulSoup tag
+            
+        Returns:
+            The tag's text with whitespace stripped, like get_text(strip=True)
+        """
+        entry = self._text_cache.get(id(tag))
+        if entry is None:
+            entry = self._text_cache[id(tag)] = (tag, tag.get_text(strip=True))
+        return entry[1]
+    
+    def _get_player_id(self, game_id: Any, team_key: str, sweater_number: int) -> Optional[int]:
+        """
+        Look up a player ID in the game's boxscore by team and sweater number.
+        
+        The game's players are indexed on first use, so each report row costs one dict
+        lookup instead of a scan over the team's forwards, defense and goalies.
+        
+        Args:
+            game_id: Game ID as passed to the reference data loader
+            team_key: 'awayTeam' or 'homeTeam'
+            sweater_number: Player's sweater number
+            
+        Returns:
+            Player ID, or None if the boxscore has no such player
+        """
+        if self._sweater_index_game_id != game_id:
+            self._build_sweater_index(game_id)
+        
+        return self._sweater_index.get((team_key, sweater_number))
+    
+    def _build_sweater_index(self, game_id: Any) -> None:
+        """
+        Index the game's boxscore players by (team key, sweater_number).
+        
+        Within a team the forwards, defense and goalies are searched in that order and the
+        first player with an ID wins.
+        
+        Args:
+            game_id: Game ID whose boxscore should be indexed
+        """
+        index = {}
+        boxscore_data = self.reference_data.get_boxscore_by_id(game_id) or {}
+        player_stats = boxscore_data.get('playerByGameStats', {})
+        
+        for team_key in ['awayTeam', 'homeTeam']:
+            team_data = player_stats.get(team_key, {})
+            
+            # Check all player types (forwards, defense, goalies)
+            for player_type in ['forwards', 'defense', 'goalies']:
+                for player in team_data.get(player_type, []):
+                    sweater_number = player.get('sweaterNumber')
+                    player_id = player.get('playerId')
+                    if sweater_number is None or not player_id:
+                        continue
+                    index.setdefault((team_key, sweater_number), player_id)
+        
+        self._sweater_index = index
+        self._sweater_index_game_id = game_id
+    
+    def _team_key_for_abbrev(self, abbrev: str) -> Optional[str]:
+        """Resolve a team abbreviation to its boxscore side ('awayTeam'/'homeTeam') using the current game header."""
+        if not abbrev or not self._current_game_data:
+            return None
+        for side, team_key in [('visitor_team', 'awayTeam'), ('home_team', 'homeTeam')]:
+            team = self._current_game_data.get(side, {})
+            if team.get('abbrev') == abbrev:
+                return team_key
+        return None
 
     def _resolve_player_name(self, team_id: int, sweater_number: int, fallback_name: str = "") -> str:
         """
@@ -545,7 +1048,42 @@ def _resolve_team_name(self, team_id: int, fallback_name: str = "") -> str:
         """
         return self.reference_data.resolve_team_name(team_id, fallback_name)
 
-    def _parse_game_header(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def _build_lxml_tree(self, content: str):
+        """Build an lxml.html tree for XPath fast paths, or None if lxml is unavailable."""
+        if lxml_html is None:
+            return None
+        try:
+            return lxml_html.fromstring(content)
+        except Exception as e:
+            self.logger.debug(f"lxml tree unavailable, using BeautifulSoup only: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_score(text: str) -> Optional[int]:
+        """Convert a header score cell to int, or None if it is not a plain number."""
+        text = text.strip()
+        return int(text) if text.isdigit() else None
+    
+    @staticmethod
+    def _parse_time_cell(text: str) -> Optional[str]:
+        """
+        Extract the "mm:ss" time from a report's time cell, or None if it holds none.
+        
+        The cell is almost always a bare "mm:ss", so it is split directly and the
+        regex only runs for odd inputs.
+        """
+        minutes, sep, seconds = text.partition(':')
+        if sep and 0 < len(minutes) <= 2 and len(seconds) >= 2 and minutes.isdecimal() and seconds[:2].isdecimal():
+            return f"{minutes}:{seconds[:2]}"
+        time_match = _TIME_RE.search(text)
+        return time_match.group(1) if time_match else None
+    
+    @staticmethod
+    def _lxml_text(element) -> str:
+        """lxml equivalent of BeautifulSoup's get_text(strip=True)."""
+        return ''.join(text.strip() for text in element.itertext())
+    
+    def _parse_game_header(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None, tree=None) -> Dict[str, Any]:
         """Parse game header information including teams, scores, date, and venue."""
         header = {
             'visitor_team': {},
@@ -559,33 +1097,16 @@ def _parse_game_header(self, soup: BeautifulSoup, file_path: Optional[str] = Non
             if game_id:
                 header['game_info']['game_id'] = game_id
                 
-                # Get game data from reference
-                game_data = self.reference_data.get_game_by_id(game_id)
-                boxscore_data = self.reference_data.get_boxscore_by_id(game_id)
-                
-                if game_data:
-                    # Use reference data for team info
-                    away_team_data = game_data.get('awayTeam', {})
-                    home_team_data = game_data.get('homeTeam', {})
-                    
-                    header['visitor_team']['id'] = away_team_data.get('id')
-                    header['visitor_team']['name'] = away_team_data.get('placeName', {}).get('default', '')
-                    header['visitor_team']['abbrev'] = away_team_data.get('abbrev', '')
-                    header['visitor_team']['score'] = away_team_data.get('score', 0)
-                    
-                    header['home_team']['id'] = home_team_data.get('id')
-                    header['home_team']['name'] = home_team_data.get('placeName', {}).get('default', '')
-                    header['home_team']['abbrev'] = home_team_data.get('abbrev', '')
-                    header['home_team']['score'] = home_team_data.get('score', 0)
-                    
-                    # Game info from reference data
-                    header['game_info']['date'] = game_data.get('gameDate', '')
-                    header['game_info']['venue'] = game_data.get('venue', {}).get('default', '')
-                    header['game_info']['start_time'] = game_data.get('startTimeUTC', '')
-                    
-                    return header
+                # Use reference data for team and game info when available
+                reference_header = self._get_reference_header(game_id)
+                if reference_header:
+                    return reference_header
             
             # Fallback to HTML parsing if reference data not available
+            if tree is not None:
+                self._parse_game_header_lxml(tree, header)
+                return header
+            
             # Parse visitor team info
             visitor_table = soup.find('table', {'id': 'Visitor'})
             if visitor_table:
@@ -597,10 +1118,12 @@ def _parse_game_header(self, soup: BeautifulSoup, file_path: Optional[str] = Non
                 # Score from the large font element
                 score_elem = visitor_table.find('td', style=lambda x: x and 'font-size: 40px' in x)
                 if score_elem:
-                    header['visitor_team']['score'] = int(score_elem.get_text(strip=True))
+                    score = self._parse_score(score_elem.get_text(strip=True))
+                    if score is not None:
+                        header['visitor_team']['score'] = score
                 
                 # Team name from text content as backup
-                team_name_elem = visitor_table.find('td', string=lambda text: text and any(team in text.upper() for team in ['DEVILS', 'SABRES', 'RANGERS', 'ISLANDERS', 'FLYERS', 'PENGUINS', 'CAPITALS', 'HURRICANES', 'PANTHERS', 'LIGHTNING', 'BRUINS', 'MAPLE LEAFS', 'SENATORS', 'CANADIENS', 'RED WINGS', 'BLACKHAWKS', 'BLUE JACKETS', 'STARS', 'WILD', 'PREDATORS', 'BLUES', 'JETS', 'AVALANCHE', 'COYOTES', 'DUCKS', 'KINGS', 'SHARKS', 'GOLDEN KNIGHTS', 'FLAMES', 'OILERS', 'CANUCKS', 'KRAKEN']))
+                team_name_elem = visitor_table.find('td', string=_TEAM_RE)
                 if team_name_elem:
                     header['visitor_team']['name'] = team_name_elem.get_text(strip=True).split('\n')[0]
             
@@ -615,31 +1138,20 @@ def _parse_game_header(self, soup: BeautifulSoup, file_path: Optional[str] = Non
                 # Score from the large font element
                 score_elem = home_table.find('td', style=lambda x: x and 'font-size: 40px' in x)
                 if score_elem:
-                    header['home_team']['score'] = int(score_elem.get_text(strip=True))
+                    score = self._parse_score(score_elem.get_text(strip=True))
+                    if score is not None:
+                        header['home_team']['score'] = score
                 
                 # Team name from text content as backup
-                team_name_elem = home_table.find('td', string=lambda text: text and any(team in text.upper() for team in ['DEVILS', 'SABRES', 'RANGERS', 'ISLANDERS', 'FLYERS', 'PENGUINS', 'CAPITALS', 'HURRICANES', 'PANTHERS', 'LIGHTNING', 'BRUINS', 'MAPLE LEAFS', 'SENATORS', 'CANADIENS', 'RED WINGS', 'BLACKHAWKS', 'BLUE JACKETS', 'STARS', 'WILD', 'PREDATORS', 'BLUES', 'JETS', 'AVALANCHE', 'COYOTES', 'DUCKS', 'KINGS', 'SHARKS', 'GOLDEN KNIGHTS', 'FLAMES', 'OILERS', 'CANUCKS', 'KRAKEN']))
+                team_name_elem = home_table.find('td', string=_TEAM_RE)
                 if team_name_elem:
                     header['home_team']['name'] = team_name_elem.get_text(strip=True).split('\n')[0]
             
             # Parse game info
             game_info_table = soup.find('table', {'id': 'GameInfo'})
             if game_info_table:
-                rows = game_info_table.find_all('tr')
-                for row in rows:
-                    text = row.get_text(strip=True)
-                    if 'NHL Global Series' in text or 'NHL' in text:
-                        header['game_info']['event'] = text
-                    elif any(day in text for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']):
-                        header['game_info']['date'] = text
-                    elif 'Attendance' in text:
-                        header['game_info']['attendance'] = text
-                    elif 'Start' in text and 'End' in text:
-                        header['game_info']['time_info'] = text
-                    elif 'Game' in text and any(char.isdigit() for char in text):
-                        header['game_info']['game_number'] = text
-                    elif text in ['Final', 'Live', 'Scheduled']:
-                        header['game_info']['status'] = text
+                for row in game_info_table.find_all('tr'):
+                    self._classify_game_info_row(row.get_text(strip=True), header['game_info'])
                         
         except Exception as e:
             self.logger.error(f"Error parsing game header: {e}")
@@ -647,6 +1159,88 @@ def _parse_game_header(self, soup: BeautifulSoup, file_path: Optional[str] = Non
         
         return header
     
+    def _get_reference_header(self, game_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Build the game header from reference data, memoized per game ID.
+        
+        Args:
+            game_id: Full game ID (e.g. 2024020001)
+            
+        Returns:
+            A fresh copy of the header dictionary, or None if the game is not in reference data
+        """
+        if game_id not in self._game_header_cache:
+            game_data = self.reference_data.get_game_by_id(game_id)
+            if not game_data:
+                return None
+            
+            away_team_data = game_data.get('awayTeam', {})
+            home_team_data = game_data.get('homeTeam', {})
+            self._game_header_cache[game_id] = {
+                'visitor_team': {
+                    'id': away_team_data.get('id'),
+                    'name': away_team_data.get('placeName', {}).get('default', ''),
+                    'abbrev': away_team_data.get('abbrev', ''),
+                    'score': away_team_data.get('score', 0)
+                },
+                'home_team': {
+                    'id': home_team_data.get('id'),
+                    'name': home_team_data.get('placeName', {}).get('default', ''),
+                    'abbrev': home_team_data.get('abbrev', ''),
+                    'score': home_team_data.get('score', 0)
+                },
+                'game_info': {
+                    'game_id': game_id,
+                    'date': game_data.get('gameDate', ''),
+                    'venue': game_data.get('venue', {}).get('default', ''),
+                    'start_time': game_data.get('startTimeUTC', '')
+                }
+            }
+        
+        # Callers may annotate the header, so hand out per-section copies
+        return {section: dict(values) for section, values in self._game_header_cache[game_id].items()}
+    
+    def _parse_game_header_lxml(self, tree, header: Dict[str, Any]) -> None:
+        """
+        XPath fast path for the HTML header fallback of _parse_game_header.
+        
+        Args:
+            tree: lxml.html tree of the Game Summary report
+            header: Header dictionary to populate in place
+        """
+        for table_id, side in (('Visitor', 'visitor_team'), ('Home', 'home_team')):
+            tables = _XPATH[table_id](tree)
+            if not tables:
+                continue
+            table = tables[0]
+            
+            # Team name from alt attribute of logo image
+            logo_alt = _XPATH['logo_alt'](table)
+            if logo_alt and logo_alt[0]:
+                header[side]['name'] = logo_alt[0]
+            
+            # Score from the large font element
+            score_cells = _XPATH['score_cell'](table)
+            if score_cells:
+                score = self._parse_score(self._lxml_text(score_cells[0]))
+                if score is not None:
+                    header[side]['score'] = score
+            
+            # Team name from text content as backup (text-only cells, as with BeautifulSoup's string=)
+            for td in _XPATH['text_cells'](table):
+                if _TEAM_RE.search(td.text):
+                    header[side]['name'] = self._lxml_text(td).split('\n')[0]
+                    break
+        
+        for row in _XPATH['GameInfo_rows'](tree):
+            self._classify_game_info_row(self._lxml_text(row), header['game_info'])
+    
+    def _classify_game_info_row(self, text: str, game_info: Dict[str, Any]) -> None:
+        """Store one GameInfo row's text under the matching game_info key."""
+        match = _GAME_INFO_RE.match(text)
+        if match:
+            game_info[match.lastgroup] = text
+    
     
     
     def _parse_team_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
@@ -743,27 +1337,49 @@ def _parse_three_stars(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return three_stars
     
-    def parse_game_summary_penalties(self, content: str) -> List[Dict[str, Any]]:
+    def parse_game_summary_penalties(self, content: str, soup: Optional[BeautifulSoup] = None, tree=None) -> List[Dict[str, Any]]:
         """
         Parse penalties from Game Summary (GS) HTML report.
         
         Game Summary reports contain penalty summaries organized by period.
+        Rows are read from an lxml tree when one is available (passed in or
+        built here); BeautifulSoup is used when a soup is passed or lxml is
+        not installed.
+        
+        Args:
+            content: Raw HTML content of the report
+            soup: Optional pre-built soup of the same content
+            tree: Optional pre-built lxml.html tree of the same content
         """
         penalties = []
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Look for penalty sections
-        penalty_sections = soup.find_all('table', class_='border')
-        
-        for section in penalty_sections:
-            # Look for penalty rows
-            rows = section.find_all('tr')
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 3:
-                    penalty_data = self.extract_penalty_from_gs_row(cells)
-                    if penalty_data:
-                        penalties.append(penalty_data)
+        if soup is None and tree is None:
+            tree = self._build_lxml_tree(content)
+        
+        if tree is not None and soup is None:
+            # Look for penalty sections and rows with precompiled XPath
+            for section in _XPATH['border_tables'](tree):
+                for row in _XPATH['rows'](section):
+                    cell_texts = [self._lxml_text(td) for td in _XPATH['cells'](row)]
+                    if len(cell_texts) >= 3:
+                        penalty_data = self.extract_penalty_from_gs_texts(cell_texts)
+                        if penalty_data:
+                            penalties.append(penalty_data)
+        else:
+            if soup is None:
+                soup = BeautifulSoup(content, _SOUP_PARSER)
+            
+            # Look for penalty sections
+            penalty_sections = soup.find_all('table', class_='border')
+            
+            for section in penalty_sections:
+                # Look for penalty rows
+                rows = section.find_all('tr')
+                for row in rows:
+                    cells = row.find_all('td')
+                    if len(cells) >= 3:
+                        penalty_data = self.extract_penalty_from_gs_row(cells)
+                        if penalty_data:
+                            penalties.append(penalty_data)
         
         # Also look for penalty patterns in text
         text_penalties = self.extract_penalties_from_text(content)
@@ -771,23 +1387,42 @@ def parse_game_summary_penalties(self, content: str) -> List[Dict[str, Any]]:
         
         return penalties
     
-    def parse_playbyplay_penalties(self, content: str) -> List[Dict[str, Any]]:
+    def parse_playbyplay_penalties(self, content: str, soup: Optional[BeautifulSoup] = None, tree=None) -> List[Dict[str, Any]]:
         """
         Parse penalties from Play-by-Play (PL) HTML report.
         
         Play-by-Play reports contain detailed penalty events with timing.
+        Rows are read from an lxml tree when one is available (passed in or
+        built here); BeautifulSoup is used when a soup is passed or lxml is
+        not installed.
+        
+        Args:
+            content: Raw HTML content of the report
+            soup: Optional pre-built soup of the same content
+            tree: Optional pre-built lxml.html tree of the same content
         """
         penalties = []
-        
-        # Use BeautifulSoup for structured parsing
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Look for penalty rows in play-by-play tables
-        penalty_rows = soup.find_all('tr', class_='penalty')
-        for row in penalty_rows:
-            penalty_data = self.extract_penalty_from_pl_row(row)
-            if penalty_data:
-                penalties.append(penalty_data)
+        if soup is None and tree is None:
+            tree = self._build_lxml_tree(content)
+        
+        if tree is not None and soup is None:
+            # Look for penalty rows with one precompiled XPath query
+            for row in _XPATH['penalty_rows'](tree):
+                cell_texts = [self._lxml_text(td) for td in _XPATH['cells'](row)[:4]]
+                penalty_data = self.extract_penalty_from_pl_texts(cell_texts)
+                if penalty_data:
+                    penalties.append(penalty_data)
+        else:
+            # Use BeautifulSoup for structured parsing
+            if soup is None:
+                soup = BeautifulSoup(content, _SOUP_PARSER)
+            
+            # Look for penalty rows in play-by-play tables
+            penalty_rows = soup.find_all('tr', class_='penalty')
+            for row in penalty_rows:
+                penalty_data = self.extract_penalty_from_pl_row(row)
+                if penalty_data:
+                    penalties.append(penalty_data)
         
         # Also extract from text patterns
         text_penalties = self.extract_penalties_from_text(content)
@@ -809,13 +1444,13 @@ def parse_event_summary_penalties(self, content: str) -> List[Dict[str, Any]]:
         
         return penalties
     
-    def extract_penalty_minutes_served(self, description: str, cells: List) -> Dict[str, Any]:
+    def extract_penalty_minutes_served(self, description: str, cell_texts: List[str]) -> Dict[str, Any]:
         """
         Extract penalty minutes served information from penalty description and table cells.
         
         Args:
             description: Penalty description text
-            cells: Table cells containing penalty information
+            cell_texts: Stripped text of the table cells containing penalty information
             
         Returns:
             Dictionary with penalty minutes served information
@@ -838,15 +1473,14 @@ def extract_penalty_minutes_served(self, description: str, cells: List) -> Dict[
                 penalty_minutes_served['is_team_penalty'] = True
                 
                 # Look for "served by" information in the description
-                served_by_match = re.search(r'served\s+by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)', description, re.IGNORECASE)
+                served_by_match = _SERVED_BY_RE.search(description)
                 if served_by_match:
                     penalty_minutes_served['player_name'] = served_by_match.group(1).strip()
                     penalty_minutes_served['serving_player_identified'] = True
                 
                 # Look for serving player in additional cells
-                if len(cells) > 3:
-                    for i in range(3, len(cells)):
-                        cell_text = cells[i].get_text(strip=True)
+                if len(cell_texts) > 3:
+                    for cell_text in cell_texts[3:]:
                         if cell_text and len(cell_text) > 2 and not cell_text.isdigit():
                             # This might be the serving player name
                             if not penalty_minutes_served['player_name']:
@@ -866,16 +1500,15 @@ def extract_penalty_duration(self, description: str) -> int:
         """Extract penalty duration from description text."""
         try:
             # Look for duration patterns
-            for pattern in self.duration_patterns:
-                duration_match = re.search(pattern, description, re.IGNORECASE)
-                if duration_match:
-                    return int(duration_match.group(1))
+            duration_match = _DURATION_RE.search(description)
+            if duration_match:
+                return int(duration_match.group(1))
             
-            # Default duration based on penalty type
-            desc_lower = description.lower()
-            if any(major in desc_lower for major in ['major', '5 min', '5 minute']):
+            # Default duration based on penalty type (no "N min" text is present here)
+            words = set(_WORD_RE.findall(description.lower()))
+            if words & _MAJOR_WORDS:
                 return 5
-            elif any(mis in desc_lower for mis in ['misconduct', '10 min', '10 minute']):
+            elif words & _MIS_WORDS:
                 return 10
             else:
                 return 2  # Default to minor penalty
@@ -886,29 +1519,31 @@ def extract_penalty_duration(self, description: str) -> int:
     
     def extract_penalty_from_gs_row(self, cells: List) -> Optional[Dict[str, Any]]:
         """Extract penalty data from Game Summary table row."""
+        if len(cells) < 3:
+            return None
+        return self.extract_penalty_from_gs_texts([cell.get_text(strip=True) for cell in cells])
+    
+    def extract_penalty_from_gs_texts(self, texts: List[str]) -> Optional[Dict[str, Any]]:
+        """Extract penalty data from the stripped cell texts of a Game Summary table row."""
         try:
-            if len(cells) < 3:
+            if len(texts) < 3:
                 return None
             
             # Extract time, team, and description
-            time_cell = cells[0].get_text(strip=True)
-            team_cell = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-            desc_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+            time_cell, team_cell, desc_cell = texts[:3]
             
             # Parse time
-            time_match = re.search(r'(\d{1,2}:\d{2})', time_cell)
-            if not time_match:
+            time = self._parse_time_cell(time_cell)
+            if time is None:
                 return None
             
-            time = time_match.group(1)
-            
             # Parse penalty details
             penalty_info = self.parse_penalty_description(desc_cell)
             if not penalty_info:
                 return None
             
             # Look for penalty minutes served information
-            penalty_minutes_served = self.extract_penalty_minutes_served(desc_cell, cells)
+            penalty_minutes_served = self.extract_penalty_minutes_served(desc_cell, texts)
             
             return {
                 'time': time,
@@ -927,24 +1562,25 @@ def extract_penalty_from_gs_row(self, cells: List) -> Optional[Dict[str, Any]]:
     
     def extract_penalty_from_pl_row(self, row) -> Optional[Dict[str, Any]]:
         """Extract penalty data from Play-by-Play table row."""
+        cells = row.find_all('td')
+        if len(cells) < 4:
+            return None
+        return self.extract_penalty_from_pl_texts([cell.get_text(strip=True) for cell in cells[:4]])
+    
+    def extract_penalty_from_pl_texts(self, texts: List[str]) -> Optional[Dict[str, Any]]:
+        """Extract penalty data from the stripped cell texts of a Play-by-Play table row."""
         try:
-            cells = row.find_all('td')
-            if len(cells) < 4:
+            if len(texts) < 4:
                 return None
             
             # Extract time, team, player, and description
-            time_cell = cells[0].get_text(strip=True)
-            team_cell = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-            player_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-            desc_cell = cells[3].get_text(strip=True) if len(cells) > 3 else ""
+            time_cell, team_cell, player_cell, desc_cell = texts[:4]
             
             # Parse time
-            time_match = re.search(r'(\d{1,2}:\d{2})', time_cell)
-            if not time_match:
+            time = self._parse_time_cell(time_cell)
+            if time is None:
                 return None
             
-            time = time_match.group(1)
-            
             # Parse penalty details
             penalty_info = self.parse_penalty_description(desc_cell)
             if not penalty_info:
@@ -976,39 +1612,35 @@ def extract_penalties_from_text(self, content: str) -> List[Dict[str, Any]]:
         """
         Extract penalties from text content using regex patterns.
         
-        This is a fallback method for when structured parsing fails.
+        This is a fallback method for when structured parsing fails. All patterns
+        are scanned in a single pass; at each position the first matching branch wins.
         """
         penalties = []
         
-        # Look for penalty patterns in text
-        penalty_patterns = [
-            # Time + Team + Player + Penalty
-            r'(\d{1,2}:\d{2})\s*([A-Z]{3})\s*([A-Z\s\.]+)\s*penalty\s*[:\-]?\s*([^,\n]+)',
-            # Time + Penalty + Team
-            r'(\d{1,2}:\d{2})\s*penalty\s*([^,\n]+)\s*([A-Z]{3})',
-            # Time + Team + Penalty
-            r'(\d{1,2}:\d{2})\s*([A-Z]{3})\s*penalty\s*[:\-]?\s*([^,\n]+)',
-            # Bench penalty patterns
-            r'(\d{1,2}:\d{2})\s*([A-Z]{3})\s*bench\s*penalty\s*[:\-]?\s*([^,\n]+)',
-        ]
-        
-        for pattern in penalty_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                try:
-                    penalty_data = self.parse_penalty_match(match, pattern)
-                    if penalty_data:
-                        penalties.append(penalty_data)
-                except Exception as e:
-                    self.logger.debug(f"Error parsing penalty match: {e}")
-                    continue
+        for match in _ALL_PENALTIES_RE.finditer(content):
+            try:
+                pattern, group_indices = _PENALTY_TEXT_GROUPS[match.lastgroup]
+                penalty_data = self.parse_penalty_match(match, pattern, match.group(*group_indices))
+                if penalty_data:
+                    penalties.append(penalty_data)
+            except Exception as e:
+                self.logger.debug(f"Error parsing penalty match: {e}")
+                continue
         
         return penalties
     
-    def parse_penalty_match(self, match, pattern: str) -> Optional[Dict[str, Any]]:
-        """Parse a regex match into penalty data."""
+    def parse_penalty_match(self, match, pattern: str,
+                            groups: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Any]]:
+        """Parse a regex match into penalty data.
+
+        Args:
+            match: Regex match covering the penalty text
+            pattern: Source pattern of the branch that matched
+            groups: Capture groups of that branch (defaults to all groups of the match)
+        """
         try:
-            groups = match.groups()
+            if groups is None:
+                groups = match.groups()
             
             if len(groups) < 2:
                 return None
@@ -1082,22 +1714,19 @@ def parse_penalty_description(self, description: str) -> Optional[Dict[str, Any]
         
         # Determine penalty type
         penalty_type = 'MIN'  # Default to minor
-        if any(major in desc_lower for major in ['major', '5 min', '5 minute']):
+        words = set(_WORD_RE.findall(desc_lower))
+        if words & _MAJOR_WORDS or _MULTIWORD_MAJOR_RE.search(desc_lower):
             penalty_type = 'MAJ'
-        elif any(bench in desc_lower for bench in ['bench', 'team', 'too many men']):
+        elif words & _BEN_WORDS or _MULTIWORD_BEN_RE.search(desc_lower):
             penalty_type = 'BEN'
-        elif any(mis in desc_lower for mis in ['misconduct', '10 min', '10 minute']):
+        elif words & _MIS_WORDS or _MULTIWORD_MIS_RE.search(desc_lower):
             penalty_type = 'MIS'
-        elif any(match in desc_lower for match in ['match penalty', 'ejection']):
+        elif words & _MAT_WORDS or _MULTIWORD_MAT_RE.search(desc_lower):
             penalty_type = 'MAT'
         
         # Extract duration
-        duration = 2  # Default to 2 minutes
-        for pattern in self.duration_patterns:
-            duration_match = re.search(pattern, desc_lower)
-            if duration_match:
-                duration = int(duration_match.group(1))
-                break
+        duration_match = _DURATION_RE.search(desc_lower)
+        duration = int(duration_match.group(1)) if duration_match else 2  # Default to 2 minutes
         
         # Clean description
         clean_desc = self.clean_penalty_description(description)
@@ -1116,22 +1745,13 @@ def clean_penalty_description(self, description: str) -> str:
         
         # Remove common prefixes and suffixes
         cleaned = description.strip()
-        cleaned = re.sub(r'^penalty\s*[:\-]?\s*', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*penalty\s*$', '', cleaned, flags=re.IGNORECASE)
-        
-        # Standardize common variations
-        variations = {
-            'roughing-removing-opponents-helmet': 'roughing-removing-helmet',
-            'ps-slash-on-breakaway': 'penalty-shot-slash',
-            'too-many-men-on-the-ice': 'too-many-men',
-            'delaying-game-puck-over-glass': 'delay-of-game-puck-over-glass',
-            'interference-goalkeeper': 'goalie-interference'
-        }
+        cleaned = _PREFIX_RE.sub('', cleaned)
+        cleaned = _SUFFIX_RE.sub('', cleaned)
         
-        for variant, standard in variations.items():
-            if variant in cleaned.lower():
-                cleaned = standard
-                break
+        # Standardize common variations (one scan for all variants)
+        variation_match = _VARIATIONS_RE.search(cleaned.lower())
+        if variation_match:
+            cleaned = _PENALTY_VARIATIONS[variation_match.group(0)]
         
         return cleaned.strip()
     
@@ -1140,8 +1760,7 @@ def is_power_play_penalty(self, description: str) -> bool:
         if not description:
             return True  # Default to power play
         
-        desc_lower = description.lower()
-        return not any(non_pp in desc_lower for non_pp in self.non_power_play_penalties)
+        return not self._non_pp_re.search(description)
     
     def consolidate_penalties(self, source_penalties: Dict[str, List]) -> List[Dict[str, Any]]:
         """
@@ -1153,57 +1772,52 @@ def consolidate_penalties(self, source_penalties: Dict[str, List]) -> List[Dict[
         Returns:
             Consolidated list of penalties
         """
-        consolidated = []
-        seen_penalties = set()
+        consolidated: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
         
         for source, penalties in source_penalties.items():
             for penalty in penalties:
-                # Create unique identifier for this penalty
-                penalty_key = self.create_penalty_key(penalty)
-                
-                if penalty_key not in seen_penalties:
-                    seen_penalties.add(penalty_key)
-                    consolidated.append(penalty)
-                else:
+                # Key is built once per penalty; merging needs no recomputation
+                existing = consolidated.setdefault(self.create_penalty_key(penalty), penalty)
+                if existing is not penalty:
                     # Merge additional information from this source
-                    self.merge_penalty_info(consolidated, penalty)
+                    self.merge_penalty_info(existing, penalty)
         
-        # Sort by time
-        consolidated.sort(key=lambda x: self.parse_time(x.get('time', '00:00')))
-        
-        return consolidated
+        # Sort by time; sorted() evaluates the key once per penalty, not per comparison
+        return sorted(consolidated.values(), key=self._penalty_seconds)
     
-    def create_penalty_key(self, penalty: Dict[str, Any]) -> str:
-        """Create a unique key for penalty deduplication."""
-        time = penalty.get('time', '')
-        team = penalty.get('team', '')
-        description = penalty.get('description', '')
-        
-        return f"{time}_{team}_{description}".lower()
-    
-    def merge_penalty_info(self, consolidated: List[Dict], new_penalty: Dict):
-        """Merge additional information from a new penalty source."""
-        # Find matching penalty in consolidated list
-        for existing in consolidated:
-            if self.create_penalty_key(existing) == self.create_penalty_key(new_penalty):
-                # Merge missing information
-                if not existing.get('player') and new_penalty.get('player'):
-                    existing['player'] = new_penalty['player']
-                if not existing.get('duration') and new_penalty.get('duration'):
-                    existing['duration'] = new_penalty['duration']
-                if not existing.get('penalty_type') and new_penalty.get('penalty_type'):
-                    existing['penalty_type'] = new_penalty['penalty_type']
-                break
+    def create_penalty_key(self, penalty: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Create a unique, case-insensitive key for penalty deduplication."""
+        return (
+            penalty.get('time', ''),
+            penalty.get('team', '').lower(),
+            penalty.get('description', '').lower()
+        )
+    
+    def merge_penalty_info(self, existing: Dict, new_penalty: Dict):
+        """Merge additional information from a new penalty source into its matching penalty."""
+        # Fill in missing information only
+        if not existing.get('player') and new_penalty.get('player'):
+            existing['player'] = new_penalty['player']
+        if not existing.get('duration') and new_penalty.get('duration'):
+            existing['duration'] = new_penalty['duration']
+        if not existing.get('penalty_type') and new_penalty.get('penalty_type'):
+            existing['penalty_type'] = new_penalty['penalty_type']
     
     def parse_time(self, time_str: str) -> int:
-        """Parse time string to seconds for sorting."""
-        try:
-            if ':' in time_str:
-                minutes, seconds = map(int, time_str.split(':'))
-                return minutes * 60 + seconds
-            return 0
-        except:
-            return 0
+        """Parse an MM:SS time string to seconds for sorting (0 if it is not one)."""
+        if time_str and ':' in time_str:
+            minutes, _, seconds = time_str.partition(':')
+            if minutes.isdecimal() and seconds.isdecimal():
+                return int(minutes) * 60 + int(seconds)
+        return 0
+    
+    def _penalty_seconds(self, penalty: Dict[str, Any]) -> int:
+        """Sort key: a penalty's game clock in seconds."""
+        return self.parse_time(penalty.get('time', '00:00'))
+    
+    def _time_sort_key(self, time: str) -> Tuple[int, str]:
+        """Sort key ordering time strings by game clock, ties broken by the string itself."""
+        return (self.parse_time(time), time)
     
     def detect_complex_scenarios(self, penalties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -1218,17 +1832,18 @@ def detect_complex_scenarios(self, penalties: List[Dict[str, Any]]) -> List[Dict
         scenarios = []
         
         # 1. Simultaneous penalties (same time, multiple teams)
-        time_groups = {}
+        # Group and collect teams in one pass; only the distinct times are sorted
+        time_groups: Dict[str, List] = defaultdict(list)
+        teams_per_time = defaultdict(set)
         for penalty in penalties:
             time = penalty.get('time', '')
-            if time not in time_groups:
-                time_groups[time] = []
             time_groups[time].append(penalty)
+            teams_per_time[time].add(penalty.get('team', ''))
         
-        for time, time_penalties in time_groups.items():
+        for time in sorted(time_groups, key=self._time_sort_key):
+            time_penalties = time_groups[time]
             if len(time_penalties) > 1:
-                teams = set(p.get('team', '') for p in time_penalties)
-                if len(teams) > 1:
+                if len(teams_per_time[time]) > 1:
                     scenarios.append({
                         'type': 'simultaneous_penalties',
                         'time': time,
@@ -1277,84 +1892,97 @@ def generate_penalty_report(self, game_penalties: Dict[str, Any]) -> str:
         Returns:
             Formatted penalty report
         """
-        report = []
-        report.append(f"# Penalty Report - Game {game_penalties['game_id']}")
-        report.append(f"## Season: {game_penalties['season']}")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        metadata = game_penalties['parsing_metadata']
+        reports_parsed = ', '.join(metadata['reports_parsed'])
+        
+        w(f"# Penalty Report - Game {game_penalties['game_id']}\n")
+        w(f"## Season: {game_penalties['season']}\n")
+        w("\n")
         
         # Summary
-        report.append("## Summary")
-        report.append(f"- **Total Penalties**: {len(game_penalties['consolidated_penalties'])}")
-        report.append(f"- **Sources Parsed**: {', '.join(game_penalties['parsing_metadata']['reports_parsed'])}")
-        report.append(f"- **Complex Scenarios**: {len(game_penalties['complex_scenarios'])}")
-        report.append("")
+        w("## Summary\n")
+        w(f"- **Total Penalties**: {len(game_penalties['consolidated_penalties'])}\n")
+        w(f"- **Sources Parsed**: {reports_parsed}\n")
+        w(f"- **Complex Scenarios**: {len(game_penalties['complex_scenarios'])}\n")
+        w("\n")
         
         # Penalties by period
-        report.append("## Penalties by Period")
-        penalties_by_period = {}
-        for penalty in game_penalties['consolidated_penalties']:
-            time = penalty.get('time', '')
-            period = self.determine_period(time)
-            if period not in penalties_by_period:
-                penalties_by_period[period] = []
-            penalties_by_period[period].append(penalty)
-        
-        for period in sorted(penalties_by_period.keys()):
-            report.append(f"### Period {period}")
-            for penalty in penalties_by_period[period]:
-                penalty_line = f"- **{penalty['time']}** - {penalty['team']} - {penalty['description']} ({penalty['duration']} min)"
+        w("## Penalties by Period\n")
+        # Period computed once per penalty; the stable sort is a linear pass on
+        # time-ordered input and keeps each period's penalties in their given order
+        period_penalties = sorted(
+            ((self.determine_period(penalty.get('time', '')), penalty)
+             for penalty in game_penalties['consolidated_penalties']),
+            key=itemgetter(0)
+        )
+        
+        for period, group in groupby(period_penalties, key=itemgetter(0)):
+            w(f"### Period {period}\n")
+            for _, penalty in group:
+                w(_PENALTY_LINE_FMT.format_map(penalty))
                 
                 # Add penalty minutes served information
                 if penalty.get('penalty_minutes_served'):
                     pms = penalty['penalty_minutes_served']
                     if pms.get('is_team_penalty') and pms.get('serving_player_identified'):
-                        penalty_line += f" - Served by: {pms['player_name']}"
+                        w(f" - Served by: {pms['player_name']}")
                     elif pms.get('serving_player_identified'):
-                        penalty_line += f" - Player: {pms['player_name']}"
+                        w(f" - Player: {pms['player_name']}")
                 
-                report.append(penalty_line)
-            report.append("")
+                w("\n")
+            w("\n")
         
         # Complex scenarios
         if game_penalties['complex_scenarios']:
-            report.append("## Complex Scenarios")
+            w("## Complex Scenarios\n")
             for scenario in game_penalties['complex_scenarios']:
-                report.append(f"### {scenario['type'].replace('_', ' ').title()}")
-                report.append(f"- **Description**: {scenario['description']}")
-                report.append(f"- **Impact**: {scenario['impact']}")
-                report.append(f"- **Penalties**: {len(scenario['penalties'])}")
-                report.append("")
+                w(f"### {scenario['type'].replace('_', ' ').title()}\n")
+                w(f"- **Description**: {scenario['description']}\n")
+                w(f"- **Impact**: {scenario['impact']}\n")
+                w(f"- **Penalties**: {len(scenario['penalties'])}\n")
+                w("\n")
         
         # Parsing metadata
-        report.append("## Parsing Metadata")
-        report.append(f"- **Reports Parsed**: {', '.join(game_penalties['parsing_metadata']['reports_parsed'])}")
-        report.append(f"- **Total Penalties Found**: {game_penalties['parsing_metadata']['total_penalties_found']}")
-        if game_penalties['parsing_metadata']['parsing_errors']:
-            report.append("### Parsing Errors")
-            for error in game_penalties['parsing_metadata']['parsing_errors']:
-                report.append(f"- {error}")
-        
-        return "\n".join(report)
+        w("## Parsing Metadata\n")
+        w(f"- **Reports Parsed**: {reports_parsed}\n")
+        w(f"- **Total Penalties Found**: {metadata['total_penalties_found']}\n")
+        if metadata['parsing_errors']:
+            w("### Parsing Errors\n")
+            for error in metadata['parsing_errors']:
+                w(f"- {error}\n")
+        
+        # Every line was newline-terminated; the report has no trailing newline
+        return buf.getvalue()[:-1]
     
     def determine_period(self, time: str) -> int:
-        """Determine period from time string (simplified logic)."""
-        try:
-            if ':' in time:
-                minutes = int(time.split(':')[0])
-                if minutes <= 20:
-                    return 1
-                elif minutes <= 40:
-                    return 2
-                else:
-                    return 3
-        except:
-            pass
+        """Determine period from time string (simplified logic: 20 minutes per period, capped at 3)."""
+        if time and ':' in time:
+            minutes = time.partition(':')[0]
+            if minutes.isdecimal():
+                # 0-20 -> 1, 21-40 -> 2, 41+ -> 3
+                return min(3, max(1, (int(minutes) + 19) // 20))
         return 1  # Default to period 1
     
     # Comprehensive data extraction methods using BeautifulSoup
     
-    def extract_game_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract game metadata from HTML."""
+    @staticmethod
+    def page_text(soup: BeautifulSoup) -> str:
+        """Document text with one line per text node, shared by the text-scanning extractors."""
+        return soup.get_text('\n', strip=True)
+    
+    def extract_game_metadata(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract game metadata from HTML.
+        
+        Args:
+            soup: BeautifulSoup object of the report
+            page_text: Optional output of page_text(soup), to avoid rebuilding it
+            
+        Returns:
+            Dictionary with any title, date and venue found
+        """
         metadata = {}
         
         try:
@@ -1366,23 +1994,20 @@ def extract_game_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
                     metadata['title'] = text
                     break
             
+            # Scan the document text once; one line per text node
+            text = page_text if page_text is not None else self.page_text(soup)
+            
             # Look for game date
-            date_patterns = [
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{4}-\d{2}-\d{2})',
-                r'(\w+ \d{1,2},? \d{4})'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, soup.get_text())
-                if matches:
-                    metadata['date'] = matches[0]
-                    break
+            date_match = _DATE_RE.search(text)
+            if date_match:
+                metadata['date'] = date_match.group(1)
             
-            # Look for venue information
-            venue_elements = soup.find_all(text=re.compile(r'venue|arena|stadium', re.IGNORECASE))
-            if venue_elements:
-                metadata['venue'] = venue_elements[0].strip()
+            # Look for venue information (the text node holding the first match)
+            venue_match = _VENUE_RE.search(text)
+            if venue_match:
+                start = text.rfind('\n', 0, venue_match.start()) + 1
+                end = text.find('\n', venue_match.end())
+                metadata['venue'] = text[start:end] if end != -1 else text[start:]
             
         except Exception as e:
             self.logger.debug(f"Error extracting game metadata: {e}")
@@ -1395,76 +2020,106 @@ def extract_team_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         try:
             # Look for team names and scores
-            team_elements = soup.find_all(text=re.compile(r'[A-Z]{3}|[A-Z][a-z]+ [A-Z][a-z]+'))
-            
-            for element in team_elements:
+            doc_text = self._document_text(soup)
+            for element, _, _, side in self._matching_text_contexts(doc_text, _TEAM_TEXT_RE):
                 text = element.strip()
                 if len(text) == 3:  # Team abbreviation
-                    if 'home' in element.parent.get_text().lower():
-                        team_info['home']['abbreviation'] = text
-                    elif 'away' in element.parent.get_text().lower():
-                        team_info['away']['abbreviation'] = text
+                    key = 'abbreviation'
                 elif len(text.split()) >= 2:  # Full team name
-                    if 'home' in element.parent.get_text().lower():
-                        team_info['home']['name'] = text
-                    elif 'away' in element.parent.get_text().lower():
-                        team_info['away']['name'] = text
-            
-            # Look for scores
-            score_elements = soup.find_all(text=re.compile(r'\d+'))
-            for element in score_elements:
-                parent_text = element.parent.get_text().lower()
-                if 'home' in parent_text and 'score' in parent_text:
-                    team_info['home']['score'] = int(element.strip())
-                elif 'away' in parent_text and 'score' in parent_text:
-                    team_info['away']['score'] = int(element.strip())
+                    key = 'name'
+                else:
+                    continue
+                if side:
+                    team_info[side][key] = text
+            
+            # Look for scores; matches sharing a parent share its context string,
+            # so the 'score' keyword is only searched when the parent changes
+            score_context = score_side = None
+            for element, _, context, side in self._matching_text_contexts(doc_text, _DIGITS_RE):
+                if context is not score_context:
+                    score_context = context
+                    score_side = side if side and 'score' in context else None
+                if score_side:
+                    team_info[score_side]['score'] = int(element.strip())
                     
         except Exception as e:
             self.logger.debug(f"Error extracting team info: {e}")
         
         return team_info
     
+    @staticmethod
+    def _classify_period_text(text: str) -> Optional[str]:
+        """Map lowercased header/context text to a period key, or None if no keyword is present."""
+        for keyword, period_key in _PERIOD_KEYWORDS:
+            if keyword in text:
+                return period_key
+        return None
+    
     def extract_scoring_summary(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract scoring summary by period from HTML."""
         scoring = {}
         
         try:
             # Look for period headers
-            period_headers = soup.find_all(text=re.compile(r'period|1st|2nd|3rd|ot|shootout', re.IGNORECASE))
+            period_headers = soup.find_all(text=_PERIOD_HEADER_RE)
             
             for header in period_headers:
-                period_text = header.strip().lower()
-                if '1st' in period_text or 'first' in period_text:
-                    scoring['period_1'] = self.extract_period_scoring(header.parent)
-                elif '2nd' in period_text or 'second' in period_text:
-                    scoring['period_2'] = self.extract_period_scoring(header.parent)
-                elif '3rd' in period_text or 'third' in period_text:
-                    scoring['period_3'] = self.extract_period_scoring(header.parent)
-                elif 'ot' in period_text or 'overtime' in period_text:
-                    scoring['overtime'] = self.extract_period_scoring(header.parent)
-                elif 'shootout' in period_text:
-                    scoring['shootout'] = self.extract_period_scoring(header.parent)
+                period_key = self._classify_period_text(header.strip().lower())
+                if period_key is not None:
+                    scoring[period_key] = self.extract_period_scoring(header.parent)
                     
         except Exception as e:
             self.logger.debug(f"Error extracting scoring summary: {e}")
         
         return scoring
     
+    @staticmethod
+    def _table_rows_with_cells(root, min_cells: int) -> Iterator[List]:
+        """
+        Yield the td cells of each table row under root that has at least min_cells cells.
+        
+        One ':scope table tr' selection visits every row once, where nested
+        find_all('table') -> find_all('tr') loops revisit rows of nested tables.
+        """
+        for row in root.select(':scope table tr'):
+            cells = row.find_all('td')
+            if len(cells) >= min_cells:
+                yield cells
+    
+    @classmethod
+    def _section_rows_with_cells(cls, soup: BeautifulSoup, heading: str, min_cells: int) -> Iterator[List]:
+        """
+        Yield the td cells of each row of the table under a section heading.
+        
+        Only the section's own table is walked when the heading is present; otherwise
+        every table row in the document is scanned as before.
+        
+        Args:
+            soup: BeautifulSoup object of the report
+            heading: Exact text of the section heading cell (e.g. 'GOALTENDER SUMMARY')
+            min_cells: Minimum number of td cells a row must have
+        """
+        heading_cell = soup.find('td', string=heading)
+        table = heading_cell.find_next('table') if heading_cell else None
+        if table is None:
+            yield from cls._table_rows_with_cells(soup, min_cells)
+            return
+        
+        for row in table.find_all('tr'):
+            cells = row.find_all('td')
+            if len(cells) >= min_cells:
+                yield cells
+    
     def extract_period_scoring(self, period_element) -> List[Dict[str, Any]]:
         """Extract scoring events for a specific period."""
         scoring_events = []
         
         try:
             # Look for scoring rows in tables
-            tables = period_element.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 3:
-                        event = self.extract_scoring_event(cells)
-                        if event:
-                            scoring_events.append(event)
+            for cells in self._table_rows_with_cells(period_element, 3):
+                event = self.extract_scoring_event(cells)
+                if event:
+                    scoring_events.append(event)
                             
         except Exception as e:
             self.logger.debug(f"Error extracting period scoring: {e}")
@@ -1473,48 +2128,36 @@ def extract_period_scoring(self, period_element) -> List[Dict[str, Any]]:
     
     def extract_scoring_event(self, cells) -> Optional[Dict[str, Any]]:
         """Extract individual scoring event from table cells."""
-        try:
-            if len(cells) < 3:
-                return None
-            
-            time_cell = cells[0].get_text(strip=True)
-            team_cell = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-            desc_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-            
-            # Parse time
-            time_match = re.search(r'(\d{1,2}:\d{2})', time_cell)
-            if not time_match:
-                return None
-            
-            time = time_match.group(1)
-            
-            # Parse goal scorer
-            scorer_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+)', desc_cell)
-            scorer = scorer_match.group(1) if scorer_match else ""
-            
-            # Parse assists
-            assists = []
-            assist_matches = re.findall(r'([A-Z][a-z]+ [A-Z][a-z]+)', desc_cell)
-            for assist in assist_matches:
-                if assist != scorer:
-                    assists.append(assist)
-            
-            return {
-                'time': time,
-                'team': team_cell.strip(),
-                'scorer': scorer,
-                'assists': assists,
-                'description': desc_cell,
-                'type': 'goal'
-            }
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting scoring event: {e}")
+        if len(cells) < 3:
+            return None
+        
+        time_cell, team_cell, desc_cell = [cell.get_text(strip=True) for cell in cells[:3]]
+        
+        # Parse time
+        time = self._parse_time_cell(time_cell)
+        if time is None:
             return None
+        
+        # Parse goal scorer and assists from a single scan: the first
+        # name is the scorer, the remaining ones are assists
+        names = _NAME_RE.findall(desc_cell)
+        scorer = names[0] if names else ""
+        assists = [name for name in names[1:] if name != scorer]
+        
+        return {
+            'time': time,
+            'team': team_cell.strip(),
+            'scorer': scorer,
+            'assists': assists,
+            'description': desc_cell,
+            'type': 'goal'
+        }
     
     def extract_penalties_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract penalties organized by period from HTML."""
         penalties = {}
+        # Sections sharing a parent share its context text; classify each parent once
+        period_by_parent = {}
         
         try:
             # Look for penalty sections
@@ -1522,10 +2165,11 @@ def extract_penalties_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
             
             for section in penalty_sections:
                 # Try to determine period from context
-                period = self.determine_period_from_context(section)
+                period = period_by_parent.get(id(section.parent))
+                if period is None:
+                    period = period_by_parent[id(section.parent)] = self.determine_period_from_context(section)
                 
-                if period not in penalties:
-                    penalties[period] = []
+                period_penalties = penalties.setdefault(period, [])
                 
                 rows = section.find_all('tr')
                 for row in rows:
@@ -1533,7 +2177,7 @@ def extract_penalties_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
                     if len(cells) >= 3:
                         penalty_data = self.extract_penalty_from_gs_row(cells)
                         if penalty_data:
-                            penalties[period].append(penalty_data)
+                            period_penalties.append(penalty_data)
                             
         except Exception as e:
             self.logger.debug(f"Error extracting penalties by period: {e}")
@@ -1542,44 +2186,27 @@ def extract_penalties_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
     
     def determine_period_from_context(self, section) -> str:
         """Determine which period a section belongs to based on context."""
-        try:
-            # Look for period indicators in nearby text
-            context_text = section.parent.get_text().lower()
-            
-            if '1st' in context_text or 'first' in context_text:
-                return 'period_1'
-            elif '2nd' in context_text or 'second' in context_text:
-                return 'period_2'
-            elif '3rd' in context_text or 'third' in context_text:
-                return 'period_3'
-            elif 'ot' in context_text or 'overtime' in context_text:
-                return 'overtime'
-            else:
-                return 'unknown'
-                
-        except Exception as e:
-            self.logger.debug(f"Error determining period from context: {e}")
+        parent = section.parent
+        if parent is None:
             return 'unknown'
+        
+        # Look for period indicators in nearby text
+        period_key = self._classify_period_text(parent.get_text().lower())
+        return period_key if period_key is not None else 'unknown'
     
     def extract_goalie_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract goalie statistics from HTML."""
         goalie_stats = {'home': {}, 'away': {}}
         
         try:
-            # Look for goalie statistics tables
-            goalie_tables = soup.find_all('table')
-            
-            for table in goalie_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 4:
-                        goalie_data = self.extract_goalie_row(cells)
-                        if goalie_data:
-                            if goalie_data.get('team') == goalie_stats['home'].get('abbreviation'):
-                                goalie_stats['home'][goalie_data['name']] = goalie_data
-                            else:
-                                goalie_stats['away'][goalie_data['name']] = goalie_data
+            # Look for goalie statistics rows
+            for cells in self._section_rows_with_cells(soup, 'GOALTENDER SUMMARY', 4):
+                goalie_data = self.extract_goalie_row(cells)
+                if goalie_data:
+                    if goalie_data.get('team') == goalie_stats['home'].get('abbreviation'):
+                        goalie_stats['home'][goalie_data['name']] = goalie_data
+                    else:
+                        goalie_stats['away'][goalie_data['name']] = goalie_data
                                 
         except Exception as e:
             self.logger.debug(f"Error extracting goalie stats: {e}")
@@ -1592,24 +2219,20 @@ def extract_goalie_row(self, cells) -> Optional[Dict[str, Any]]:
             if len(cells) < 4:
                 return None
             
-            name_cell = cells[0].get_text(strip=True)
-            team_cell = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+            texts = [cell.get_text(strip=True) for cell in cells]
+            name_cell, team_cell = texts[0], texts[1]
             
             # Parse name
-            name_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+)', name_cell)
+            name_match = _NAME_RE.search(name_cell)
             if not name_match:
                 return None
             
             name = name_match.group(1)
             
-            # Extract statistics
-            stats = {}
-            for i, cell in enumerate(cells[2:], 2):
-                cell_text = cell.get_text(strip=True)
-                if cell_text.isdigit():
-                    stats[f'stat_{i-2}'] = int(cell_text)
-                else:
-                    stats[f'stat_{i-2}'] = cell_text
+            # Extract statistics, numeric cells as ints under the shared positional keys
+            values = texts[2:]
+            keys = _STAT_KEYS if len(values) <= len(_STAT_KEYS) else [f'stat_{i}' for i in range(len(values))]
+            stats = {key: int(text) if text.isdigit() else text for key, text in zip(keys, values)}
             
             return {
                 'name': name,
@@ -1626,20 +2249,14 @@ def extract_team_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
         team_stats = {'home': {}, 'away': {}}
         
         try:
-            # Look for team statistics tables
-            stat_tables = soup.find_all('table')
-            
-            for table in stat_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
-                        stat_data = self.extract_team_stat_row(cells)
-                        if stat_data:
-                            if stat_data.get('team') == team_stats['home'].get('abbreviation'):
-                                team_stats['home'].update(stat_data['stats'])
-                            else:
-                                team_stats['away'].update(stat_data['stats'])
+            # Look for team statistics rows
+            for cells in self._section_rows_with_cells(soup, 'TEAM STATS', 2):
+                stat_data = self.extract_team_stat_row(cells)
+                if stat_data:
+                    if stat_data.get('team') == team_stats['home'].get('abbreviation'):
+                        team_stats['home'].update(stat_data['stats'])
+                    else:
+                        team_stats['away'].update(stat_data['stats'])
                                 
         except Exception as e:
             self.logger.debug(f"Error extracting team stats: {e}")
@@ -1652,9 +2269,9 @@ def extract_team_stat_row(self, cells) -> Optional[Dict[str, Any]]:
             if len(cells) < 2:
                 return None
             
-            stat_name = cells[0].get_text(strip=True)
-            home_value = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-            away_value = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+            texts = [cell.get_text(strip=True) for cell in cells[:3]]
+            stat_name, home_value = texts[0], texts[1]
+            away_value = texts[2] if len(texts) > 2 else ""
             
             # Convert to appropriate type
             try:
@@ -1673,83 +2290,146 @@ def extract_team_stat_row(self, cells) -> Optional[Dict[str, Any]]:
             self.logger.debug(f"Error extracting team stat row: {e}")
             return None
     
-    def extract_power_play_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract power play information from HTML."""
+    def _document_text(self, soup: BeautifulSoup, tree=None) -> _DocumentText:
+        """
+        Every text node of the document with its parent element.
+        
+        The context extractors each search the same text nodes with a different pattern,
+        so callers scanning one document with several extractors build this once and pass
+        it to each of them, sharing the walk (one compiled XPath query in C when an lxml
+        tree is given) and the parent lookups.
+        
+        Args:
+            soup: BeautifulSoup object of the report
+            tree: Optional lxml.html tree of the same content
+            
+        Returns:
+            The document's text nodes
+        """
+        nodes = []
+        if tree is None:
+            for text in soup.find_all(text=True):
+                parent = text.parent
+                if parent:
+                    nodes.append((text, parent, id(parent)))
+        else:
+            for text in _XPATH['text_nodes'](tree):
+                # A tail string belongs to its element's parent, not the element itself
+                parent = text.getparent()
+                if text.is_tail and parent is not None:
+                    parent = parent.getparent()
+                if parent is not None:
+                    nodes.append((text, parent, parent))
+        
+        return _DocumentText(nodes, tree is not None)
+    
+    def _matching_text_contexts(self, doc_text: _DocumentText,
+                                pattern: re.Pattern) -> List[Tuple[str, str, str, Optional[str]]]:
+        """
+        Context of the parent element of every text node matching pattern, in document order.
+        
+        Each parent's text is read and classified as home/away once per document, however
+        many extractors or matching strings refer to it.
+        
+        Args:
+            doc_text: Text nodes of the report, from _document_text
+            pattern: Compiled pattern searched in each text node
+            
+        Returns:
+            List of (text, parent text, lowercased parent text, side) tuples, where the
+            parent text is unstripped like get_text() and side is 'home', 'away' or None
+        """
+        contexts = doc_text.contexts
+        matches = []
+        for text, parent, key in doc_text.nodes:
+            if pattern.search(text):
+                context = contexts.get(key)
+                if context is None:
+                    parent_text = ''.join(parent.itertext()) if doc_text.is_lxml else parent.get_text()
+                    lowered = parent_text.lower()
+                    side = 'home' if 'home' in lowered else 'away' if 'away' in lowered else None
+                    context = contexts[key] = (parent_text, lowered, side)
+                matches.append((text,) + context)
+        return matches
+    
+    def extract_power_play_info(self, soup: BeautifulSoup, tree=None,
+                                doc_text: Optional[_DocumentText] = None) -> Dict[str, Any]:
+        """Extract power play information from HTML (tree: optional lxml tree for the text scan,
+        doc_text: the document's text nodes when the caller already collected them)."""
         power_plays = {'home': {}, 'away': {}}
         
         try:
-            # Look for power play statistics
-            pp_elements = soup.find_all(text=re.compile(r'power\s*play|pp', re.IGNORECASE))
+            if doc_text is None:
+                doc_text = self._document_text(soup, tree)
             
-            for element in pp_elements:
-                parent = element.parent
-                if parent:
-                    # Look for power play numbers
-                    numbers = re.findall(r'\d+/\d+', parent.get_text())
-                    if numbers:
-                        pp_string = numbers[0]
-                        goals, attempts = map(int, pp_string.split('/'))
-                        
-                        # Determine team from context
-                        if 'home' in parent.get_text().lower():
-                            power_plays['home'] = {'goals': goals, 'attempts': attempts}
-                        elif 'away' in parent.get_text().lower():
-                            power_plays['away'] = {'goals': goals, 'attempts': attempts}
+            # Look for power play statistics
+            for _, parent_text, _, side in self._matching_text_contexts(doc_text, _POWER_PLAY_RE):
+                # Look for power play numbers; most candidates have no '/' at all,
+                # and only the first fraction is used
+                fraction = _FRACTION_RE.search(parent_text) if '/' in parent_text else None
+                if fraction:
+                    pp_string = fraction.group()
+                    goals, attempts = map(int, pp_string.split('/'))
+                    
+                    # Determine team from context
+                    if side:
+                        power_plays[side] = {'goals': goals, 'attempts': attempts}
                             
         except Exception as e:
             self.logger.debug(f"Error extracting power play info: {e}")
         
         return power_plays
     
-    def extract_faceoff_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract faceoff information from HTML."""
+    def extract_faceoff_info(self, soup: BeautifulSoup, tree=None,
+                             doc_text: Optional[_DocumentText] = None) -> Dict[str, Any]:
+        """Extract faceoff information from HTML (tree: optional lxml tree for the text scan,
+        doc_text: the document's text nodes when the caller already collected them)."""
         faceoffs = {'home': {}, 'away': {}}
         
         try:
-            # Look for faceoff statistics
-            fo_elements = soup.find_all(text=re.compile(r'faceoff|face\s*off', re.IGNORECASE))
+            if doc_text is None:
+                doc_text = self._document_text(soup, tree)
             
-            for element in fo_elements:
-                parent = element.parent
-                if parent:
-                    # Look for faceoff numbers
-                    numbers = re.findall(r'\d+/\d+', parent.get_text())
-                    if numbers:
-                        fo_string = numbers[0]
-                        won, total = map(int, fo_string.split('/'))
-                        
-                        # Determine team from context
-                        if 'home' in parent.get_text().lower():
-                            faceoffs['home'] = {'won': won, 'total': total}
-                        elif 'away' in parent.get_text().lower():
-                            faceoffs['away'] = {'won': won, 'total': total}
+            # Look for faceoff statistics
+            for _, parent_text, _, side in self._matching_text_contexts(doc_text, _FACEOFF_RE):
+                # Look for faceoff numbers; most candidates have no '/' at all,
+                # and only the first fraction is used
+                fraction = _FRACTION_RE.search(parent_text) if '/' in parent_text else None
+                if fraction:
+                    fo_string = fraction.group()
+                    won, total = map(int, fo_string.split('/'))
+                    
+                    # Determine team from context
+                    if side:
+                        faceoffs[side] = {'won': won, 'total': total}
                             
         except Exception as e:
             self.logger.debug(f"Error extracting faceoff info: {e}")
         
         return faceoffs
     
-    def extract_shot_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract shot information from HTML."""
+    def extract_shot_info(self, soup: BeautifulSoup, tree=None,
+                          doc_text: Optional[_DocumentText] = None) -> Dict[str, Any]:
+        """Extract shot information from HTML (tree: optional lxml tree for the text scan,
+        doc_text: the document's text nodes when the caller already collected them)."""
         shots = {'home': {}, 'away': {}}
         
         try:
-            # Look for shot statistics
-            shot_elements = soup.find_all(text=re.compile(r'shot|sog|shoot', re.IGNORECASE))
+            if doc_text is None:
+                doc_text = self._document_text(soup, tree)
             
-            for element in shot_elements:
-                parent = element.parent
-                if parent:
-                    # Look for shot numbers
-                    numbers = re.findall(r'\d+', parent.get_text())
-                    if len(numbers) >= 2:
-                        # Assume first two numbers are shots
-                        home_shots = int(numbers[0])
-                        away_shots = int(numbers[1])
-                        
-                        shots['home'] = {'shots': home_shots}
-                        shots['away'] = {'shots': away_shots}
-                        break
+            # Look for shot statistics
+            for _, parent_text, _, _ in self._matching_text_contexts(doc_text, _SHOT_RE):
+                # Look for shot numbers
+                numbers = _DIGITS_RE.findall(parent_text)
+                if len(numbers) >= 2:
+                    # Assume first two numbers are shots
+                    home_shots = int(numbers[0])
+                    away_shots = int(numbers[1])
+                    
+                    shots['home'] = {'shots': home_shots}
+                    shots['away'] = {'shots': away_shots}
+                    break
                         
         except Exception as e:
             self.logger.debug(f"Error extracting shot info: {e}")
@@ -1828,19 +2508,13 @@ def parse_roster_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         try:
             # Extract roster information
-            roster_tables = soup.find_all('table')
-            
-            for table in roster_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 3:
-                        player_data = self.extract_player_roster_data(cells)
-                        if player_data:
-                            if player_data.get('team') == 'home':
-                                data['home_roster'].append(player_data)
-                            else:
-                                data['away_roster'].append(player_data)
+            for cells in self._table_rows_with_cells(soup, 3):
+                player_data = self.extract_player_roster_data(cells)
+                if player_data:
+                    if player_data.get('team') == 'home':
+                        data['home_roster'].append(player_data)
+                    else:
+                        data['away_roster'].append(player_data)
                                 
         except Exception as e:
             self.logger.error(f"Error parsing roster data: {e}")
@@ -1848,7 +2522,8 @@ def parse_roster_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return data
     
-    def parse_event_summary_data(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def parse_event_summary_data(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None,
+                                 tree=None) -> Dict[str, Any]:
         """
         Parse Event Summary (ES) data with detailed player statistics and penalty information.
         Enhanced version with improved BeautifulSoup parsing and comprehensive data extraction.
@@ -1856,6 +2531,7 @@ def parse_event_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
         Args:
             soup: BeautifulSoup object of the HTML content
             file_path: Optional file path for game ID extraction from filename
+            tree: Optional lxml.html tree of the same content, used for the player rows
             
         Returns:
             Dictionary containing all parsed event summary data
@@ -1886,18 +2562,22 @@ def parse_event_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
             }
         }
         
+        # Cell texts are cached for this document only
+        self._text_cache.clear()
+        self._parse_started_at = data['parsing_metadata']['timestamp']
+        
         try:
             # Parse game header (teams, score, date, venue)
             data['game_header'] = self._parse_game_header_enhanced(soup, file_path)
             
             # Store game data and ID for reference data lookup
             self._current_game_data = data['game_header']
-            self._current_game_id = data['game_header'].get('game_info', {}).get('game_id')
+            game_id = data['game_header'].get('game_info', {}).get('game_id')
+            self._current_game_id = int(game_id) if game_id else game_id
             
             # Get team IDs and override team abbreviations/names from boxscore data
-            if self._current_game_id and hasattr(self, 'reference_data'):
-                game_id_int = int(self._current_game_id)
-                boxscore_data = self.reference_data.get_boxscore_by_id(game_id_int)
+            if self._current_game_id and self.reference_data:
+                boxscore_data = self.reference_data.get_boxscore_by_id(self._current_game_id)
                 if boxscore_data:
                     # Set team IDs from boxscore data
                     away_team = boxscore_data.get('awayTeam', {})
@@ -1920,18 +2600,25 @@ def parse_event_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
                     # Update the stored game data with team IDs
                     self._current_game_data = data['game_header']
             
-            # Parse visitor team player statistics with enhanced parsing
-            data['player_statistics']['visitor'] = self._parse_team_player_stats_enhanced(soup, 'visitor')
-            
-            # Parse home team player statistics with enhanced parsing
-            data['player_statistics']['home'] = self._parse_team_player_stats_enhanced(soup, 'home')
-            
-            # Parse team summary statistics
-            data['visitor_team_stats'] = self._parse_team_summary_stats_enhanced(soup, 'visitor')
-            data['home_team_stats'] = self._parse_team_summary_stats_enhanced(soup, 'home')
-            
-            # Parse faceoff summaries
-            data['faceoff_summaries'] = self._parse_faceoff_summaries_enhanced(soup)
+            # Parse each team's player statistics, from the lxml tree when available
+            for team_type in ('visitor', 'home'):
+                players = self._parse_team_player_stats_lxml(tree, team_type) if tree is not None else None
+                if players is None:
+                    players = self._parse_team_player_stats_enhanced(soup, team_type)
+                data['player_statistics'][team_type] = players
+            
+            # Parse team summary statistics, from the lxml tree when available
+            for team_type in ('visitor', 'home'):
+                team_stats = self._parse_team_summary_stats_lxml(tree, team_type) if tree is not None else None
+                if team_stats is None:
+                    team_stats = self._parse_team_summary_stats_enhanced(soup, team_type)
+                data[f'{team_type}_team_stats'] = team_stats
+            
+            # Parse faceoff summaries, from the lxml tree when available
+            faceoff_summaries = self._parse_faceoff_summaries_lxml(tree) if tree is not None else None
+            if faceoff_summaries is None:
+                faceoff_summaries = self._parse_faceoff_summaries_enhanced(soup)
+            data['faceoff_summaries'] = faceoff_summaries
             
             # Compute team summaries (goals, shots, etc.) directly from player stats (authoritative team totals)
             computed_team_summaries = {'visitor': {}, 'home': {}}
@@ -1982,9 +2669,13 @@ def parse_event_summary_data(self, soup: BeautifulSoup, file_path: Optional[str]
             data['parsing_metadata']['success'] = False
             data['parsing_metadata']['errors'].append(str(e))
         
+        # Release the cached cell texts (and with them the document's tags)
+        self._text_cache.clear()
+        self._parse_started_at = None
+        
         return data
     
-    def _parse_game_header_enhanced(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def _parse_game_header_enhanced(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """
         Enhanced game header parsing with better BeautifulSoup usage.
         
@@ -2007,7 +2698,7 @@ def _parse_game_header_enhanced(self, soup: BeautifulSoup, file_path: Optional[s
             # Extract game ID from filename if provided
             if file_path:
                 file_path_str = str(file_path)
-                game_id_match = re.search(r'ES(\d{6})\.HTM', file_path_str)
+                game_id_match = _ES_FILE_RE.search(file_path_str)
                 if game_id_match:
                     header_data['game_info']['game_id'] = f"2024{game_id_match.group(1)}"
             
@@ -2018,22 +2709,24 @@ def _parse_game_header_enhanced(self, soup: BeautifulSoup, file_path: Optional[s
                 team_name_tds = visitor_table.find_all('td')
                 for td in team_name_tds:
                     td_text = td.get_text(strip=True)
-                    if re.search(r'GAME \d+ AWAY GAME \d+', td_text):
-                        team_name_match = re.search(r'^([^\n]+)', td_text)
+                    if _AWAY_GAME_RE.search(td_text):
+                        team_name_match = _FIRST_LINE_RE.search(td_text)
                         if team_name_match:
                             header_data['visitor_team']['name'] = team_name_match.group(1).strip()
                         break
                 
                 # Extract score
-                score_elem = visitor_table.find('td', style=re.compile(r'font-size: 40px'))
+                score_elem = visitor_table.find('td', style=_SCORE_STYLE_RE)
                 if score_elem:
-                    header_data['visitor_team']['score'] = int(score_elem.get_text(strip=True))
+                    score = self._parse_score(score_elem.get_text(strip=True))
+                    if score is not None:
+                        header_data['visitor_team']['score'] = score
                 
                 # Extract team logo/abbreviation from image src
-                logo_img = visitor_table.find('img', src=re.compile(r'logoc'))
+                logo_img = visitor_table.find('img', src=_LOGO_RE)
                 if logo_img:
                     logo_src = logo_img.get('src', '')
-                    abbrev_match = re.search(r'logoc([a-z]+)', logo_src)
+                    abbrev_match = _LOGO_SRC_RE.search(logo_src)
                     if abbrev_match:
                         header_data['visitor_team']['abbreviation'] = abbrev_match.group(1).upper()
             
@@ -2044,22 +2737,24 @@ def _parse_game_header_enhanced(self, soup: BeautifulSoup, file_path: Optional[s
                 team_name_tds = home_table.find_all('td')
                 for td in team_name_tds:
                     td_text = td.get_text(strip=True)
-                    if re.search(r'GAME \d+ HOME GAME \d+', td_text):
-                        team_name_match = re.search(r'^([^\n]+)', td_text)
+                    if _HOME_GAME_RE.search(td_text):
+                        team_name_match = _FIRST_LINE_RE.search(td_text)
                         if team_name_match:
                             header_data['home_team']['name'] = team_name_match.group(1).strip()
                         break
                 
                 # Extract score
-                score_elem = home_table.find('td', style=re.compile(r'font-size: 40px'))
+                score_elem = home_table.find('td', style=_SCORE_STYLE_RE)
                 if score_elem:
-                    header_data['home_team']['score'] = int(score_elem.get_text(strip=True))
+                    score = self._parse_score(score_elem.get_text(strip=True))
+                    if score is not None:
+                        header_data['home_team']['score'] = score
                 
                 # Extract team logo/abbreviation from image src
-                logo_img = home_table.find('img', src=re.compile(r'logoc'))
+                logo_img = home_table.find('img', src=_LOGO_RE)
                 if logo_img:
                     logo_src = logo_img.get('src', '')
-                    abbrev_match = re.search(r'logoc([a-z]+)', logo_src)
+                    abbrev_match = _LOGO_SRC_RE.search(logo_src)
                     if abbrev_match:
                         header_data['home_team']['abbreviation'] = abbrev_match.group(1).upper()
             
@@ -2099,6 +2794,7 @@ def _parse_team_player_stats_enhanced(self, soup: BeautifulSoup, team_type: str)
             List of player statistics dictionaries
         """
         players = []
+        seen = set()  # (sweater_number, name) of players already added
         
         try:
             # Find the team-specific section using BeautifulSoup selectors
@@ -2118,56 +2814,37 @@ def _parse_team_player_stats_enhanced(self, soup: BeautifulSoup, team_type: str)
                 self.logger.warning(f"Could not find {team_type} team table")
                 return players
             
-            # Find all rows in the table
-            all_rows = team_table.find_all('tr')
-            
-            # Find the index of the current team's section heading
-            team_section_row = None
-            for i, row in enumerate(all_rows):
-                if team_section in row.find_all('td'):
-                    team_section_row = i
-                    break
-            
-            if team_section_row is None:
-                self.logger.warning(f"Could not find {team_type} team section row")
-                return players
-            
-            # Find the next team's section heading to know where to stop
-            next_team_section_row = None
-            for i in range(team_section_row + 1, len(all_rows)):
-                row = all_rows[i]
-                # Look for the other team's section heading
-                other_team_class = 'homesectionheading' if team_type == 'visitor' else 'visitorsectionheading'
+            # Single pass over the table rows: skip to this team's heading row, then
+            # collect player rows until the other team's heading
+            heading_row = team_section.find_parent('tr')
+            other_team_class = 'homesectionheading' if team_type == 'visitor' else 'visitorsectionheading'
+            in_section = False
+            player_rows = []
+            for row in team_table.find_all('tr'):
+                if not in_section:
+                    in_section = row is heading_row
+                    continue
                 if row.find('td', class_=other_team_class):
-                    next_team_section_row = i
                     break
-            
-            # If no next team found, use the end of the table
-            if next_team_section_row is None:
-                next_team_section_row = len(all_rows)
-            
-            # Extract player rows only from this team's section
-            player_rows = []
-            for i in range(team_section_row + 1, next_team_section_row):
-                row = all_rows[i]
                 cells = row.find_all('td')
                 if len(cells) >= 25:  # Player stats tables have 25+ columns
-                    first_cell_text = cells[0].get_text(strip=True)
-                    if re.match(r'^\d+$', first_cell_text):  # First cell is a sweater number
+                    first_cell_text = self._cached_text(cells[0])
+                    if first_cell_text.isdigit():  # First cell is a sweater number
                         player_rows.append(cells)
             
-            # Process each player row
+            if not in_section:
+                self.logger.warning(f"Could not find {team_type} team section row")
+                return players
+            
+            # Process each player row, resolving the team's reference IDs once
+            team_ref = self._team_reference(team_type)
             for cells in player_rows:
-                player_stats = self._extract_player_stats_from_row_enhanced(cells, team_type)
+                player_stats = self._extract_player_stats_from_row_enhanced(cells, team_type, team_ref)
                 if player_stats:
                     # Check for duplicates
-                    is_duplicate = any(
-                        existing.get('sweater_number') == player_stats.get('sweater_number') and
-                        existing.get('name') == player_stats.get('name')
-                        for existing in players
-                    )
-                    
-                    if not is_duplicate:
+                    key = (player_stats.get('sweater_number'), player_stats.get('name'))
+                    if key not in seen:
+                        seen.add(key)
                         players.append(player_stats)
             
         except Exception as e:
@@ -2175,38 +2852,141 @@ def _parse_team_player_stats_enhanced(self, soup: BeautifulSoup, team_type: str)
         
         return players
     
-    def _extract_player_stats_from_row_enhanced(self, cells: List, team_type: str) -> Dict[str, Any]:
+    def _parse_team_player_stats_lxml(self, tree, team_type: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        lxml version of _parse_team_player_stats_enhanced.
+        
+        The section headings come from one compiled XPath query and cell texts are read
+        with itertext() in C instead of BeautifulSoup's Python-level get_text().
+        
+        Args:
+            tree: lxml.html tree of the Event Summary report
+            team_type: 'visitor' or 'home'
+            
+        Returns:
+            List of player statistics dictionaries, or None if the XPath pass fails
+        """
+        players = []
+        seen = set()  # (sweater_number, name) of players already added
+        other_team_type = 'home' if team_type == 'visitor' else 'visitor'
+        
+        try:
+            headings = _XPATH[f'{team_type}_section_heading'](tree)
+            if not headings:
+                self.logger.warning(f"Could not find {team_type} team section")
+                return players
+            
+            # Same lookups as the BeautifulSoup version: the heading's table and row
+            team_section = headings[0]
+            team_table = next(team_section.iterancestors('table'), None)
+            if team_table is None:
+                self.logger.warning(f"Could not find {team_type} team table")
+                return players
+            heading_row = next(team_section.iterancestors('tr'), None)
+            
+            # Rows holding the other team's heading end this team's section
+            stop_rows = {row for heading in _XPATH[f'{other_team_type}_section_heading'](tree)
+                         for row in heading.iterancestors('tr')}
+            
+            in_section = False
+            player_texts = []
+            for row in _XPATH['rows'](team_table):
+                if not in_section:
+                    in_section = row is heading_row
+                    continue
+                if row in stop_rows:
+                    break
+                cells = _XPATH['cells'](row)
+                if len(cells) >= 25:  # Player stats tables have 25+ columns
+                    first_cell_text = self._lxml_text(cells[0])
+                    if first_cell_text.isdigit():  # First cell is a sweater number
+                        player_texts.append([first_cell_text] + [self._lxml_text(cell) for cell in cells[1:25]])
+            
+            if not in_section:
+                self.logger.warning(f"Could not find {team_type} team section row")
+                return players
+            
+            team_ref = self._team_reference(team_type)
+            for texts in player_texts:
+                player_stats = self._player_stats_from_texts(texts, team_type, team_ref)
+                if player_stats:
+                    key = (player_stats.get('sweater_number'), player_stats.get('name'))
+                    if key not in seen:
+                        seen.add(key)
+                        players.append(player_stats)
+        
+        except Exception as e:
+            self.logger.debug(f"XPath {team_type} player stats failed, falling back to BeautifulSoup: {e}")
+            return None
+        
+        return players
+    
+    def _extract_player_stats_from_row_enhanced(self, cells: List, team_type: str,
+                                                team_ref: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Dict[str, Any]:
         """
         Enhanced player statistics extraction with better BeautifulSoup usage and comprehensive data validation.
         
         Args:
             cells: List of BeautifulSoup td elements
             team_type: 'visitor' or 'home'
+            team_ref: (team_id, game_id) from _team_reference, or None to resolve it for this row
             
         Returns:
             Dictionary with player statistics
         """
-        try:
-            # Validate input
-            if not isinstance(cells, list) or len(cells) < 25:
-                return None
+        # Validate input
+        if not isinstance(cells, list) or len(cells) < 25:
+            return None
+        
+        return self._player_stats_from_texts([self._cached_text(cell) for cell in cells[:25]], team_type, team_ref)
+    
+    def _team_reference(self, team_type: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Reference-data IDs shared by every player row of a team in the current game.
+        
+        Args:
+            team_type: 'visitor' or 'home'
             
+        Returns:
+            (team_id, game_id) tuple; either is None when the current game does not provide it
+        """
+        team_id = None
+        if self._current_game_data:
+            if team_type == 'visitor':
+                team_id = self._current_game_data.get('visitor_team', {}).get('id')
+            else:
+                team_id = self._current_game_data.get('home_team', {}).get('id')
+        
+        game_id = self._current_game_id
+        return team_id, int(game_id) if game_id else None
+    
+    def _player_stats_from_texts(self, texts: List[str], team_type: str,
+                                 team_ref: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Build a player's statistics from the stripped texts of an ES player row.
+        
+        Shared by the BeautifulSoup row extractor and the lxml fast path.
+        
+        Args:
+            texts: Stripped texts of the row's first 25 td cells
+            team_type: 'visitor' or 'home'
+            team_ref: (team_id, game_id) from _team_reference, or None to resolve it for this row
+            
+        Returns:
+            Dictionary with player statistics, or None if the row is not a player row
+        """
+        try:
             # Extract basic player info with validation
-            sweater_text = cells[0].get_text(strip=True)
-            if not re.match(r'^\d+$', sweater_text):
+            sweater_text = texts[0]
+            if not sweater_text.isdigit():
                 return None
             
             sweater_number = int(sweater_text)
-            position = cells[1].get_text(strip=True)
-            player_name = cells[2].get_text(strip=True)
+            position = texts[1]
+            player_name = texts[2]
             
-            # Get team ID from game header data
-            team_id = None
-            if hasattr(self, '_current_game_data') and self._current_game_data:
-                if team_type == 'visitor':
-                    team_id = self._current_game_data.get('visitor_team', {}).get('id')
-                else:
-                    team_id = self._current_game_data.get('home_team', {}).get('id')
+            # Team and game IDs from the game header data
+            team_id, game_id = team_ref if team_ref is not None else self._team_reference(team_type)
             
             # Use reference data to get player ID and full name
             player_id = None
@@ -2215,128 +2995,83 @@ def _extract_player_stats_from_row_enhanced(self, cells: List, team_type: str) -
                 resolved_name = self._resolve_player_name(team_id, sweater_number, player_name)
                 
                 # Get player ID from reference data
-                game_id_int = int(self._current_game_id) if hasattr(self, '_current_game_id') and self._current_game_id else None
-                boxscore_data = self.reference_data.get_boxscore_by_id(game_id_int) if game_id_int else None
-                if boxscore_data:
+                if game_id:
                     team_key = 'awayTeam' if team_type == 'visitor' else 'homeTeam'
-                    player_stats = boxscore_data.get('playerByGameStats', {}).get(team_key, {})
-                    for player_type in ['forwards', 'defense', 'goalies']:
-                        for player in player_stats.get(player_type, []):
-                            if player.get('sweaterNumber') == sweater_number:
-                                player_id = player.get('playerId')
-                                break
-                        if player_id:
-                            break
-            
-            # Extract statistics with enhanced validation
-            goals = self._safe_int_enhanced(cells[3].get_text(strip=True))
-            assists = self._safe_int_enhanced(cells[4].get_text(strip=True))
-            points = self._safe_int_enhanced(cells[5].get_text(strip=True))
-            plus_minus = self._safe_int_enhanced(cells[6].get_text(strip=True))
-            penalty_number = self._safe_int_enhanced(cells[7].get_text(strip=True))
-            penalty_minutes = self._safe_int_enhanced(cells[8].get_text(strip=True))
-            
-            # Time on Ice data with better parsing
-            toi_total = self._parse_time_string(cells[9].get_text(strip=True))
-            shifts = self._safe_int_enhanced(cells[10].get_text(strip=True))
-            avg_shift = self._parse_time_string(cells[11].get_text(strip=True))
-            toi_pp = self._parse_time_string(cells[12].get_text(strip=True))
-            toi_sh = self._parse_time_string(cells[13].get_text(strip=True))
-            toi_ev = self._parse_time_string(cells[14].get_text(strip=True))
-            
-            # Additional stats with validation
-            shots = self._safe_int_enhanced(cells[15].get_text(strip=True))
-            attempts_blocked = self._safe_int_enhanced(cells[16].get_text(strip=True))
-            missed_shots = self._safe_int_enhanced(cells[17].get_text(strip=True))
-            hits = self._safe_int_enhanced(cells[18].get_text(strip=True))
-            giveaways = self._safe_int_enhanced(cells[19].get_text(strip=True))
-            takeaways = self._safe_int_enhanced(cells[20].get_text(strip=True))
-            blocked_shots = self._safe_int_enhanced(cells[21].get_text(strip=True))
-            faceoffs_won = self._safe_int_enhanced(cells[22].get_text(strip=True))
-            faceoffs_lost = self._safe_int_enhanced(cells[23].get_text(strip=True))
-            faceoff_percentage = self._safe_float_enhanced(cells[24].get_text(strip=True))
+                    player_id = self._get_player_id(game_id, team_key, sweater_number)
             
-            return {
+            player_stats = {
                 'player_id': player_id,
                 'sweater_number': sweater_number,
                 'position': position,
                 'name': resolved_name,
                 'original_name': player_name,
                 'team_id': team_id,
-                'team_type': team_type,
-                'goals': goals,
-                'assists': assists,
-                'points': points,
-                'plus_minus': plus_minus,
-                'penalty_number': penalty_number,
-                'penalty_minutes': penalty_minutes,
-                'time_on_ice': {
-                    'total': toi_total,
-                    'shifts': shifts,
-                    'avg_shift': avg_shift,
-                    'power_play': toi_pp,
-                    'short_handed': toi_sh,
-                    'even_strength': toi_ev
-                },
-                'shots': shots,
-                'attempts_blocked': attempts_blocked,
-                'missed_shots': missed_shots,
-                'hits': hits,
-                'giveaways': giveaways,
-                'takeaways': takeaways,
-                'blocked_shots': blocked_shots,
-                'faceoffs_won': faceoffs_won,
-                'faceoffs_lost': faceoffs_lost,
-                'faceoff_percentage': faceoff_percentage,
-                'parsing_metadata': {
-                    'extracted_at': datetime.now().isoformat(),
-                    'data_quality': self._assess_player_data_quality(goals, assists, points, plus_minus)
-                }
+                'team_type': team_type
+            }
+            # Statistics columns with enhanced validation, driven by the ES column schema
+            player_stats.update(self._es_stat_columns(texts, {
+                'int': self._safe_int_enhanced,
+                'float': self._safe_float_enhanced,
+                'time': self._parse_time_string
+            }))
+            player_stats['parsing_metadata'] = {
+                'extracted_at': self._parse_started_at or datetime.now().isoformat(),
+                'data_quality': self._assess_player_data_quality(
+                    player_stats['goals'], player_stats['assists'], player_stats['points'], player_stats['plus_minus'])
             }
+            return player_stats
             
         except Exception as e:
             self.logger.error(f"Error extracting enhanced player stats from row: {e}")
             return None
     
+    @staticmethod
+    def _es_stat_columns(texts: List[str], parsers: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse an ES player row's statistics columns as laid out in _ES_PLAYER_COLUMNS.
+        
+        Args:
+            texts: Stripped texts of the row's first 25 td cells
+            parsers: Parser for each column kind ('int', 'float', 'time')
+            
+        Returns:
+            Statistics keyed by column name, with grouped columns nested under their group
+        """
+        stats = {}
+        for group, key, index, kind in _ES_PLAYER_COLUMNS:
+            value = parsers[kind](texts[index])
+            if group is None:
+                stats[key] = value
+            else:
+                stats.setdefault(group, {})[key] = value
+        return stats
+    
     def _safe_int_enhanced(self, text: str) -> int:
-        """Enhanced integer parsing with better error handling."""
-        if not text or text.strip() == '' or text.strip() == '&nbsp;':
-            return 0
+        """
+        Enhanced integer parsing for cell text that is already stripped.
         
-        # Clean the text
-        cleaned_text = text.strip().replace('&nbsp;', '').replace('+', '')
+        Entities such as &nbsp; are decoded by the parser and stripped as whitespace,
+        and a leading '+' never becomes part of the match, so the regex is run on
+        the text as given.
+        """
+        if not text:
+            return 0
         
-        # Use regex to extract numeric value
-        match = re.search(r'-?\d+', cleaned_text)
-        if match:
-            return int(match.group())
-        return 0
+        match = _SIGNED_INT_RE.search(text)
+        return int(match.group()) if match else 0
     
     def _safe_float_enhanced(self, text: str) -> float:
-        """Enhanced float parsing with better error handling."""
-        if not text or text.strip() == '' or text.strip() == '&nbsp;':
+        """Enhanced float parsing for cell text that is already stripped."""
+        if not text:
             return 0.0
         
-        # Clean the text
-        cleaned_text = text.strip().replace('&nbsp;', '').replace('%', '')
-        
-        # Use regex to extract numeric value
-        match = re.search(r'-?\d+\.?\d*', cleaned_text)
-        if match:
-            return float(match.group())
-        return 0.0
+        match = _SIGNED_FLOAT_RE.search(text)
+        return float(match.group()) if match else 0.0
     
     def _parse_time_string(self, time_str: str) -> str:
-        """Parse time string and return in consistent format."""
-        if not time_str or time_str.strip() == '' or time_str.strip() == '&nbsp;':
-            return '00:00'
-        
-        # Clean the time string
-        cleaned_time = time_str.strip().replace('&nbsp;', '')
-        
-        # Validate time format (MM:SS)
-        if re.match(r'^\d{1,2}:\d{2}$', cleaned_time):
-            return cleaned_time
+        """Parse stripped time text and return it if it is in MM:SS format."""
+        if time_str and _CLOCK_RE.match(time_str):
+            return time_str
         
         return '00:00'
     
@@ -2364,7 +3099,7 @@ def _parse_team_summary_stats_enhanced(self, soup: BeautifulSoup, team_type: str
         
         try:
             # Find team summary section
-            team_section = soup.find('td', class_=re.compile(r'visitorsectionheading|homesectionheading'))
+            team_section = soup.find('td', class_=_SECTION_HEADING_CLASS_RE)
             if not team_section:
                 return team_stats
             
@@ -2378,36 +3113,83 @@ def _parse_team_summary_stats_enhanced(self, soup: BeautifulSoup, team_type: str
                 cells = row.find_all('td')
                 if len(cells) >= 10 and len(cells) < 25:  # Team summary rows have fewer columns
                     # Check if this is a team summary row
-                    first_cell_text = cells[0].get_text(strip=True)
-                    if not re.match(r'^\d+$', first_cell_text):  # Not a player row
+                    first_cell_text = self._cached_text(cells[0])
+                    if not first_cell_text.isdigit():  # Not a player row
                         # This might be a team summary row
                         team_stats = self._extract_team_summary_from_row(cells, team_type)
                         break
             
         except Exception as e:
-            self.logger.error(f"Error parsing enhanced team summary stats for {team_type}: {e}")
+            self.logger.error(f"Error parsing enhanced team summary stats for {team_type}: {e}")
+        
+        return team_stats
+    
+    def _parse_team_summary_stats_lxml(self, tree, team_type: str) -> Optional[Dict[str, Any]]:
+        """
+        lxml version of _parse_team_summary_stats_enhanced.
+        
+        Args:
+            tree: lxml.html tree of the Event Summary report
+            team_type: 'visitor' or 'home'
+            
+        Returns:
+            Dictionary containing team summary statistics, or None if the XPath pass fails
+        """
+        try:
+            # First section heading in the document, as in the BeautifulSoup version
+            headings = _XPATH['section_heading'](tree)
+            if not headings:
+                return {}
+            
+            team_table = next(headings[0].iterancestors('table'), None)
+            if team_table is None:
+                return {}
+            
+            # Look for team summary rows (typically have fewer columns than player rows)
+            for row in _XPATH['rows'](team_table):
+                cells = _XPATH['cells'](row)
+                if 10 <= len(cells) < 25 and not self._lxml_text(cells[0]).isdigit():
+                    return self._team_summary_from_texts([self._lxml_text(cell) for cell in cells], team_type)
+        
+        except Exception as e:
+            self.logger.debug(f"XPath {team_type} team summary failed, falling back to BeautifulSoup: {e}")
+            return None
         
-        return team_stats
+        return {}
     
     def _extract_team_summary_from_row(self, cells: List, team_type: str) -> Dict[str, Any]:
         """Extract team summary statistics from a table row."""
-        try:
-            if len(cells) < 10:
-                return {}
+        if len(cells) < 10:
+            return {}
+        return self._team_summary_from_texts([self._cached_text(cell) for cell in cells], team_type)
+    
+    def _team_summary_from_texts(self, texts: List[str], team_type: str) -> Dict[str, Any]:
+        """
+        Build team summary statistics from a summary row's stripped cell texts.
+        
+        Args:
+            texts: Cell texts of a row with at least 10 cells
+            team_type: 'visitor' or 'home'
             
+        Returns:
+            Dictionary with team summary statistics
+        """
+        try:
+            safe_int = self._safe_int_enhanced
+            n = len(texts)
             return {
                 'team_type': team_type,
-                'goals': self._safe_int_enhanced(cells[3].get_text(strip=True)) if len(cells) > 3 else 0,
-                'assists': self._safe_int_enhanced(cells[4].get_text(strip=True)) if len(cells) > 4 else 0,
-                'points': self._safe_int_enhanced(cells[5].get_text(strip=True)) if len(cells) > 5 else 0,
-                'plus_minus': self._safe_int_enhanced(cells[6].get_text(strip=True)) if len(cells) > 6 else 0,
-                'penalty_minutes': self._safe_int_enhanced(cells[8].get_text(strip=True)) if len(cells) > 8 else 0,
-                'shots': self._safe_int_enhanced(cells[15].get_text(strip=True)) if len(cells) > 15 else 0,
-                'hits': self._safe_int_enhanced(cells[18].get_text(strip=True)) if len(cells) > 18 else 0,
-                'blocked_shots': self._safe_int_enhanced(cells[21].get_text(strip=True)) if len(cells) > 21 else 0,
-                'faceoffs_won': self._safe_int_enhanced(cells[22].get_text(strip=True)) if len(cells) > 22 else 0,
-                'faceoffs_lost': self._safe_int_enhanced(cells[23].get_text(strip=True)) if len(cells) > 23 else 0,
-                'faceoff_percentage': self._safe_float_enhanced(cells[24].get_text(strip=True)) if len(cells) > 24 else 0.0
+                'goals': safe_int(texts[3]),
+                'assists': safe_int(texts[4]),
+                'points': safe_int(texts[5]),
+                'plus_minus': safe_int(texts[6]),
+                'penalty_minutes': safe_int(texts[8]),
+                'shots': safe_int(texts[15]) if n > 15 else 0,
+                'hits': safe_int(texts[18]) if n > 18 else 0,
+                'blocked_shots': safe_int(texts[21]) if n > 21 else 0,
+                'faceoffs_won': safe_int(texts[22]) if n > 22 else 0,
+                'faceoffs_lost': safe_int(texts[23]) if n > 23 else 0,
+                'faceoff_percentage': self._safe_float_enhanced(texts[24]) if n > 24 else 0.0
             }
         except Exception as e:
             self.logger.error(f"Error extracting team summary from row: {e}")
@@ -2433,7 +3215,7 @@ def _parse_faceoff_summaries_enhanced(self, soup: BeautifulSoup) -> Dict[str, An
             faceoff_section = None
             all_tds = soup.find_all('td')
             for td in all_tds:
-                if re.search(r'face-?off\s+summary', td.get_text(strip=True), re.IGNORECASE):
+                if _FACEOFF_SUMMARY_RE.search(td.get_text(strip=True)):
                     faceoff_section = td
                     break
             
@@ -2446,7 +3228,7 @@ def _parse_faceoff_summaries_enhanced(self, soup: BeautifulSoup) -> Dict[str, An
                 return faceoff_data
             
             # Parse faceoff data for both teams
-            faceoff_rows = faceoff_table.find_all('tr', class_=re.compile(r'oddColor|evenColor', re.IGNORECASE))
+            faceoff_rows = faceoff_table.find_all('tr', class_=_ROW_COLOR_RE)
             
             for i, row in enumerate(faceoff_rows):
                 cells = row.find_all('td')
@@ -2465,6 +3247,63 @@ def _parse_faceoff_summaries_enhanced(self, soup: BeautifulSoup) -> Dict[str, An
         
         return faceoff_data
     
+    def _parse_faceoff_summaries_lxml(self, tree) -> Optional[Dict[str, Any]]:
+        """
+        lxml version of _parse_faceoff_summaries_enhanced.
+        
+        The BeautifulSoup version writes every colored row after the first to 'home', so
+        only the first row and the last row with four cells decide the result; the rows in
+        between are not parsed.
+        
+        Args:
+            tree: lxml.html tree of the Event Summary report
+            
+        Returns:
+            Dictionary containing faceoff summaries for both teams, or None if the XPath pass fails
+        """
+        faceoff_data = {
+            'visitor': {},
+            'home': {}
+        }
+        
+        try:
+            faceoff_section = next((td for td in tree.iter('td')
+                                    if _FACEOFF_SUMMARY_RE.search(self._lxml_text(td))), None)
+            if faceoff_section is None:
+                return faceoff_data
+            
+            faceoff_table = next(faceoff_section.iterancestors('table'), None)
+            if faceoff_table is None:
+                return faceoff_data
+            
+            faceoff_rows = [row for row in _XPATH['rows'](faceoff_table)
+                            if _ROW_COLOR_RE.search(row.get('class', ''))]
+            
+            def team_faceoffs(cells):
+                texts = [self._lxml_text(cell) for cell in cells[:4]]
+                return {
+                    'even_strength': self._parse_faceoff_string(texts[0]),
+                    'power_play': self._parse_faceoff_string(texts[1]),
+                    'short_handed': self._parse_faceoff_string(texts[2]),
+                    'total': self._parse_faceoff_string(texts[3])
+                }
+            
+            if faceoff_rows:
+                cells = _XPATH['cells'](faceoff_rows[0])
+                if len(cells) >= 4:
+                    faceoff_data['visitor'] = team_faceoffs(cells)
+            for row in reversed(faceoff_rows[1:]):
+                cells = _XPATH['cells'](row)
+                if len(cells) >= 4:
+                    faceoff_data['home'] = team_faceoffs(cells)
+                    break
+        
+        except Exception as e:
+            self.logger.debug(f"XPath faceoff summaries failed, falling back to BeautifulSoup: {e}")
+            return None
+        
+        return faceoff_data
+    
     def _parse_faceoff_string(self, faceoff_str: str) -> Dict[str, Any]:
         """Parse faceoff string like '16-46/35%' into structured data."""
         try:
@@ -2472,7 +3311,7 @@ def _parse_faceoff_string(self, faceoff_str: str) -> Dict[str, Any]:
                 return {'won': 0, 'total': 0, 'percentage': 0.0}
             
             # Parse format like "16-46/35%"
-            match = re.match(r'(\d+)-(\d+)/(\d+)%', faceoff_str.strip())
+            match = _FACEOFF_STRING_RE.match(faceoff_str.strip())
             if match:
                 won = int(match.group(1))
                 total = int(match.group(2))
@@ -2528,7 +3367,7 @@ def _parse_team_summaries_enhanced(self, soup: BeautifulSoup) -> Dict[str, Any]:
                 if len(cells) >= 10:
                     # Check if this is a team summary row
                     first_cell_text = cells[0].get_text(strip=True)
-                    if not re.match(r'^\d+$', first_cell_text):  # Not a player row
+                    if not first_cell_text.isdigit():  # Not a player row
                         # This might be a team summary row
                         team_summary = self._extract_team_summary_from_row(cells, 'unknown')
                         if team_summary:
@@ -2604,6 +3443,7 @@ def _parse_team_player_stats(self, soup: BeautifulSoup, team_type: str) -> List[
             List of player statistics dictionaries
         """
         players = []
+        seen = set()  # (player_id, sweater_number) of players already added
         
         try:
             # Find the team-specific table using the ID attribute to determine team context
@@ -2614,8 +3454,8 @@ def _parse_team_player_stats(self, soup: BeautifulSoup, team_type: str) -> List[
                 self.logger.warning(f"Could not find table with id='{team_table_id}' for {team_type} team")
                 return players
             
-            # Find all tables in the document that contain player data
-            # Look for tables with many columns (25+ columns indicate player stats tables)
+            # The id'd table is the team header, not the player table, so find the table
+            # that contains player data: 25+ columns indicate player stats tables
             all_tables = soup.find_all('table')
             
             for table in all_tables:
@@ -2624,36 +3464,26 @@ def _parse_team_player_stats(self, soup: BeautifulSoup, team_type: str) -> List[
                 if len(rows) < 5:  # Skip small tables
                     continue
                     
-                # Check if any row has 25+ cells (player stats table structure)
-                has_player_rows = False
+                # Collect rows with 25+ cells and a sweater number in the first cell
+                # (player stats table structure); tables without any are skipped
+                player_rows = []
                 for row in rows:
                     cells = row.find_all('td')
-                    if len(cells) >= 25:  # Player stats tables have 25+ columns
-                        first_cell_text = cells[0].get_text(strip=True)
-                        if re.match(r'^\d+$', first_cell_text):  # First cell is a sweater number
-                            has_player_rows = True
-                            break
+                    if len(cells) >= 25 and cells[0].get_text(strip=True).isdigit():
+                        player_rows.append(cells)
                 
-                if has_player_rows:
-                    # This is a player stats table, process it
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 25:  # Ensure we have enough columns for player stats
-                            # Check if first cell contains a sweater number (digit)
-                            first_cell_text = cells[0].get_text(strip=True)
-                            if re.match(r'^\d+$', first_cell_text):  # Regex to match only digits
-                                player_stats = self._extract_player_stats_from_row_bs4(cells, team_type)
-                                if player_stats:
-                                    # Check for duplicates based on player_id and sweater_number
-                                    is_duplicate = False
-                                    for existing_player in players:
-                                        if (existing_player.get('player_id') == player_stats.get('player_id') and 
-                                            existing_player.get('sweater_number') == player_stats.get('sweater_number')):
-                                            is_duplicate = True
-                                            break
-                                    
-                                    if not is_duplicate:
-                                        players.append(player_stats)
+                for cells in player_rows:
+                    player_stats = self._extract_player_stats_from_row_bs4(cells, team_type)
+                    if player_stats:
+                        # Check for duplicates based on player_id and sweater_number
+                        key = (player_stats.get('player_id'), player_stats.get('sweater_number'))
+                        if key not in seen:
+                            seen.add(key)
+                            players.append(player_stats)
+                
+                # The report has a single player stats table; stop once it is found
+                if player_rows:
+                    break
                                 
         except Exception as e:
             self.logger.error(f"Error parsing {team_type} team player stats: {e}")
@@ -2678,16 +3508,19 @@ def _extract_player_stats_from_row_bs4(self, cells: List, team_type: str) -> Dic
                 
             # Extract basic player info using regex for validation
             sweater_text = cells[0].get_text(strip=True)
-            if not re.match(r'^\d+$', sweater_text):
+            if not sweater_text.isdigit():
                 return None
                 
             sweater_number = int(sweater_text)
-            position = cells[1].get_text(strip=True)
-            player_name = cells[2].get_text(strip=True)
+            
+            # Read the row's cell texts in one pass; the length check above guarantees 25 cells
+            texts = [sweater_text] + [cell.get_text(strip=True) for cell in cells[1:25]]
+            position = texts[1]
+            player_name = texts[2]
             
             # Get team ID from game header data
             team_id = None
-            if hasattr(self, '_current_game_data') and self._current_game_data:
+            if self._current_game_data:
                 if team_type == 'visitor':
                     team_id = self._current_game_data.get('visitor_team', {}).get('id')
                 else:
@@ -2701,107 +3534,50 @@ def _extract_player_stats_from_row_bs4(self, cells: List, team_type: str) -> Dic
                 resolved_name = self._resolve_player_name(team_id, sweater_number, player_name)
                 
                 # Get player ID from reference data
-                boxscore_data = self.reference_data.get_boxscore_by_id(self._current_game_id) if hasattr(self, '_current_game_id') else None
-                if boxscore_data:
+                if self._current_game_id:
                     team_key = 'awayTeam' if team_type == 'visitor' else 'homeTeam'
-                    player_stats = boxscore_data.get('playerByGameStats', {}).get(team_key, {})
-                    for player_type in ['forwards', 'defense', 'goalies']:
-                        for player in player_stats.get(player_type, []):
-                            if player.get('sweaterNumber') == sweater_number:
-                                player_id = player.get('playerId')
-                                break
-                        if player_id:
-                            break
-            
-            # Extract statistics using regex for numeric validation
-            goals = self._safe_int_regex(cells[3].get_text(strip=True))
-            assists = self._safe_int_regex(cells[4].get_text(strip=True))
-            points = self._safe_int_regex(cells[5].get_text(strip=True))
-            plus_minus = self._safe_int_regex(cells[6].get_text(strip=True))
-            penalty_number = self._safe_int_regex(cells[7].get_text(strip=True))  # PN
-            penalty_minutes = self._safe_int_regex(cells[8].get_text(strip=True))  # PIM
-            
-            # Time on Ice data
-            toi_total = cells[9].get_text(strip=True)
-            shifts = self._safe_int_regex(cells[10].get_text(strip=True))
-            avg_shift = cells[11].get_text(strip=True)
-            toi_pp = cells[12].get_text(strip=True)
-            toi_sh = cells[13].get_text(strip=True)
-            toi_ev = cells[14].get_text(strip=True)
-            
-            # Additional stats
-            shots = self._safe_int_regex(cells[15].get_text(strip=True))
-            attempts_blocked = self._safe_int_regex(cells[16].get_text(strip=True))
-            missed_shots = self._safe_int_regex(cells[17].get_text(strip=True))
-            hits = self._safe_int_regex(cells[18].get_text(strip=True))
-            giveaways = self._safe_int_regex(cells[19].get_text(strip=True))
-            takeaways = self._safe_int_regex(cells[20].get_text(strip=True))
-            blocked_shots = self._safe_int_regex(cells[21].get_text(strip=True))
-            faceoffs_won = self._safe_int_regex(cells[22].get_text(strip=True))
-            faceoffs_lost = self._safe_int_regex(cells[23].get_text(strip=True))
-            faceoff_percentage = self._safe_float_regex(cells[24].get_text(strip=True))
+                    player_id = self._get_player_id(self._current_game_id, team_key, sweater_number)
             
-            return {
+            player_stats = {
                 'player_id': player_id,
                 'sweater_number': sweater_number,
                 'position': position,
                 'name': resolved_name,
                 'original_name': player_name,
                 'team_id': team_id,
-                'team_type': team_type,
-                'goals': goals,
-                'assists': assists,
-                'points': points,
-                'plus_minus': plus_minus,
-                'penalty_number': penalty_number,
-                'penalty_minutes': penalty_minutes,
-                'time_on_ice': {
-                    'total': toi_total,
-                    'shifts': shifts,
-                    'avg_shift': avg_shift,
-                    'power_play': toi_pp,
-                    'short_handed': toi_sh,
-                    'even_strength': toi_ev
-                },
-                'shots': shots,
-                'attempts_blocked': attempts_blocked,
-                'missed_shots': missed_shots,
-                'hits': hits,
-                'giveaways': giveaways,
-                'takeaways': takeaways,
-                'blocked_shots': blocked_shots,
-                'faceoffs_won': faceoffs_won,
-                'faceoffs_lost': faceoffs_lost,
-                'faceoff_percentage': faceoff_percentage
+                'team_type': team_type
             }
+            # Statistics columns using regex for numeric validation; time cells are kept as text
+            player_stats.update(self._es_stat_columns(texts, {
+                'int': self._safe_int_regex,
+                'float': self._safe_float_regex,
+                'time': str
+            }))
+            return player_stats
             
         except Exception as e:
             self.logger.error(f"Error extracting player stats from row: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            # The traceback is only formatted when debug logging is enabled
+            self.logger.debug("Player stats row traceback", exc_info=True)
             return None
     
     def _safe_int_regex(self, text: str) -> int:
-        """Safely convert text to int using regex to extract numeric values."""
-        if not text or text.strip() == '' or text.strip() == '&nbsp;':
+        """Safely convert stripped text to int using regex to extract numeric values."""
+        if not text:
             return 0
         
         # Use regex to extract numeric value (including negative numbers)
-        match = re.search(r'-?\d+', text.strip())
-        if match:
-            return int(match.group())
-        return 0
+        match = _SIGNED_INT_RE.search(text)
+        return int(match.group()) if match else 0
     
     def _safe_float_regex(self, text: str) -> float:
-        """Safely convert text to float using regex to extract numeric values."""
-        if not text or text.strip() == '' or text.strip() == '&nbsp;':
+        """Safely convert stripped text to float using regex to extract numeric values."""
+        if not text:
             return 0.0
         
         # Use regex to extract numeric value (including decimals and negative numbers)
-        match = re.search(r'-?\d+\.?\d*', text.strip())
-        if match:
-            return float(match.group())
-        return 0.0
+        match = _SIGNED_FLOAT_RE.search(text)
+        return float(match.group()) if match else 0.0
     
     def _extract_player_stats_from_row(self, cells: List, team_type: str) -> Dict[str, Any]:
         """
@@ -2815,14 +3591,17 @@ def _extract_player_stats_from_row(self, cells: List, team_type: str) -> Dict[st
             Dictionary with player statistics
         """
         try:
+            # Read every cell's text once, then index into it
+            texts = [cell.get_text(strip=True) for cell in cells]
+            
             # Extract basic player info
-            sweater_number = int(cells[0].get_text(strip=True))
-            position = cells[1].get_text(strip=True)
-            player_name = cells[2].get_text(strip=True)
+            sweater_number = int(texts[0])
+            position = texts[1]
+            player_name = texts[2]
             
             # Get team ID from game header data
             team_id = None
-            if hasattr(self, '_current_game_data') and self._current_game_data:
+            if self._current_game_data:
                 if team_type == 'visitor':
                     team_id = self._current_game_data.get('visitor_team', {}).get('id')
                 else:
@@ -2836,45 +3615,37 @@ def _extract_player_stats_from_row(self, cells: List, team_type: str) -> Dict[st
                 resolved_name = self._resolve_player_name(team_id, sweater_number, player_name)
                 
                 # Get player ID from reference data
-                boxscore_data = self.reference_data.get_boxscore_by_id(self._current_game_id) if hasattr(self, '_current_game_id') else None
-                if boxscore_data:
+                if self._current_game_id:
                     team_key = 'awayTeam' if team_type == 'visitor' else 'homeTeam'
-                    player_stats = boxscore_data.get('playerByGameStats', {}).get(team_key, {})
-                    for player_type in ['forwards', 'defense', 'goalies']:
-                        for player in player_stats.get(player_type, []):
-                            if player.get('sweaterNumber') == sweater_number:
-                                player_id = player.get('playerId')
-                                break
-                        if player_id:
-                            break
+                    player_id = self._get_player_id(self._current_game_id, team_key, sweater_number)
             
             # Extract statistics (based on ES file structure)
-            goals = self._safe_int(cells[3].get_text(strip=True))
-            assists = self._safe_int(cells[4].get_text(strip=True))
-            points = self._safe_int(cells[5].get_text(strip=True))
-            plus_minus = self._safe_int(cells[6].get_text(strip=True))
-            penalty_number = self._safe_int(cells[7].get_text(strip=True))  # PN
-            penalty_minutes = self._safe_int(cells[8].get_text(strip=True))  # PIM
+            goals = self._safe_int(texts[3])
+            assists = self._safe_int(texts[4])
+            points = self._safe_int(texts[5])
+            plus_minus = self._safe_int(texts[6])
+            penalty_number = self._safe_int(texts[7])  # PN
+            penalty_minutes = self._safe_int(texts[8])  # PIM
             
             # Time on Ice data
-            toi_total = cells[9].get_text(strip=True)
-            shifts = self._safe_int(cells[10].get_text(strip=True))
-            avg_shift = cells[11].get_text(strip=True)
-            toi_pp = cells[12].get_text(strip=True)
-            toi_sh = cells[13].get_text(strip=True)
-            toi_ev = cells[14].get_text(strip=True)
+            toi_total = texts[9]
+            shifts = self._safe_int(texts[10])
+            avg_shift = texts[11]
+            toi_pp = texts[12]
+            toi_sh = texts[13]
+            toi_ev = texts[14]
             
             # Additional stats
-            shots = self._safe_int(cells[15].get_text(strip=True))
-            attempts_blocked = self._safe_int(cells[16].get_text(strip=True))
-            missed_shots = self._safe_int(cells[17].get_text(strip=True))
-            hits = self._safe_int(cells[18].get_text(strip=True))
-            giveaways = self._safe_int(cells[19].get_text(strip=True))
-            takeaways = self._safe_int(cells[20].get_text(strip=True))
-            blocked_shots = self._safe_int(cells[21].get_text(strip=True))
-            faceoffs_won = self._safe_int(cells[22].get_text(strip=True))
-            faceoffs_lost = self._safe_int(cells[23].get_text(strip=True))
-            faceoff_percentage = self._safe_float(cells[24].get_text(strip=True))
+            shots = self._safe_int(texts[15])
+            attempts_blocked = self._safe_int(texts[16])
+            missed_shots = self._safe_int(texts[17])
+            hits = self._safe_int(texts[18])
+            giveaways = self._safe_int(texts[19])
+            takeaways = self._safe_int(texts[20])
+            blocked_shots = self._safe_int(texts[21])
+            faceoffs_won = self._safe_int(texts[22])
+            faceoffs_lost = self._safe_int(texts[23])
+            faceoff_percentage = self._safe_float(texts[24])
             
             return {
                 'player_id': player_id,
@@ -2936,19 +3707,20 @@ def _parse_team_summary_stats(self, soup: BeautifulSoup, team_type: str) -> Dict
     
     def _safe_int(self, value: str) -> int:
         """Safely convert string to integer, returning 0 for empty/invalid values."""
-        if not value or value.strip() == '' or value.strip() == '&nbsp;':
+        if not value:
             return 0
         try:
-            return int(value.strip())
+            # int() ignores surrounding whitespace; blank or '&nbsp;' text raises ValueError
+            return int(value)
         except ValueError:
             return 0
     
     def _safe_float(self, value: str) -> float:
         """Safely convert string to float, returning 0.0 for empty/invalid values."""
-        if not value or value.strip() == '' or value.strip() == '&nbsp;':
+        if not value:
             return 0.0
         try:
-            return float(value.strip())
+            return float(value)
         except ValueError:
             return 0.0
     
@@ -2983,13 +3755,15 @@ def parse_shot_summary_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return data
     
-    def parse_faceoff_summary_data(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def parse_faceoff_summary_data(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None,
+                                   tree=None) -> Dict[str, Any]:
         """
         Parse complete Faceoff Summary (FS) data using BeautifulSoup.
         
         Args:
             soup: BeautifulSoup object of the HTML content
             file_path: Optional file path for game ID extraction from filename
+            tree: Optional lxml.html tree of the same content, used for the PlayerTable rows
             
         Returns:
             Dictionary containing all parsed faceoff summary data
@@ -3016,15 +3790,21 @@ def parse_faceoff_summary_data(self, soup: BeautifulSoup, file_path: Optional[st
             self._current_game_data = data['game_header']
             self._current_game_id = data['game_header'].get('game_info', {}).get('game_id')
             
+            # Walk the document once; the section helpers share the table list
+            tables = soup.find_all('table')
+            
             # Parse faceoff data by period and player
-            data['faceoffs_by_period'] = self._parse_faceoffs_by_period(soup)
+            data['faceoffs_by_period'] = self._parse_faceoffs_by_period(tables)
             
-            # Parse player faceoff statistics
-            data['player_faceoffs']['visitor'] = self._parse_team_faceoff_stats(soup, 'visitor')
-            data['player_faceoffs']['home'] = self._parse_team_faceoff_stats(soup, 'home')
+            # Parse player faceoff statistics, reading the PlayerTable from the lxml tree when available
+            player_rows = self._faceoff_player_rows_lxml(tree) if tree is not None else None
+            if player_rows is None:
+                player_table = next((table for table in tables if table.get('id') == 'PlayerTable'), None)
+                player_rows = self._faceoff_player_rows(player_table)
+            data['player_faceoffs'] = self._parse_player_faceoffs(player_rows)
             
             # Parse team totals
-            data['team_totals'] = self._parse_faceoff_team_totals(soup)
+            data['team_totals'] = self._parse_faceoff_team_totals(tables)
             
         except Exception as e:
             self.logger.error(f"Error parsing faceoff summary data: {e}")
@@ -3032,12 +3812,12 @@ def parse_faceoff_summary_data(self, soup: BeautifulSoup, file_path: Optional[st
         
         return data
     
-    def _parse_faceoffs_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _parse_faceoffs_by_period(self, tables: List) -> Dict[str, Any]:
         """
         Parse faceoff data organized by period.
         
         Args:
-            soup: BeautifulSoup object of the HTML content
+            tables: All table elements of the report, in document order
             
         Returns:
             Dictionary with faceoff data by period
@@ -3046,8 +3826,6 @@ def _parse_faceoffs_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         try:
             # Look for tables with faceoff data
-            tables = soup.find_all('table')
-            
             for table in tables:
                 rows = table.find_all('tr')
                 for row in rows:
@@ -3066,141 +3844,182 @@ def _parse_faceoffs_by_period(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return faceoffs_by_period
     
-    def _parse_team_faceoff_stats(self, soup: BeautifulSoup, team_type: str) -> List[Dict[str, Any]]:
+    def _faceoff_player_rows(self, player_table) -> List[Tuple[bool, int, List[str]]]:
         """
-        Parse faceoff statistics for a specific team.
+        Reduce the FS PlayerTable to what _parse_player_faceoffs reads from each row.
         
         Args:
-            soup: BeautifulSoup object of the HTML content
-            team_type: 'visitor' or 'home'
+            player_table: The PlayerTable element, or None
             
         Returns:
-            List of player faceoff statistics
+            (is team heading, td count, stripped texts of the first five tds) per row with cells;
+            heading rows and the concatenated-data row carry no texts
         """
-        players = []
+        rows = []
+        if not player_table:
+            return rows
+        
+        for row in player_table.find_all('tr'):
+            cells = row.find_all('td')
+            if not cells:
+                continue
+            # Prefer detecting team headers via class
+            is_team_heading = any('teamHeading' in cls for cls in (cells[0].get('class') or []))
+            texts = [] if is_team_heading or len(cells) > 100 else [cell.get_text(strip=True) for cell in cells[:5]]
+            rows.append((is_team_heading, len(cells), texts))
+        return rows
+    
+    def _faceoff_player_rows_lxml(self, tree) -> Optional[List[Tuple[bool, int, List[str]]]]:
+        """
+        lxml version of _faceoff_player_rows.
         
+        Args:
+            tree: lxml.html tree of the Faceoff Summary report
+            
+        Returns:
+            Same rows as _faceoff_player_rows, or None if the XPath pass fails
+        """
         try:
-            # Find the PlayerTable which contains detailed faceoff data
-            player_table = soup.find('table', id='PlayerTable')
-            if not player_table:
-                return players
+            player_table = next(iter(_XPATH['PlayerTable'](tree)), None)
+            rows = []
+            if player_table is None:
+                return rows
+            
+            for row in player_table.iter('tr'):
+                cells = list(row.iter('td'))
+                if not cells:
+                    continue
+                is_team_heading = any('teamHeading' in cls for cls in (cells[0].get('class') or '').split())
+                texts = [] if is_team_heading or len(cells) > 100 else [self._lxml_text(cell) for cell in cells[:5]]
+                rows.append((is_team_heading, len(cells), texts))
+            return rows
+        except Exception as e:
+            self.logger.debug(f"lxml FS player table pass failed, falling back to BeautifulSoup: {e}")
+            return None
+    
+    def _parse_player_faceoffs(self, rows: List[Tuple[bool, int, List[str]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parse player faceoff statistics for both teams in one pass over the PlayerTable.
+        
+        Args:
+            rows: PlayerTable rows as built by _faceoff_player_rows or _faceoff_player_rows_lxml
             
+        Returns:
+            Dictionary with 'visitor' and 'home' lists of player faceoff statistics
+        """
+        players = {
+            'visitor': [],
+            'home': []
+        }
+        
+        try:
             # Look for player headers and their associated faceoff data
-            rows = player_table.find_all('tr')
             current_player = None
-            current_team = None
+            team_type = None
             team_header_count = 0
             
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 1:
-                    # Prefer detecting team headers via class
-                    cell_classes = cells[0].get('class') or []
-                    if any('teamHeading' in cls for cls in cell_classes):
-                        current_team = 'visitor' if team_header_count == 0 else 'home'
-                        team_header_count += 1
-                        continue
-                    
-                    cell_text = cells[0].get_text(strip=True)
-                    
-                    # Skip the first row which contains concatenated data (has many cells)
-                    if len(cells) > 100:
-                        continue
+            for is_team_heading, cell_count, texts in rows:
+                if is_team_heading:
+                    heading_team = 'visitor' if team_header_count == 0 else 'home'
+                    team_header_count += 1
+                    # A player's rows never carry over into the other team's section
+                    if heading_team != team_type:
+                        team_type = heading_team
+                        current_player = None
+                    continue
+                
+                # Skip the first row which contains concatenated data (has many cells)
+                if cell_count > 100:
+                    continue
+                
+                # Rows ahead of the first team heading belong to neither team
+                if team_type is None:
+                    continue
+                
+                cell_text = texts[0]
+                
+                # Check if this is a player header (e.g., "13 C HISCHIER, NICO")
+                # Look for pattern like "13 C HISCHIER, NICO" (sweater number, position, name)
+                # Player headers are typically single-cell rows
+                player_match = _FACEOFF_PLAYER_RE.search(cell_text) if cell_count == 1 else None
+                if player_match:
+                    sweater_number = int(player_match.group(1))
+                    position = player_match.group(2)
+                    player_name = player_match.group(3).strip()
                     
-                    # Only process players for the requested team
-                    if current_team != team_type:
-                        continue
+                    # Get team ID from game header data
+                    team_id = None
+                    if self._current_game_data:
+                        if team_type == 'visitor':
+                            team_id = self._current_game_data.get('visitor_team', {}).get('id')
+                        else:
+                            team_id = self._current_game_data.get('home_team', {}).get('id')
                     
-                    # Check if this is a player header (e.g., "13 C HISCHIER, NICO")
-                    # Look for pattern like "13 C HISCHIER, NICO" (sweater number, position, name)
-                    player_match = re.search(r'(\d+)\s+([A-Z])\s+([A-Z\s,]+)', cell_text)
-                    if player_match and len(cells) == 1:  # Player headers are typically single-cell rows
-                        sweater_number = int(player_match.group(1))
-                        position = player_match.group(2)
-                        player_name = player_match.group(3).strip()
-                        
-                        # Get team ID from game header data
-                        team_id = None
-                        if hasattr(self, '_current_game_data') and self._current_game_data:
-                            if team_type == 'visitor':
-                                team_id = self._current_game_data.get('visitor_team', {}).get('id')
-                            else:
-                                team_id = self._current_game_data.get('home_team', {}).get('id')
-                        
-                        # Use reference data to get player ID and full name
-                        player_id = None
-                        resolved_name = player_name
-                        if team_id:
-                            # Try to resolve player name using reference data
-                            resolved_name = self._resolve_player_name(team_id, sweater_number, player_name)
-                            
-                            # Get player ID from reference data
-                            boxscore_data = self.reference_data.get_boxscore_by_id(self._current_game_id) if hasattr(self, '_current_game_id') else None
-                            if boxscore_data:
-                                team_key = 'awayTeam' if team_type == 'visitor' else 'homeTeam'
-                                player_stats = boxscore_data.get('playerByGameStats', {}).get(team_key, {})
-                                for player_type in ['forwards', 'defense', 'goalies']:
-                                    for player in player_stats.get(player_type, []):
-                                        if player.get('sweaterNumber') == sweater_number:
-                                            player_id = player.get('playerId')
-                                            break
-                                    if player_id:
-                                        break
+                    # Use reference data to get player ID and full name
+                    player_id = None
+                    resolved_name = player_name
+                    if team_id:
+                        # Try to resolve player name using reference data
+                        resolved_name = self._resolve_player_name(team_id, sweater_number, player_name)
                         
-                        current_player = {
-                            'player_id': player_id,
-                            'sweater_number': sweater_number,
-                            'position': position,
-                            'name': resolved_name,
-                            'original_name': player_name,
-                            'team_id': team_id,
-                            'team_type': team_type,
-                            'faceoff_details': []
-                        }
-                        players.append(current_player)
+                        # Get player ID from reference data
+                        if self._current_game_id:
+                            team_key = 'awayTeam' if team_type == 'visitor' else 'homeTeam'
+                            player_id = self._get_player_id(self._current_game_id, team_key, sweater_number)
                     
-                    # If we have a current player and this row contains faceoff data
-                    elif current_player and len(cells) >= 5:
-                        # Dynamically detect any strength label like "NvM" (e.g., 6v5, 5v3) or known tokens like TOT
-                        strength = cells[0].get_text(strip=True)
-                        is_strength = bool(re.match(r"^\d+v\d+$", strength, flags=re.IGNORECASE)) or strength.upper() == 'TOT'
-                        if is_strength:
-                            # Extract faceoff data from cells 1-4 (Off, Def, Neu, TOT)
-                            faceoff_data = []
-                            for cell in cells[1:5]:  # Skip first cell (strength info)
-                                cell_text = cell.get_text(strip=True)
-                                if cell_text and '/' in cell_text and '%' in cell_text:
-                                    faceoff_match = re.search(r'(\d+)-(\d+)/(\d+)%', cell_text)
-                                    if faceoff_match:
-                                        won = int(faceoff_match.group(1))
-                                        total = int(faceoff_match.group(2))
-                                        percentage = int(faceoff_match.group(3))
-                                        lost = total - won
-                                        
-                                        faceoff_data.append({
-                                            'won': won,
-                                            'lost': lost,
-                                            'total': total,
-                                            'percentage': percentage,
-                                            'raw_text': cell_text
-                                        })
-                                    else:
-                                        faceoff_data.append(None)
+                    current_player = {
+                        'player_id': player_id,
+                        'sweater_number': sweater_number,
+                        'position': position,
+                        'name': resolved_name,
+                        'original_name': player_name,
+                        'team_id': team_id,
+                        'team_type': team_type,
+                        'faceoff_details': []
+                    }
+                    players[team_type].append(current_player)
+                
+                # If we have a current player and this row contains faceoff data
+                elif current_player and cell_count >= 5:
+                    # Dynamically detect any strength label like "NvM" (e.g., 6v5, 5v3) or known tokens like TOT
+                    strength = cell_text
+                    is_strength = self._split_strength(strength) is not None or strength.upper() == 'TOT'
+                    if is_strength:
+                        # Extract faceoff data from cells 1-4 (Off, Def, Neu, TOT)
+                        faceoff_data = []
+                        for cell_text in texts[1:5]:  # Skip first cell (strength info)
+                            if cell_text and '/' in cell_text and '%' in cell_text:
+                                faceoff_match = _FACEOFF_STRING_RE.search(cell_text)
+                                if faceoff_match:
+                                    won = int(faceoff_match.group(1))
+                                    total = int(faceoff_match.group(2))
+                                    percentage = int(faceoff_match.group(3))
+                                    lost = total - won
+                                    
+                                    faceoff_data.append({
+                                        'won': won,
+                                        'lost': lost,
+                                        'total': total,
+                                        'percentage': percentage,
+                                        'raw_text': cell_text
+                                    })
                                 else:
                                     faceoff_data.append(None)
+                            else:
+                                faceoff_data.append(None)
+                        
+                        # Add faceoff detail if we have any data
+                        if any(faceoff_data):
+                            current_player['faceoff_details'].append({
+                                'strength': strength,
+                                'offensive_zone': faceoff_data[0],
+                                'defensive_zone': faceoff_data[1],
+                                'neutral_zone': faceoff_data[2],
+                                'total': faceoff_data[3] if len(faceoff_data) > 3 else None
+                            })
                             
-                            # Add faceoff detail if we have any data
-                            if any(faceoff_data):
-                                current_player['faceoff_details'].append({
-                                    'strength': strength,
-                                    'offensive_zone': faceoff_data[0],
-                                    'defensive_zone': faceoff_data[1],
-                                    'neutral_zone': faceoff_data[2],
-                                    'total': faceoff_data[3] if len(faceoff_data) > 3 else None
-                                })
-                                
         except Exception as e:
-            self.logger.error(f"Error parsing {team_type} team faceoff stats: {e}")
+            self.logger.error(f"Error parsing team faceoff stats: {e}")
         
         return players
     
@@ -3220,7 +4039,7 @@ def _extract_faceoff_data_from_row(self, cells: List) -> Optional[Dict[str, Any]
                 cell_text = cell.get_text(strip=True)
                 if '/' in cell_text and '%' in cell_text:
                     # Parse faceoff data: "4-14/29%"
-                    faceoff_match = re.search(r'(\d+)-(\d+)/(\d+)%', cell_text)
+                    faceoff_match = _FACEOFF_STRING_RE.search(cell_text)
                     if faceoff_match:
                         won = int(faceoff_match.group(1))
                         total = int(faceoff_match.group(2))
@@ -3253,13 +4072,16 @@ def _extract_player_faceoff_stats(self, cells: List, team_type: str) -> Optional
             Dictionary with player faceoff statistics
         """
         try:
+            # Read every cell's text once, then index into it
+            texts = [cell.get_text(strip=True) for cell in cells]
+            
             # Extract basic player info
-            sweater_number = int(cells[0].get_text(strip=True))
-            player_name = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+            sweater_number = int(texts[0])
+            player_name = texts[1] if len(texts) > 1 else ""
             
             # Get team ID from game header data
             team_id = None
-            if hasattr(self, '_current_game_data') and self._current_game_data:
+            if self._current_game_data:
                 if team_type == 'visitor':
                     team_id = self._current_game_data.get('visitor_team', {}).get('id')
                 else:
@@ -3273,24 +4095,15 @@ def _extract_player_faceoff_stats(self, cells: List, team_type: str) -> Optional
                 resolved_name = self._resolve_player_name(team_id, sweater_number, player_name)
                 
                 # Get player ID from reference data
-                boxscore_data = self.reference_data.get_boxscore_by_id(self._current_game_id) if hasattr(self, '_current_game_id') else None
-                if boxscore_data:
+                if self._current_game_id:
                     team_key = 'awayTeam' if team_type == 'visitor' else 'homeTeam'
-                    player_stats = boxscore_data.get('playerByGameStats', {}).get(team_key, {})
-                    for player_type in ['forwards', 'defense', 'goalies']:
-                        for player in player_stats.get(player_type, []):
-                            if player.get('sweaterNumber') == sweater_number:
-                                player_id = player.get('playerId')
-                                break
-                        if player_id:
-                            break
+                    player_id = self._get_player_id(self._current_game_id, team_key, sweater_number)
             
             # Extract faceoff data from cells
             faceoff_data = None
-            for cell in cells:
-                cell_text = cell.get_text(strip=True)
+            for cell_text in texts:
                 if '/' in cell_text and '%' in cell_text:
-                    faceoff_match = re.search(r'(\d+)-(\d+)/(\d+)%', cell_text)
+                    faceoff_match = _FACEOFF_STRING_RE.search(cell_text)
                     if faceoff_match:
                         won = int(faceoff_match.group(1))
                         total = int(faceoff_match.group(2))
@@ -3323,12 +4136,12 @@ def _extract_player_faceoff_stats(self, cells: List, team_type: str) -> Optional
             self.logger.error(f"Error extracting player faceoff stats from row: {e}")
             return None
     
-    def _parse_faceoff_team_totals(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _parse_faceoff_team_totals(self, tables: List) -> Dict[str, Any]:
         """
         Parse team faceoff totals from Faceoff Summary.
         
         Args:
-            soup: BeautifulSoup object of the HTML content
+            tables: All table elements of the report, in document order
             
         Returns:
             Dictionary with team totals
@@ -3340,7 +4153,6 @@ def _parse_faceoff_team_totals(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         try:
             # Find the team summary table
-            tables = soup.find_all('table')
             team_summary_table = None
             
             for table in tables:
@@ -3377,7 +4189,7 @@ def _parse_faceoff_team_totals(self, soup: BeautifulSoup) -> Dict[str, Any]:
                     continue
                 
                 # Parse period data (rows with period numbers or OT variants)
-                if len(cell_texts) >= 5 and (re.match(r'^\d+$', cell_texts[0]) or re.match(r'^OT\d*$', cell_texts[0], flags=re.IGNORECASE)):
+                if len(cell_texts) >= 5 and (cell_texts[0].isdigit() or _OT_PERIOD_RE.match(cell_texts[0])):
                     if current_team:
                         period_token = cell_texts[0]
                         if period_token.isdigit():
@@ -3397,7 +4209,7 @@ def _parse_faceoff_team_totals(self, soup: BeautifulSoup) -> Dict[str, Any]:
                         team_totals[current_team][period_key]['total'] = self._parse_faceoff_stat(cell_texts[4])
                 
                 # Parse strength data (rows with NvM like 5v5, 5v4, 4v5, 3v5, 6v5, etc., or TOT)
-                elif len(cell_texts) >= 5 and (re.match(r"^\d+v\d+$", cell_texts[0], flags=re.IGNORECASE) or cell_texts[0].upper() == 'TOT'):
+                elif len(cell_texts) >= 5 and (self._split_strength(cell_texts[0]) is not None or cell_texts[0].upper() == 'TOT'):
                     if current_team:
                         strength = cell_texts[0]
                         strength_key = f'strength_{strength}'
@@ -3432,7 +4244,7 @@ def _parse_faceoff_stat(self, stat_text: str) -> Dict[str, Any]:
         
         try:
             # Parse format like "16-46/35%"
-            match = re.search(r'(\d+)-(\d+)/(\d+)%', stat_text)
+            match = _FACEOFF_STRING_RE.search(stat_text)
             if match:
                 won = int(match.group(1))
                 total = int(match.group(2))
@@ -3451,6 +4263,22 @@ def _parse_faceoff_stat(self, stat_text: str) -> Dict[str, Any]:
         
         return None
     
+    @staticmethod
+    def _split_strength(text: str) -> Optional[Tuple[int, int]]:
+        """
+        Split a stripped 'NvM' strength label (e.g. '5v4', case-insensitive) into skater counts.
+        
+        Equivalent to matching r'^(\d+)v(\d+)$' with re.IGNORECASE: str.isdecimal accepts
+        exactly the characters \d does.
+        
+        Returns:
+            (skaters_for, skaters_against), or None if the text is not an NvM label
+        """
+        skaters_for, sep, skaters_against = text.lower().partition('v')
+        if sep and skaters_for.isdecimal() and skaters_against.isdecimal():
+            return int(skaters_for), int(skaters_against)
+        return None
+    
     def _normalize_strength_label(self, strength: str, team_type: Optional[str] = None) -> Dict[str, Any]:
         """Normalize a strength label like '5v4', '4v5', '6v5', '4v4', or 'TOT'.
 
@@ -3469,12 +4297,11 @@ def _normalize_strength_label(self, strength: str, team_type: Optional[str] = No
                     'situation': 'total',
                 }
 
-            match = re.match(r'^(\d+)v(\d+)$', raw, flags=re.IGNORECASE)
-            if not match:
+            skaters = self._split_strength(raw)
+            if skaters is None:
                 return {'raw': raw, 'situation': 'unknown'}
 
-            skaters_for = int(match.group(1))
-            skaters_against = int(match.group(2))
+            skaters_for, skaters_against = skaters
             man_advantage = skaters_for - skaters_against
 
             pulled_for = skaters_for > 5
@@ -3537,7 +4364,7 @@ def parse_faceoff_comparison_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return data
     
-    def parse_time_on_ice_data(self, soup: BeautifulSoup, report_type: str, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def parse_time_on_ice_data(self, soup: BeautifulSoup, report_type: str, file_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """Parse Time on Ice (TH/TV) data: per-player totals and special-teams TOI.
 
         Extracts for each player:
@@ -3868,8 +4695,7 @@ def consolidate_game_data(self, source_data: Dict[str, Any]) -> Dict[str, Any]:
             for report_type, data in source_data.items():
                 if 'penalties' in data:
                     if isinstance(data['penalties'], dict):
-                        for period, period_penalties in data['penalties'].items():
-                            penalties.extend(period_penalties)
+                        penalties.extend(chain.from_iterable(data['penalties'].values()))
                     elif isinstance(data['penalties'], list):
                         penalties.extend(data['penalties'])
             
@@ -3932,7 +4758,7 @@ def extract_player_roster_data(self, cells) -> Optional[Dict[str, Any]]:
             position_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
             
             # Parse name
-            name_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+)', name_cell)
+            name_match = _NAME_RE.search(name_cell)
             if not name_match:
                 return None
             
@@ -3961,12 +4787,10 @@ def extract_shot_data(self, cells) -> Optional[Dict[str, Any]]:
             type_cell = cells[3].get_text(strip=True) if len(cells) > 3 else ""
             
             # Parse time
-            time_match = re.search(r'(\d{1,2}:\d{2})', time_cell)
-            if not time_match:
+            time = self._parse_time_cell(time_cell)
+            if time is None:
                 return None
             
-            time = time_match.group(1)
-            
             return {
                 'time': time,
                 'team': team_cell.strip(),
@@ -3990,12 +4814,10 @@ def extract_faceoff_data(self, cells) -> Optional[Dict[str, Any]]:
             player_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
             
             # Parse time
-            time_match = re.search(r'(\d{1,2}:\d{2})', time_cell)
-            if not time_match:
+            time = self._parse_time_cell(time_cell)
+            if time is None:
                 return None
             
-            time = time_match.group(1)
-            
             return {
                 'time': time,
                 'team': team_cell.strip(),
@@ -4039,7 +4861,7 @@ def extract_time_on_ice_data(self, cells) -> Optional[Dict[str, Any]]:
             time_cell = cells[3].get_text(strip=True) if len(cells) > 3 else ""
             
             # Parse name
-            name_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+)', name_cell)
+            name_match = _NAME_RE.search(name_cell)
             if not name_match:
                 return None
             
@@ -4089,12 +4911,10 @@ def extract_event_data(self, cells) -> Optional[Dict[str, Any]]:
             desc_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
             
             # Parse time
-            time_match = re.search(r'(\d{1,2}:\d{2})', time_cell)
-            if not time_match:
+            time = self._parse_time_cell(time_cell)
+            if time is None:
                 return None
             
-            time = time_match.group(1)
-            
             # Determine event type
             event_type = 'unknown'
             desc_lower = desc_cell.lower()
@@ -4142,7 +4962,7 @@ def determine_period_number(self, period_text: str) -> Optional[int]:
             return None
     
     # DUPLICATE METHOD - REMOVED TO USE THE ONE WITH REFERENCE DATA INTEGRATION
-    def _parse_game_header_duplicate(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def _parse_game_header_duplicate(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """Parse game header section with teams, score, date, and venue."""
         header = {
             'title': '',
@@ -4186,9 +5006,11 @@ def _parse_game_header_duplicate(self, soup: BeautifulSoup, file_path: Optional[
             visitor_table = main_table.find('table', id='Visitor')
             if visitor_table:
                 # Away team score
-                score_elem = visitor_table.find('td', style=re.compile(r'font-size: 40px'))
+                score_elem = visitor_table.find('td', style=_SCORE_STYLE_RE)
                 if score_elem:
-                    header['teams']['away']['score'] = int(score_elem.get_text(strip=True))
+                    score = self._parse_score(score_elem.get_text(strip=True))
+                    if score is not None:
+                        header['teams']['away']['score'] = score
                 
                 # Away team name
                 team_elem = visitor_table.find('td', style=re.compile(r'font-size: 10px.*font-weight:bold'))
@@ -4203,9 +5025,11 @@ def _parse_game_header_duplicate(self, soup: BeautifulSoup, file_path: Optional[
             home_table = main_table.find('table', id='Home')
             if home_table:
                 # Home team score
-                score_elem = home_table.find('td', style=re.compile(r'font-size: 40px'))
+                score_elem = home_table.find('td', style=_SCORE_STYLE_RE)
                 if score_elem:
-                    header['teams']['home']['score'] = int(score_elem.get_text(strip=True))
+                    score = self._parse_score(score_elem.get_text(strip=True))
+                    if score is not None:
+                        header['teams']['home']['score'] = score
                 
                 # Home team name
                 team_elem = home_table.find('td', style=re.compile(r'font-size: 10px.*font-weight:bold'))
@@ -4289,13 +5113,16 @@ def _extract_goal_from_row(self, cells) -> Dict[str, Any]:
             if cells[1].get_text(strip=True).isdigit():
                 period = int(cells[1].get_text(strip=True))
             
+            # Scorer and assists all belong to the scoring team
+            team_key = self._team_key_for_abbrev(cells[4].get_text(strip=True))
+            
             # Extract scorer info (format: "72 T.THOMPSON(34)")
             scorer_text = cells[5].get_text(strip=True)
-            scorer_info = self._parse_player_info(scorer_text)
+            scorer_info = self._parse_player_info(scorer_text, team_key)
             
             # Extract assist info
-            assist1_info = self._parse_player_info(assist1_text) if assist1_text else None
-            assist2_info = self._parse_player_info(assist2_text) if assist2_text else None
+            assist1_info = self._parse_player_info(assist1_text, team_key) if assist1_text else None
+            assist2_info = self._parse_player_info(assist2_text, team_key) if assist2_text else None
             
             # Parse players on ice (format: "1,4,9,19,25,72")
             away_players = self._parse_players_on_ice(cells[8].get_text(strip=True) if len(cells) > 8 else '')
@@ -4403,8 +5230,8 @@ def _is_legitimate_goal(self, assist1_text: str, assist2_text: str) -> bool:
         # Default to legitimate (conservative approach)
         return True
 
-    def _parse_player_info(self, player_text: str) -> Dict[str, Any]:
-        """Parse player information from text like '72 T.THOMPSON(34)'."""
+    def _parse_player_info(self, player_text: str, team_key: Optional[str] = None) -> Dict[str, Any]:
+        """Parse player information from text like '72 T.THOMPSON(34)', optionally scoped to a team."""
         try:
             if not player_text:
                 return None
@@ -4424,8 +5251,8 @@ def _parse_player_info(self, player_text: str) -> Dict[str, Any]:
                 
                 # Look up playerId using sweater number from authoritative boxscore data
                 player_id = None
-                if sweater_number and hasattr(self, 'reference_data') and self.reference_data:
-                    player_id = self._lookup_player_id_by_sweater(sweater_number, name)
+                if sweater_number and self.reference_data:
+                    player_id = self._lookup_player_id_by_sweater(sweater_number, name, team_key)
                 
                 return {
                     'name': name,
@@ -4575,7 +5402,10 @@ def _parse_penalties_section(self, soup: BeautifulSoup) -> Dict[str, Any]:
             penalty_tables = soup.find_all('table', id='PenaltySummary')
             
             # Track processed penalties to avoid duplicates
-            processed_penalties = set()
+            processed_penalties = {}
+            
+            # The visitor's penalty table comes first, then the home team's
+            team_keys = iter(['awayTeam', 'homeTeam'])
             
             for table in penalty_tables:
                 # Find all nested tables within the penalty summary
@@ -4593,26 +5423,19 @@ def _parse_penalties_section(self, soup: BeautifulSoup) -> Dict[str, Any]:
                         header_text = ' '.join([cell.get_text(strip=True) for cell in header_cells])
                         if '#' in header_text and 'Per' in header_text and 'Time' in header_text and 'Player' in header_text and 'PIM' in header_text and 'Penalty' in header_text:
                             # This is a penalty table
+                            team_key = next(team_keys, None)
                             for row in rows[1:]:  # Skip header
                                 cells = row.find_all('td')
                                 if len(cells) >= 6:
-                                    penalty_data = self._extract_penalty_from_row(cells)
+                                    penalty_data = self._extract_penalty_from_row(cells, team_key)
                                     if penalty_data:
-                                        # Create a unique key for this penalty to avoid duplicates
-                                        penalty_key = (
-                                            penalty_data.get('penalty_number'),
-                                            penalty_data.get('period'),
-                                            penalty_data.get('time'),
-                                            penalty_data.get('player', {}).get('name'),
-                                            penalty_data.get('penalty_type')
-                                        )
-                                        
-                                        if penalty_key not in processed_penalties:
-                                            processed_penalties.add(penalty_key)
+                                        # Keep only the first row seen for each penalty
+                                        penalty_key = self._penalty_identity_key(penalty_data)
+                                        if processed_penalties.setdefault(penalty_key, penalty_data) is penalty_data:
                                             penalties['all_penalties'].append(penalty_data)
                                             
                                             # Group by period
-                                            period = penalty_data.get('period', 'unknown')
+                                            period = penalty_data['period']
                                             if period not in penalties['by_period']:
                                                 penalties['by_period'][period] = []
                                             penalties['by_period'][period].append(penalty_data)
@@ -4622,8 +5445,8 @@ def _parse_penalties_section(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return penalties
     
-    def _extract_penalty_from_row(self, cells) -> Dict[str, Any]:
-        """Extract penalty data from a table row."""
+    def _extract_penalty_from_row(self, cells, team_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Extract penalty data from a table row of the given team's ('awayTeam'/'homeTeam') penalty table."""
         try:
             if len(cells) < 6:
                 return None
@@ -4674,13 +5497,24 @@ def _extract_penalty_from_row(self, cells) -> Dict[str, Any]:
             
             # Look up playerId using sweater number and team context
             player_id = None
-            if sweater_number and hasattr(self, 'reference_data') and self.reference_data:
-                player_id = self._lookup_player_id_by_sweater(sweater_number, player_name)
+            if sweater_number and self.reference_data:
+                player_id = self._lookup_player_id_by_sweater(sweater_number, player_name, team_key)
+            
+            # Empty time/type cells are stored as None; the small set of penalty type
+            # names is interned so repeated values share one string object
+            time = cells[2].get_text(strip=True) or None
+            penalty_type = (cells[9].get_text(strip=True) if len(cells) > 9 else None) or None
+            if penalty_type:
+                penalty_type = sys.intern(penalty_type)
+            
+            # Only return if we have meaningful data
+            if not (penalty_number and period and time and player_name):
+                return None
             
-            penalty_data = {
+            return {
                 'penalty_number': penalty_number,
                 'period': period,
-                'time': cells[2].get_text(strip=True),
+                'time': time,
                 'player': {
                     'name': player_name,
                     'first_initial': name_parts['first_initial'],
@@ -4689,20 +5523,9 @@ def _extract_penalty_from_row(self, cells) -> Dict[str, Any]:
                     'player_id': player_id
                 },
                 'pim': pim,
-                'penalty_type': cells[9].get_text(strip=True) if len(cells) > 9 else None
+                'penalty_type': penalty_type
             }
             
-            # Clean up empty values
-            for key in ['time', 'penalty_type']:
-                if not penalty_data[key]:
-                    penalty_data[key] = None
-            
-            # Only return if we have meaningful data
-            if penalty_data['penalty_number'] and penalty_data['period'] and penalty_data['time'] and penalty_data['player']['name']:
-                return penalty_data
-            
-            return None
-            
         except Exception as e:
             self.logger.debug(f"Error extracting penalty from row: {e}")
             return None
@@ -4734,15 +5557,47 @@ def _parse_team_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return team_stats
     
+    def _parse_team_stats_lxml(self, tree) -> Optional[Dict[str, Any]]:
+        """
+        XPath version of _parse_team_stats: one query selects the power play rows.
+        
+        Args:
+            tree: lxml.html tree of the Game Summary report
+            
+        Returns:
+            Team statistics dictionary, or None if the XPath pass fails
+        """
+        team_stats = {
+            'home': {},
+            'away': {}
+        }
+        
+        try:
+            rows = _XPATH['power_play_rows'](tree)
+            for row in rows:
+                cell_texts = [self._lxml_text(td) for td in _XPATH['cells'](row)]
+                if len(cell_texts) >= 2:
+                    pp_data = self._extract_power_play_from_texts(cell_texts)
+                    if pp_data:
+                        team_stats.update(pp_data)
+        
+        except Exception as e:
+            self.logger.debug(f"XPath team stats failed, falling back to BeautifulSoup: {e}")
+            return None
+        
+        return team_stats
+    
     def _extract_power_play_data(self, cells) -> Dict[str, Any]:
         """Extract power play data from cells."""
+        return self._extract_power_play_from_texts([cell.get_text(strip=True) for cell in cells])
+    
+    def _extract_power_play_from_texts(self, cell_texts: List[str]) -> Dict[str, Any]:
+        """Extract power play data from a row's stripped cell texts."""
         try:
             power_plays = {}
-            for i, cell in enumerate(cells):
-                text = cell.get_text(strip=True)
-                if 'Power Plays' in text and i + 1 < len(cells):
-                    next_cell = cells[i + 1]
-                    pp_text = next_cell.get_text(strip=True)
+            for i, text in enumerate(cell_texts):
+                if 'Power Plays' in text and i + 1 < len(cell_texts):
+                    pp_text = cell_texts[i + 1]
                     # Parse format like "3-6/07:55"
                     if '/' in pp_text:
                         parts = pp_text.split('/')
@@ -4788,10 +5643,58 @@ def _parse_officials(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return officials
     
+    def _iter_border_table_cell_texts(self, tree):
+        """
+        Yield cell texts in the same order (and multiplicity) as the BeautifulSoup
+        walk over table[border=0] -> tr -> td, reading each cell's text only once.
+        """
+        text_cache = {}
+        for table in _XPATH['border0_tables'](tree):
+            for row in _XPATH['rows'](table):
+                for cell in _XPATH['cells'](row):
+                    text = text_cache.get(cell)
+                    if text is None:
+                        text = text_cache[cell] = self._lxml_text(cell)
+                    yield text
+    
+    def _parse_officials_lxml(self, tree) -> Optional[Dict[str, Any]]:
+        """
+        XPath version of _parse_officials.
+        
+        Args:
+            tree: lxml.html tree of the Game Summary report
+            
+        Returns:
+            Officials dictionary, or None if the XPath pass fails
+        """
+        officials = {
+            'referees': [],
+            'linesmen': []
+        }
+        
+        try:
+            for text in self._iter_border_table_cell_texts(tree):
+                if 'Referee' in text or 'Linesperson' in text:
+                    official_data = self._official_from_text(text)
+                    if official_data:
+                        if 'referee' in official_data.get('type', '').lower():
+                            officials['referees'].append(official_data)
+                        elif 'linesperson' in official_data.get('type', '').lower():
+                            officials['linesmen'].append(official_data)
+        
+        except Exception as e:
+            self.logger.debug(f"XPath officials failed, falling back to BeautifulSoup: {e}")
+            return None
+        
+        return officials
+    
     def _extract_official_data(self, cell) -> Dict[str, Any]:
         """Extract official data from a cell."""
+        return self._official_from_text(cell.get_text(strip=True))
+    
+    def _official_from_text(self, text: str) -> Optional[Dict[str, Any]]:
+        """Extract official data from a cell's stripped text."""
         try:
-            text = cell.get_text(strip=True)
             # Look for patterns like "#34 Brandon Schrader"
             official_match = re.search(r'#(\d+)\s+([^#]+)', text)
             if official_match:
@@ -4830,10 +5733,40 @@ def _parse_three_stars(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         return three_stars
     
+    def _parse_three_stars_lxml(self, tree) -> Optional[Dict[str, Any]]:
+        """
+        XPath version of _parse_three_stars.
+        
+        Args:
+            tree: lxml.html tree of the Game Summary report
+            
+        Returns:
+            Three stars dictionary, or None if the XPath pass fails
+        """
+        three_stars = {
+            'stars': []
+        }
+        
+        try:
+            for text in self._iter_border_table_cell_texts(tree):
+                if 'STARS' in text.upper():
+                    star_data = self._stars_from_text(text)
+                    if star_data:
+                        three_stars['stars'].extend(star_data)
+        
+        except Exception as e:
+            self.logger.debug(f"XPath three stars failed, falling back to BeautifulSoup: {e}")
+            return None
+        
+        return three_stars
+    
     def _extract_star_data(self, cell) -> List[Dict[str, Any]]:
         """Extract three stars data from a cell."""
+        return self._stars_from_text(cell.get_text(strip=True))
+    
+    def _stars_from_text(self, text: str) -> List[Dict[str, Any]]:
+        """Extract three stars data from a cell's stripped text."""
         try:
-            text = cell.get_text(strip=True)
             stars = []
             
             # Look for patterns like "1.DETR88 P.KANE"
@@ -4854,7 +5787,7 @@ def _extract_star_data(self, cell) -> List[Dict[str, Any]]:
             self.logger.debug(f"Error extracting star data: {e}")
             return []
     
-    def _parse_roster_data(self, soup: BeautifulSoup, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def _parse_roster_data(self, soup: BeautifulSoup, file_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """Parse roster data from RO HTML report with proper structure."""
         roster_data = {
             'report_type': 'RO',
@@ -5096,7 +6029,7 @@ def _extract_pl_all_events_from_soup(self, soup: BeautifulSoup, game_id: str = N
                 player_mappings = self._load_player_mappings(game_id)
             
             # Find all event rows (tr elements with id starting with "PL-")
-            event_rows = soup.find_all('tr', id=re.compile(r'^PL-\d+'))
+            event_rows = soup.find_all('tr', id=_PL_ROW_ID_RE)
             
             for row in event_rows:
                 cells = row.find_all('td')
@@ -5705,3 +6638,13 @@ def _extract_game_id_from_pl_file(self, html_file: Path) -> str:
         except Exception as e:
             self.logger.error(f"Error extracting game ID from file {html_file}: {e}")
             return None
+
+
+def _parse_game_data_task(parser: HTMLReportParser, game_id: str, season: str, html_dir: Path) -> Dict[str, Any]:
+    """iter_games task: parse all reports for one game."""
+    return parser.parse_game_data(season, game_id, html_dir)
+
+
+def _run_game_task(task, game_id: str, args: Tuple) -> Any:
+    """Process-pool task: run an iter_games task with the worker's parser (see worker_init)."""
+    return task(HTMLReportParser._worker, game_id, *args)
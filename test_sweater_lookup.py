@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test that GS goal and penalty players are resolved against their own team's
+boxscore roster when both teams dress a player with the same sweater number.
+"""
+
+import sys
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Add the repository root to the path
+sys.path.append(str(Path(__file__).parent))
+
+from src.parse.html_report_parser import HTMLReportParser
+
+AWAY_PLAYER_ID = 8470001
+HOME_PLAYER_ID = 8470002
+
+BOXSCORE = {
+    'awayTeam': {'id': 7, 'abbrev': 'BUF'},
+    'homeTeam': {'id': 1, 'abbrev': 'NJD'},
+    'playerByGameStats': {
+        'awayTeam': {'forwards': [{'playerId': AWAY_PLAYER_ID, 'sweaterNumber': 13}]},
+        'homeTeam': {'forwards': [{'playerId': HOME_PLAYER_ID, 'sweaterNumber': 13}]},
+    },
+}
+
+PENALTY_ROW = ('<tr><td>{number}</td><td>1</td><td>5:00</td>'
+               '<td><table><tr><td>13</td><td>C</td><td>&nbsp;</td><td>{name}</td></tr></table></td>'
+               '<td>2</td><td>Tripping</td></tr>')
+PENALTY_HEADER = '<tr><td>#</td><td>Per</td><td>Time</td><td>Player</td><td>PIM</td><td>Penalty</td></tr>'
+PENALTY_SUMMARY = (
+    '<table id="PenaltySummary" border="0"><tr>'
+    '<td><table border="0">' + PENALTY_HEADER + PENALTY_ROW.format(number=1, name='A.VISITOR') + '</table></td>'
+    '<td><table border="0">' + PENALTY_HEADER + PENALTY_ROW.format(number=2, name='B.HOME') + '</table></td>'
+    '</tr></table>'
+)
+
+
+class StubReferenceData:
+    """Reference data holding a single boxscore."""
+
+    def get_boxscore_by_id(self, game_id):
+        return BOXSCORE if game_id == 2024020006 else None
+
+
+def make_parser():
+    parser = HTMLReportParser(reference_data=StubReferenceData())
+    parser._current_game_id = 2024020006
+    parser._current_game_data = {
+        'visitor_team': {'id': 7, 'abbrev': 'BUF'},
+        'home_team': {'id': 1, 'abbrev': 'NJD'},
+    }
+    return parser
+
+
+def test_penalties_resolve_shared_sweater_per_team():
+    """Each penalty table's #13 maps to that team's player."""
+    parser = make_parser()
+    soup = BeautifulSoup(PENALTY_SUMMARY, 'html.parser')
+
+    penalties = parser._parse_penalties_section(soup)['all_penalties']
+    player_ids = {p['player']['name']: p['player']['player_id'] for p in penalties}
+
+    assert player_ids == {'A.VISITOR': AWAY_PLAYER_ID, 'B.HOME': HOME_PLAYER_ID}
+
+
+def test_goal_players_resolve_shared_sweater_per_team():
+    """Goal scorers are looked up on the scoring team's roster."""
+    parser = make_parser()
+
+    away_scorer = parser._parse_player_info('13 A.VISITOR(1)', parser._team_key_for_abbrev('BUF'))
+    home_scorer = parser._parse_player_info('13 B.HOME(1)', parser._team_key_for_abbrev('NJD'))
+
+    assert away_scorer['player_id'] == AWAY_PLAYER_ID
+    assert home_scorer['player_id'] == HOME_PLAYER_ID
+
+
+def test_lookup_without_team_returns_none():
+    """A sweater number alone is ambiguous, so no player ID is guessed."""
+    parser = make_parser()
+
+    assert parser._lookup_player_id_by_sweater(13, 'A.VISITOR') is None
+
+
+if __name__ == "__main__":
+    test_penalties_resolve_shared_sweater_per_team()
+    test_goal_players_resolve_shared_sweater_per_team()
+    test_lookup_without_team_returns_none()
+    print("All sweater lookup tests passed")